@@ -0,0 +1,9 @@
+# WHAT: Package marker for Cortex performance benchmarks; adds src/ to
+#       sys.path.
+# WHY: Enables `python -m scripts.benchmarks.<name>` from project root
+#       without requiring `pip install -e .`. The package runs before any
+#       benchmark module, so those import cortex like any other module.
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "src"))
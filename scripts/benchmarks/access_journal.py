@@ -0,0 +1,80 @@
+"""Benchmark: mark_accessed as a full store rewrite vs a journal append.
+
+# WHAT: Fills a file-backed store with synthetic events, then times marking
+#       a briefing's worth of events accessed the old way (load every
+#       record, update the matching ones, rewrite the store) and through
+#       the access journal, each by a fresh store instance like a hook.
+#       Also times the fold that eventually pays for the journal, and
+#       checks both paths leave the same access counts (exit 1 if not).
+# WHY: A full rewrite per briefing made reinforcement too expensive to
+#       leave on; the journal makes it O(ids) per call.
+
+Usage:
+    python -m scripts.benchmarks.access_journal [--events 20000] [--backend jsonl] [--repeat 5]
+"""
+
+import argparse
+import sys
+import tempfile
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+
+from cortex.config import CortexConfig
+from cortex.store import EventStore
+from scripts.benchmarks.common import best_of, synthetic_events
+
+_PROJECT_HASH = "benchbenchbench0"
+_SHOWN = 40
+
+
+def _old_mark_accessed(store: EventStore, event_ids: list[str]) -> None:
+    """What EventStore.mark_accessed() did before the access journal."""
+    now = datetime.now(timezone.utc).isoformat()
+    id_set = set(event_ids)
+    raw = store._load_raw()
+    for record in raw:
+        if record.get("id") in id_set:
+            record["accessed_at"] = now
+            record["access_count"] = record.get("access_count", 0) + 1
+    store._save_raw(raw)
+
+
+def _mark_fresh(mark, config: CortexConfig, ids: list[str]) -> None:
+    """Run mark(store, ids) on a fresh store instance, like a hook."""
+    mark(EventStore(_PROJECT_HASH, config), ids)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=20000, help="events in the store")
+    parser.add_argument("--backend", choices=["json", "jsonl"], default="jsonl", help="file backend")
+    parser.add_argument("--repeat", type=int, default=5, help="calls per measurement (best is reported)")
+    args = parser.parse_args()
+
+    events = synthetic_events(args.events)
+    ids = [event.id for event in events[-_SHOWN:]]
+    results = {}
+    counts = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for label in ("full rewrite", "journal append"):
+            config = CortexConfig(cortex_home=Path(tmp) / label.replace(" ", "-"), store_backend=args.backend)
+            EventStore(_PROJECT_HASH, config).append_many(events)
+            mark = _old_mark_accessed if label == "full rewrite" else EventStore.mark_accessed
+            results[label] = best_of(partial(_mark_fresh, mark, config, ids), args.repeat)
+            if label == "journal append":
+                store = EventStore(_PROJECT_HASH, config)
+                results["fold (compact)"] = best_of(store.compact, 1)
+            counts.append([event.access_count for event in EventStore(_PROJECT_HASH, config).load_all()])
+
+    print(f"mark {_SHOWN} of {args.events} events accessed, {args.backend} backend, best of {args.repeat}")
+    for label, seconds in results.items():
+        print(f"  {label:16} {seconds * 1000:8.2f} ms")
+    if counts[0] != counts[1]:
+        print("FAIL: access counts differ")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
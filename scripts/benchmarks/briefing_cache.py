@@ -0,0 +1,69 @@
+"""Benchmark: write_briefing_to_file with and without the briefing cache.
+
+# WHAT: Fills a store with synthetic events, then times writing the
+#       briefing when it must be rendered (cache removed) and when the
+#       cache is current, for each store backend.
+# WHY: SessionStart and PreCompact write the briefing on every call, and
+#       most of those calls follow no store change at all. Rendering loads
+#       and ranks the whole store. A cache hit reads the store generation
+#       (one stat for json, a directory listing plus a stat per segment
+#       for jsonl, two stats for sqlite), parses the whole cache file and
+#       compares the briefing file.
+
+Usage:
+    python -m scripts.benchmarks.briefing_cache [--events 5000] [--repeat 20]
+"""
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+from cortex.briefing import BriefingCache, write_briefing_to_file
+from cortex.config import CortexConfig
+from cortex.store import open_store
+from scripts.benchmarks.common import best_of, synthetic_events
+
+_PROJECT_HASH = "benchbenchbench0"
+
+
+def _measure(backend: str, events: list, tmp: str, repeat: int) -> tuple[float, float]:
+    """Best (render, cache hit) times in seconds for one backend."""
+    config = CortexConfig(cortex_home=Path(tmp) / ".cortex", store_backend=backend)
+    store = open_store(_PROJECT_HASH, config)
+    store.append_many(events)
+    output = Path(tmp) / "cortex-briefing.md"
+    cache = BriefingCache(_PROJECT_HASH, config)
+
+    def write() -> None:
+        write_briefing_to_file(output, project_hash=_PROJECT_HASH, config=config, store=store)
+
+    def render() -> None:
+        cache.path.unlink(missing_ok=True)
+        write()
+
+    rendered = best_of(render, repeat)
+    write()
+    cached = best_of(write, repeat)
+    if hasattr(store, "close"):
+        store.close()
+    return rendered, cached
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=5000, help="events in the store")
+    parser.add_argument("--repeat", type=int, default=20, help="calls per measurement (best is reported)")
+    args = parser.parse_args()
+
+    events = synthetic_events(args.events)
+    print(f"write_briefing_to_file, {args.events} events, best of {args.repeat} calls")
+    for backend in ("json", "jsonl", "sqlite"):
+        with tempfile.TemporaryDirectory() as tmp:
+            rendered, cached = (seconds * 1000 for seconds in _measure(backend, events, tmp, args.repeat))
+        print(f"  {backend:7} render {rendered:8.2f} ms   cache hit {cached:6.2f} ms   ({rendered / cached:.0f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
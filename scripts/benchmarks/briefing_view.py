@@ -0,0 +1,75 @@
+"""Benchmark: load_for_briefing from the materialized view vs a full recompute.
+
+# WHAT: Fills a file-backed store with synthetic events, then times a full
+#       recompute (load, filter, sort every event), the view read by a
+#       fresh store instance (one sidecar file decode), the view served
+#       from memory, and what keeping the view up to date adds to a
+#       10-event append by a fresh instance. Checks the view against the
+#       recompute at the end (exit 1 on a mismatch).
+# WHY: SessionStart and PreCompact rank the whole store on every cache
+#       miss; the view makes that O(K + immortal + plan events).
+
+Usage:
+    python -m scripts.benchmarks.briefing_view [--events 20000] [--backend jsonl] [--repeat 5]
+"""
+
+import argparse
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+from cortex.briefing_view import select_for_briefing
+from cortex.config import CortexConfig
+from cortex.store import EventStore
+from scripts.benchmarks.common import best_of, synthetic_events
+
+_PROJECT_HASH = "benchbenchbench0"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=20000, help="events in the store")
+    parser.add_argument("--backend", choices=["json", "jsonl"], default="jsonl", help="file backend")
+    parser.add_argument("--repeat", type=int, default=5, help="calls per measurement (best is reported)")
+    args = parser.parse_args()
+
+    events = synthetic_events(args.events + 10 * args.repeat * 2)
+    stored, extra = events[: args.events], iter(events[args.events :])
+    with tempfile.TemporaryDirectory() as tmp:
+        config = CortexConfig(cortex_home=Path(tmp) / ".cortex", store_backend=args.backend)
+        store = EventStore(_PROJECT_HASH, config)
+        store.append_many(stored)
+
+        def recompute() -> None:
+            select_for_briefing(store.load_all(), None, datetime.now(timezone.utc), config.briefing_recent_limit)
+
+        full = best_of(recompute, args.repeat) * 1000
+        store.load_for_briefing()
+        from_disk = best_of(lambda: EventStore(_PROJECT_HASH, config).load_for_briefing(), args.repeat) * 1000
+        from_memory = best_of(store.load_for_briefing, args.repeat) * 1000
+
+        # Like a Stop hook: a fresh instance appends a few events.
+        def append() -> None:
+            EventStore(_PROJECT_HASH, config).append_many([next(extra) for _ in range(10)])
+
+        with_view = best_of(append, args.repeat) * 1000
+        view_path = store._briefing_view.path
+        view_path.unlink()
+        without_view = best_of(append, args.repeat) * 1000
+        store = EventStore(_PROJECT_HASH, config)
+        store.load_for_briefing()
+        problems = store.verify_briefing_view()
+
+    print(f"{args.events} events, {args.backend} backend, best of {args.repeat}")
+    print(f"  full recompute       {full:8.2f} ms")
+    print(f"  view, fresh process  {from_disk:8.2f} ms  ({full / from_disk:.0f}x)")
+    print(f"  view, in memory      {from_memory:8.2f} ms  ({full / from_memory:.0f}x)")
+    print(f"  10-event append      {without_view:8.2f} ms without view, {with_view:.2f} ms with")
+    for problem in problems:
+        print(f"FAIL: {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+"""Shared helpers for Cortex benchmarks.
+
+# WHAT: Large synthetic transcripts and a simple best-of-N timer.
+# WHY: Every benchmark needs realistic input at a size where hook latency
+#       matters (tens to hundreds of MB), built from the same generator the
+#       Phase 2 test runner uses so the record mix matches real sessions.
+"""
+
+import json
+import random
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from cortex.models import Event, EventType, create_event
+from scripts.testing.transcript_generator import create_large_event_transcripts
+
+_project_root = Path(__file__).resolve().parent.parent.parent
+
+
+def write_large_transcript(path: Path, target_mb: float, cwd: str = "/bench/project") -> int:
+    """Write a synthetic transcript of roughly target_mb megabytes.
+
+    Repeats the Phase 2.3.2 large-event sessions until the size is reached.
+
+    Returns:
+        The number of lines written.
+    """
+    block = []
+    for builder in create_large_event_transcripts(cwd, count=10):
+        block.extend(builder.build())
+    payload = ("\n".join(block) + "\n").encode("utf-8")
+
+    target = int(target_mb * 1024 * 1024)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    written = 0
+    lines = 0
+    with open(path, "wb") as f:
+        while written < target:
+            f.write(payload)
+            written += len(payload)
+            lines += len(block)
+    return lines
+
+
+def write_session_transcript(path: Path, entries: int, payload_bytes: int = 4096) -> None:
+    """Write a transcript shaped like a long tool-using Claude Code session.
+
+    Cycles through ten records: a user prompt, assistant thinking and
+    text chunks, Read and Bash tool calls with their results, and a
+    file-history-snapshot. Tool results carry payload_bytes of file
+    content in the tool_result block and again in toolUseResult, as
+    Claude Code writes them. One cycle in five states a Decision.
+    The Phase 2 generator does not emit tool results, so records are
+    built here directly.
+    """
+    # WHAT: Use Cortex's own source and README as content.
+    # WHY: Realistic character mix; a repeated filler character makes
+    # substring search and decoding unrepresentatively slow or fast.
+    source = "".join(src.read_text(encoding="utf-8") for src in sorted((_project_root / "src" / "cortex").glob("*.py")))
+    prose = " ".join((_project_root / "README.md").read_text(encoding="utf-8").split())
+    span = max(1, min(len(source), len(prose)) - payload_bytes)
+
+    def envelope(i: int, record_type: str, content: list) -> dict:
+        return {
+            "parentUuid": f"msg-{i - 1}",
+            "isSidechain": False,
+            "userType": "external",
+            "cwd": "/bench/project",
+            "sessionId": "bench-session",
+            "version": "2.0.76",
+            "gitBranch": "main",
+            "type": record_type,
+            "message": {"role": record_type, "content": content},
+            "uuid": f"msg-{i}",
+            "timestamp": "2026-02-01T10:00:00.000Z",
+        }
+
+    def tool_result(i: int, body: str) -> dict:
+        record = envelope(i, "user", [{"tool_use_id": f"toolu_{i - 1}", "type": "tool_result", "content": body}])
+        record["toolUseResult"] = {"type": "text", "file": {"filePath": f"/bench/src/f{i}.py", "content": body}}
+        return record
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(entries):
+            step = i % 10
+            start = (i * 977) % span
+            if step == 0:
+                record = envelope(i, "user", f"Please continue with step {i // 10} of the refactor.")
+            elif step == 1:
+                record = envelope(i, "assistant", [{"type": "thinking", "thinking": prose[start : start + 800]}])
+            elif step in (2, 5):
+                record = envelope(i, "assistant", [{"type": "text", "text": prose[start : start + 400]}])
+            elif step == 3:
+                read_input = {"file_path": f"/bench/f{i}.py"}
+                call = {"type": "tool_use", "id": f"toolu_{i}", "name": "Read", "input": read_input}
+                record = envelope(i, "assistant", [call])
+            elif step == 4:
+                record = tool_result(i, source[start : start + payload_bytes])
+            elif step == 6:
+                call = {"type": "tool_use", "id": f"toolu_{i}", "name": "Bash", "input": {"command": "pytest -q"}}
+                record = envelope(i, "assistant", [call])
+            elif step == 7:
+                record = tool_result(i, source[start : start + payload_bytes // 2])
+            elif step == 8:
+                text = prose[start : start + 300]
+                if i % 50 == 8:
+                    text += f"\n\nDecision: keep module {i} synchronous"
+                record = envelope(i, "assistant", [{"type": "text", "text": text}])
+            else:
+                record = {
+                    "type": "file-history-snapshot",
+                    "messageId": f"msg-{i}",
+                    "snapshot": {
+                        "messageId": f"msg-{i}",
+                        "trackedFileBackups": {f"/bench/src/f{j}.py": {"version": j} for j in range(50)},
+                        "timestamp": "2026-02-01T10:00:00.000Z",
+                    },
+                    "isSnapshotUpdate": True,
+                }
+            f.write(json.dumps(record) + "\n")
+
+
+def best_of(fn: Callable[[], object], repeat: int = 3) -> float:
+    """Return the fastest wall-clock time of fn() over repeat runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def synthetic_events(count: int, seed: int = 0) -> list[Event]:
+    """Return count events with a realistic type mix and spread-out access times.
+
+    Mostly non-immortal knowledge/error/preference events, some decisions
+    and a handful of plans, accessed over the last 30 days so decay
+    actually reorders them.
+    """
+    rng = random.Random(seed)
+    types = [EventType.KNOWLEDGE_ACQUIRED] * 6 + [
+        EventType.ERROR_RESOLVED,
+        EventType.PREFERENCE_NOTED,
+        EventType.DECISION_MADE,
+        EventType.FILE_MODIFIED,
+    ]
+    now = datetime.now(timezone.utc)
+    events = []
+    for i in range(count):
+        event_type = EventType.PLAN_CREATED if i % 500 == 0 else rng.choice(types)
+        event = create_event(event_type, f"event {i}: " + "lorem ipsum " * rng.randint(2, 20), session_id="bench")
+        stamp = (now - timedelta(hours=rng.uniform(0, 720))).isoformat()
+        event.created_at = event.accessed_at = stamp
+        event.salience = rng.uniform(0.1, 1.0)
+        events.append(event)
+    return events
@@ -0,0 +1,107 @@
+"""Benchmark: per-entry extraction cost with and without shared entry views.
+
+# WHAT: Times the three extraction layers over the entries of generated
+#       transcripts, once with every layer deriving its own text, stripped
+#       text and tool calls (each layer gets an uncached copy of the entry)
+#       and once with all layers sharing one entry's memoized views. The
+#       full extract_events() pipeline (dispatch plus dedup) is timed too,
+#       as are has_tool_use/has_tool_result/has_thinking checks.
+# WHY: Derivations from content_blocks were repeated per layer and per
+#       property access; the cached views do each at most once per entry.
+
+Usage:
+    python -m scripts.benchmarks.entry_views [--mb 10] [--repeat 5]
+"""
+
+import argparse
+import dataclasses
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from cortex.extractors import extract_events, extract_explicit, extract_semantic, extract_structural
+from cortex.transcript import TranscriptEntry, TranscriptReader
+from scripts.benchmarks.common import write_large_transcript, write_session_transcript
+
+_LAYERS = (extract_structural, extract_semantic, extract_explicit)
+
+
+def fresh(entries: list[TranscriptEntry], copies: int) -> list[list[TranscriptEntry]]:
+    """Uncached copies of entries (views are not copied by replace())."""
+    return [[dataclasses.replace(e) for e in entries] for _ in range(copies)]
+
+
+def per_layer(entries: list[TranscriptEntry]) -> float:
+    layer_copies = fresh(entries, len(_LAYERS))
+    started = time.perf_counter()
+    for layer, copies in zip(_LAYERS, layer_copies, strict=True):
+        for entry in copies:
+            layer(entry)
+    return time.perf_counter() - started
+
+
+def shared(entries: list[TranscriptEntry]) -> float:
+    (copies,) = fresh(entries, 1)
+    started = time.perf_counter()
+    for entry in copies:
+        for layer in _LAYERS:
+            layer(entry)
+    return time.perf_counter() - started
+
+
+def pipeline(entries: list[TranscriptEntry]) -> float:
+    (copies,) = fresh(entries, 1)
+    started = time.perf_counter()
+    extract_events(copies)
+    return time.perf_counter() - started
+
+
+def flag_checks(entries: list[TranscriptEntry], cached: bool) -> float:
+    (copies,) = fresh(entries, 1)
+    if cached:
+        for entry in copies:
+            _ = entry.block_types
+    started = time.perf_counter()
+    for entry in copies:
+        _ = entry.has_tool_use, entry.has_tool_result, entry.has_thinking
+    return time.perf_counter() - started
+
+
+def best(fn: Callable[[], float], repeat: int) -> float:
+    return min(fn() for _ in range(repeat))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mb", type=float, default=10.0, help="approximate transcript size in MB")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        generated = Path(tmp) / "generated.jsonl"
+        write_large_transcript(generated, args.mb)
+        session = Path(tmp) / "session.jsonl"
+        write_session_transcript(session, entries=int(args.mb * 1024 * 1024 / 4300))
+        paths = (("phase-2 generator", generated), ("tool session", session))
+        corpora = [(label, TranscriptReader(path).read_all()) for label, path in paths]
+
+    for label, entries in corpora:
+        n = len(entries)
+        layered = best(lambda e=entries: per_layer(e), args.repeat)
+        pooled = best(lambda e=entries: shared(e), args.repeat)
+        full = best(lambda e=entries: pipeline(e), args.repeat)
+        first = best(lambda e=entries: flag_checks(e, cached=False), args.repeat)
+        again = best(lambda e=entries: flag_checks(e, cached=True), args.repeat)
+        print(f"{label}: {n} entries")
+        print(f"  per-layer derivation  {layered / n * 1e6:6.2f} us/entry")
+        print(f"  shared entry views    {pooled / n * 1e6:6.2f} us/entry  ({layered / pooled:.2f}x)")
+        print(f"  extract_events()      {full / n * 1e6:6.2f} us/entry")
+        print(f"  has_* x3, first use   {first / n * 1e6:6.2f} us/entry")
+        print(f"  has_* x3, cached      {again / n * 1e6:6.2f} us/entry")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
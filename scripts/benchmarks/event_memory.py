@@ -0,0 +1,124 @@
+"""Benchmark: memory and load time of Event objects, and projection loaders.
+
+# WHAT: Builds N events from stored records and reports the memory they
+#       hold (tracemalloc) as the slotted Event and as the same dataclass
+#       with a per-instance __dict__ (as Event was), plus from_dict time
+#       with and without the old eager uuid4()/EventType() calls. Then
+#       compares peak memory of load_all() with iter_ids() and
+#       iter_fields() on a JSONL store.
+# WHY: Every full load built a dict-backed Event per record, even for
+#       callers that only wanted ids or a couple of fields.
+
+Usage:
+    python -m scripts.benchmarks.event_memory [--events 100000] [--repeat 3]
+"""
+
+import argparse
+import dataclasses
+import gc
+import sys
+import tempfile
+import tracemalloc
+import uuid
+from pathlib import Path
+
+from cortex.config import CortexConfig
+from cortex.models import Event, EventType
+from cortex.store import EventStore
+from scripts.benchmarks.common import best_of, synthetic_events
+
+_PROJECT_HASH = "benchbenchbench0"
+_MIB = 1024 * 1024
+
+# Event as it was: the same fields, without slots.
+_DictEvent = dataclasses.make_dataclass(
+    "DictEvent",
+    [
+        (f.name, f.type, dataclasses.field(default=None))
+        for f in dataclasses.fields(Event)
+        if not f.name.startswith("_")
+    ],
+)
+
+
+def _old_from_dict(cls, data: dict):
+    """Event.from_dict() as it was: uuid4() and EventType() on every call."""
+    return cls(
+        id=data.get("id", str(uuid.uuid4())),
+        session_id=data.get("session_id", ""),
+        project=data.get("project", ""),
+        git_branch=data.get("git_branch", ""),
+        type=EventType(data["type"]) if "type" in data else EventType.KNOWLEDGE_ACQUIRED,
+        content=data.get("content", ""),
+        metadata=data.get("metadata", {}),
+        salience=data.get("salience", 0.5),
+        confidence=data.get("confidence", 1.0),
+        created_at=data.get("created_at", ""),
+        accessed_at=data.get("accessed_at", ""),
+        access_count=data.get("access_count", 0),
+        immortal=data.get("immortal", False),
+        provenance=data.get("provenance", ""),
+    )
+
+
+def _held(build) -> int:
+    """Bytes still allocated by build()'s result while it is alive."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return held
+
+
+def _peak(fn) -> int:
+    """Peak bytes allocated while fn() runs."""
+    gc.collect()
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def _report_objects(records: list[dict], repeat: int) -> None:
+    """Print memory held by and build time of Events made from records."""
+    before = _held(lambda: [_old_from_dict(_DictEvent, r) for r in records])
+    after = _held(lambda: [Event.from_dict(r) for r in records])
+    print(f"  Event objects, __dict__   {before / _MIB:8.1f} MiB  ({before / len(records):.0f} B/event)")
+    print(f"  Event objects, slots      {after / _MIB:8.1f} MiB  ({after / len(records):.0f} B/event)")
+
+    old_load = best_of(lambda: [_old_from_dict(Event, r) for r in records], repeat)
+    new_load = best_of(lambda: [Event.from_dict(r) for r in records], repeat)
+    print(f"  from_dict, old            {old_load * 1000:8.1f} ms")
+    print(f"  from_dict, new            {new_load * 1000:8.1f} ms")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=100000, help="events to build")
+    parser.add_argument("--repeat", type=int, default=3, help="calls per timing (best is reported)")
+    args = parser.parse_args()
+
+    records = [e.to_dict() for e in synthetic_events(args.events)]
+    print(f"{args.events} events")
+    _report_objects(records, args.repeat)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config = CortexConfig(cortex_home=Path(tmp) / ".cortex", store_backend="jsonl")
+        store = EventStore(_PROJECT_HASH, config)
+        store.backend.append_raw(records)
+        del records
+        peaks = {
+            "load_all()": _peak(lambda: [e.id for e in store.load_all()]),
+            "iter_ids()": _peak(lambda: list(store.iter_ids())),
+            'iter_fields("id", "type")': _peak(lambda: list(store.iter_fields("id", "type"))),
+        }
+    for label, peak in peaks.items():
+        print(f"  peak, {label:26} {peak / _MIB:8.1f} MiB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""Benchmark: identify_project() git lookups, subprocess vs direct .git reads.
+
+# WHAT: Times the git part of project identification on one repository:
+#       the git command (three subprocesses, as every hook used to run),
+#       direct .git reads with a cold cache, direct reads served from the
+#       in-process stat-keyed cache, and a full identify served from the
+#       persistent project index (what a fresh hook process does).
+# WHY: Every hook identifies its project first. Each git subprocess costs
+#       milliseconds of fork/exec, more on a large monorepo.
+
+Usage:
+    python -m scripts.benchmarks.git_identity [--repo PATH] [--repeat 50]
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from cortex import project
+from cortex.config import CortexConfig
+from scripts.benchmarks.common import best_of
+
+
+def _old_identify_git(path: str) -> None:
+    """What identify_project() ran before: rev-parse, then rev-parse and log."""
+    subprocess.run(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=path, capture_output=True, timeout=5)
+    project._git_info_subprocess(path)
+
+
+def _make_repo(root: Path) -> Path:
+    repo = root / "repo"
+    repo.mkdir()
+    for args in (["init", "-q"], ["config", "user.email", "b@b"], ["config", "user.name", "b"]):
+        subprocess.run(["git", *args], cwd=repo, check=True)
+    (repo / "f.txt").write_text("x\n")
+    subprocess.run(["git", "add", "."], cwd=repo, check=True)
+    subprocess.run(["git", "commit", "-q", "-m", "init"], cwd=repo, check=True)
+    return repo
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repo", type=Path, help="repository to identify (default: a fresh one-commit repo)")
+    parser.add_argument("--repeat", type=int, default=50, help="calls per measurement (best is reported)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(args.repo or _make_repo(Path(tmp)))
+        assert project.get_git_info(path) == project._git_info_subprocess(path)
+
+        def cold() -> None:
+            project._GIT_INFO_CACHE.clear()
+            project.get_git_info(path)
+
+        subprocesses = best_of(lambda: _old_identify_git(path), args.repeat) * 1000
+        direct = best_of(cold, args.repeat) * 1000
+        cached = best_of(lambda: project.get_git_info(path), args.repeat) * 1000
+
+        def cold_identify() -> None:
+            project._GIT_INFO_CACHE.clear()
+            project.identify_project(path)
+
+        identified = best_of(cold_identify, args.repeat) * 1000
+        index = project.ProjectIndex(CortexConfig(cortex_home=Path(tmp) / ".cortex"))
+        index.identify(path)
+        indexed = best_of(lambda: index.identify(path), args.repeat) * 1000
+
+    print(f"git info for {args.repo or 'a fresh repo'}, best of {args.repeat} calls")
+    print(f"  3 git subprocesses   {subprocesses:8.3f} ms")
+    print(f"  direct .git reads    {direct:8.3f} ms  ({subprocesses / direct:.0f}x)")
+    print(f"  cached (stats only)  {cached:8.3f} ms  ({subprocesses / cached:.0f}x)")
+    print(f"  identify_project     {identified:8.3f} ms  (cold: path resolve, hash, .git reads)")
+    print(f"  project index hit    {indexed:8.3f} ms  ({subprocesses / indexed:.0f}x, full identity)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""Benchmark: end-to-end hook latency with and without `cortex daemon`.
+
+# WHAT: Runs `python -m cortex stop` and `python -m cortex session-start`
+#       as real subprocesses, the way Claude Code does, first with no
+#       daemon (in-process handling) and then with one running.
+# WHY: Hook latency is visible at every turn end. The daemon can only
+#       remove interpreter start, imports, config load, git subprocesses
+#       and store setup; this shows how much of the total that is.
+
+Everything runs under a temporary HOME, so ~/.cortex is not touched.
+
+Usage:
+    python -m scripts.benchmarks.hook_latency [--runs 20] [--entries 400]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from scripts.benchmarks.common import _project_root, write_session_transcript
+
+
+def _time_hook(command: str, payload: dict, env: dict, runs: int) -> float:
+    """Median wall time in ms of `python -m cortex <command>`."""
+    data = json.dumps(payload).encode("utf-8")
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-m", "cortex", command], input=data, env=env, check=True)
+        times.append((time.perf_counter() - started) * 1000)
+    return statistics.median(times)
+
+
+def _wait_for_socket(path: Path, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not path.exists():
+        if time.monotonic() > deadline:
+            raise RuntimeError("daemon did not start")
+        time.sleep(0.05)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="hook invocations per measurement (median is reported)")
+    parser.add_argument("--entries", type=int, default=400, help="transcript entries in the session")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="cx-") as tmp:
+        home = Path(tmp)
+        project = home / "project"
+        project.mkdir()
+        subprocess.run(["git", "init", "-q"], cwd=project, check=True)
+        subprocess.run(
+            ["git", "-c", "user.name=b", "-c", "user.email=b@b", "commit", "-q", "--allow-empty", "-m", "init"],
+            cwd=project,
+            check=True,
+        )
+        transcript = home / "session.jsonl"
+        write_session_transcript(transcript, args.entries, payload_bytes=1024)
+        socket_path = home / "d.sock"
+        env = {
+            **os.environ,
+            "HOME": str(home),
+            "PYTHONPATH": str(_project_root / "src"),
+            "CORTEX_DAEMON_SOCKET": str(socket_path),
+        }
+        stop = {"cwd": str(project), "transcript_path": str(transcript), "session_id": "bench"}
+        start = {"cwd": str(project)}
+
+        # Warm the store once so every timed stop is an incremental no-op
+        # read of the already-processed transcript, like most turn ends.
+        _time_hook("stop", stop, env, 1)
+
+        results = {}
+        bare = []
+        for _ in range(args.runs):
+            started = time.perf_counter()
+            subprocess.run([sys.executable, "-c", "pass"], env=env, check=True)
+            bare.append((time.perf_counter() - started) * 1000)
+        results["stop", "in-process"] = _time_hook("stop", stop, env, args.runs)
+        results["session-start", "in-process"] = _time_hook("session-start", start, env, args.runs)
+
+        server = subprocess.Popen([sys.executable, "-m", "cortex", "daemon"], env=env, stderr=subprocess.DEVNULL)
+        try:
+            _wait_for_socket(socket_path)
+            _time_hook("stop", stop, env, 1)
+            results["stop", "daemon"] = _time_hook("stop", stop, env, args.runs)
+            results["session-start", "daemon"] = _time_hook("session-start", start, env, args.runs)
+        finally:
+            server.terminate()
+            server.wait()
+
+    print(f"median of {args.runs} runs, {args.entries}-entry transcript")
+    print(f"  {'python -c pass':14} {statistics.median(bare):7.1f} ms (interpreter start floor)")
+    for command in ("stop", "session-start"):
+        fresh = results[command, "in-process"]
+        warm = results[command, "daemon"]
+        print(f"  {command:14} in-process {fresh:7.1f} ms   daemon {warm:7.1f} ms   ({fresh / warm:.2f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
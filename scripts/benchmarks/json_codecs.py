@@ -0,0 +1,76 @@
+"""Benchmark: throughput per JSON codec backend.
+
+# WHAT: Times transcript parsing and event store load/save under every
+#       installed codec (stdlib json, orjson, msgspec).
+# WHY: Decoding is the largest single cost on big transcripts; the numbers
+#       decide which optional library is worth installing fleet-wide.
+
+Usage:
+    python -m scripts.benchmarks.json_codecs [--mb 30] [--events 20000] [--repeat 5]
+"""
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+from cortex import codec
+from cortex.backends import JsonArrayBackend, JsonlSegmentBackend
+from cortex.models import EventType, create_event
+from cortex.transcript import TranscriptReader
+from scripts.benchmarks.common import best_of, write_large_transcript
+
+
+def _sample_records(n: int) -> list[dict]:
+    types = list(EventType)
+    return [
+        create_event(
+            types[i % len(types)],
+            content=f"Event {i}: chose approach {i % 17} because of constraint {i % 5}",
+            session_id=f"session-{i // 100}",
+            git_branch="main",
+            metadata={"tool": "Bash", "index": i},
+        ).to_dict()
+        for i in range(n)
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mb", type=float, default=30.0, help="transcript size in MB")
+    parser.add_argument("--events", type=int, default=20000, help="events in the store benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        transcript = tmp_dir / "large.jsonl"
+        write_large_transcript(transcript, args.mb)
+        size_mb = transcript.stat().st_size / (1024 * 1024)
+        records = _sample_records(args.events)
+
+        print(f"Transcript: {size_mb:.1f} MB   Store: {args.events} events")
+        print(f"  {'codec':<8} {'transcript':>12} {'json load':>12} {'json save':>12} {'jsonl load':>12}")
+        for name in codec.available_codecs():
+            codec.use_codec(name)
+
+            read = best_of(lambda: sum(1 for _ in TranscriptReader(transcript).iter_new()), args.repeat)
+
+            array = JsonArrayBackend(tmp_dir / f"array-{name}")
+            (tmp_dir / f"array-{name}").mkdir()
+            save = best_of(lambda a=array: a.rewrite_raw(records), args.repeat)
+            load = best_of(array.load_raw, args.repeat)
+
+            segments = JsonlSegmentBackend(tmp_dir / f"seg-{name}")
+            segments.rewrite_raw(records)
+            seg_load = best_of(segments.load_raw, args.repeat)
+
+            print(
+                f"  {name:<8} {size_mb / read:8.1f} MB/s"
+                f" {args.events / load:8.0f} ev/s {args.events / save:8.0f} ev/s {args.events / seg_load:8.0f} ev/s"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+"""Benchmark: serial vs process-pool extraction of already-parsed entries.
+
+# WHAT: Times extract_events() against extract_events_parallel() over the
+#       entries of a large generated transcript.
+# WHY: Backfilling a project's full history is CPU-bound in the three
+#       extraction layers; a pool should scale with cores, while pool
+#       startup and pickling set the floor for small inputs.
+
+Usage:
+    python -m scripts.benchmarks.parallel_extract [--mb 30] [--workers N] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+from cortex.extractors import extract_events, extract_events_parallel
+from cortex.transcript import TranscriptReader
+from scripts.benchmarks.common import best_of, write_large_transcript
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mb", type=float, default=30.0, help="approximate transcript size in MB")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "generated.jsonl"
+        write_large_transcript(path, args.mb)
+        entries = TranscriptReader(path).read_all()
+
+    serial_events = extract_events(entries)
+    parallel_events = extract_events_parallel(entries, max_workers=args.workers, min_entries=1)
+    assert [e.content for e in serial_events] == [e.content for e in parallel_events]
+
+    serial = best_of(lambda: extract_events(entries), args.repeat)
+    parallel = best_of(lambda: extract_events_parallel(entries, max_workers=args.workers, min_entries=1), args.repeat)
+    print(f"{len(entries)} entries -> {len(serial_events)} events, {args.workers} workers (cpu_count={os.cpu_count()})")
+    print(f"  serial     {serial:7.3f} s  {len(entries) / serial:10.0f} entries/s")
+    print(f"  parallel   {parallel:7.3f} s  {len(entries) / parallel:10.0f} entries/s  ({serial / parallel:.2f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""Benchmark: Stop-hook extraction with and without the line prefilter.
+
+# WHAT: Times extract_events(TranscriptReader.iter_new(...)) over large
+#       transcripts, once decoding every line and once with
+#       DEFAULT_REGISTRY.prefilter() skipping lines no extractor can use.
+# WHY: Tool output, plain assistant text and file snapshots make up most
+#       of a real transcript; skipping their JSON decode is the main lever
+#       on Stop-hook CPU for long sessions.
+
+Usage:
+    python -m scripts.benchmarks.prefilter [--mb 30] [--repeat 3]
+"""
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+from cortex.extractors import DEFAULT_REGISTRY, extract_events
+from cortex.transcript import LineFilter, TranscriptReader
+from scripts.benchmarks.common import best_of, write_large_transcript, write_session_transcript
+
+
+def run(path: Path, prefilter: LineFilter | None) -> int:
+    return len(extract_events(TranscriptReader(path).iter_new(prefilter=prefilter)))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mb", type=float, default=30.0, help="approximate transcript size in MB")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        generated = Path(tmp) / "generated.jsonl"
+        write_large_transcript(generated, args.mb)
+        session = Path(tmp) / "session.jsonl"
+        write_session_transcript(session, entries=int(args.mb * 1024 * 1024 / 4300))
+
+        for label, path in (("phase-2 generator", generated), ("tool session", session)):
+            size_mb = path.stat().st_size / (1024 * 1024)
+            assert run(path, None) == run(path, DEFAULT_REGISTRY.prefilter())
+            full = best_of(lambda p=path: run(p, None), args.repeat)
+            filtered = best_of(lambda p=path: run(p, DEFAULT_REGISTRY.prefilter()), args.repeat)
+            reader = TranscriptReader(path)
+            for _ in reader.iter_new(prefilter=DEFAULT_REGISTRY.prefilter()):
+                pass
+            total = reader.entries_read + reader.lines_skipped
+            print(f"{label}: {size_mb:.1f} MB, {reader.lines_skipped}/{total} lines skipped")
+            print(f"  decode all  {full:7.3f} s  {size_mb / full:8.1f} MB/s")
+            print(f"  prefilter   {filtered:7.3f} s  {size_mb / filtered:8.1f} MB/s  ({full / filtered:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
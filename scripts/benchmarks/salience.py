@@ -0,0 +1,92 @@
+"""Benchmark: ranking events by effective salience, per event vs columnar.
+
+# WHAT: Times picking the top 30 of N events by decayed salience:
+#       sorting Events with effective_salience() as the key (what a full
+#       recompute does), SalienceColumns in pure Python and with NumPy,
+#       and SQLite's recent-section query before and after (a Python
+#       callback per row + ORDER BY vs columns fetched and ranked at once).
+# WHY: At 50k+ events scoring dominates briefing cost: every row parses a
+#       timestamp and calls pow() inside a sort key.
+
+Usage:
+    python -m scripts.benchmarks.salience [--events 50000] [--repeat 5]
+"""
+
+import argparse
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+from cortex import salience
+from cortex.config import CortexConfig
+from cortex.models import decayed_salience, effective_salience
+from cortex.salience import SalienceColumns
+from cortex.sqlite_store import SQLiteEventStore
+from scripts.benchmarks.common import best_of, synthetic_events
+
+_PROJECT_HASH = "benchbenchbench0"
+_K = 30
+
+
+def _old_sqlite_recent(store: SQLiteEventStore) -> None:
+    """The recent-section query SQLiteEventStore ran before columnar scoring."""
+    now = datetime.now(timezone.utc)
+    store._conn.create_function(
+        "cortex_salience",
+        3,
+        lambda salience, accessed_at, immortal: decayed_salience(salience, accessed_at, bool(immortal), now),
+    )
+    store._select(
+        "WHERE immortal = 0 ORDER BY cortex_salience(salience, accessed_at, immortal) DESC, seq LIMIT ?", (_K,)
+    )
+
+
+def _new_sqlite_recent(store: SQLiteEventStore) -> None:
+    """The same query as SQLiteEventStore.load_for_briefing() now runs it."""
+    rows = store._conn.execute(
+        "SELECT seq, salience, accessed_us FROM events NOT INDEXED WHERE immortal = 0 ORDER BY seq"
+    ).fetchall()
+    columns = SalienceColumns([row[1] for row in rows], [row[2] for row in rows])
+    top = sorted(rows[i][0] for i in columns.top_k(_K, datetime.now(timezone.utc)))
+    store._select(f"WHERE seq IN ({','.join('?' * len(top))}) ORDER BY seq", tuple(top))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=50000, help="events to rank")
+    parser.add_argument("--repeat", type=int, default=5, help="calls per measurement (best is reported)")
+    args = parser.parse_args()
+
+    events = synthetic_events(args.events)
+    now = datetime.now(timezone.utc)
+    has_numpy = salience.load_numpy() is not None
+
+    def per_event() -> None:
+        sorted(events, key=lambda e: effective_salience(e, now), reverse=True)[:_K]
+
+    def columnar(vectorize: bool) -> None:
+        salience.VECTORIZE_MIN_ROWS = 0 if vectorize else len(events) + 1
+        columns = SalienceColumns.from_timestamps([e.salience for e in events], [e.accessed_at for e in events])
+        columns.top_k(_K, now)
+
+    results = {"sort by effective_salience": best_of(per_event, args.repeat)}
+    results["SalienceColumns, Python"] = best_of(lambda: columnar(False), args.repeat)
+    if has_numpy:
+        results["SalienceColumns, NumPy"] = best_of(lambda: columnar(True), args.repeat)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLiteEventStore(_PROJECT_HASH, CortexConfig(cortex_home=Path(tmp) / ".cortex"))
+        store.append_many(events)
+        results["SQLite recent, SQL callback"] = best_of(lambda: _old_sqlite_recent(store), args.repeat)
+        results["SQLite recent, columnar"] = best_of(lambda: _new_sqlite_recent(store), args.repeat)
+        store.close()
+
+    print(f"top {_K} of {args.events} events, best of {args.repeat}{'' if has_numpy else ' (NumPy not installed)'}")
+    for label, seconds in results.items():
+        print(f"  {label:30} {seconds * 1000:8.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""Benchmark: Layer 2 keyword scan, one pass per pattern vs one combined pass.
+
+# WHAT: Times the per-pattern finditer() loop that extract_semantic() used
+#       to run against the combined _SEMANTIC_RE scan, over a corpus of
+#       assistant messages built from README prose with occasional keyword
+#       lines (roughly one message in ten has one).
+# WHY: Every assistant message goes through this scan; most have no
+#       keyword at all, so the cost is dominated by the scan itself.
+
+Usage:
+    python -m scripts.benchmarks.semantic_regex [--messages 20000] [--repeat 5]
+"""
+
+import argparse
+import random
+import sys
+from pathlib import Path
+
+from cortex.extractors import _SEMANTIC_GROUPS, _SEMANTIC_RE, SEMANTIC_PATTERNS
+from scripts.benchmarks.common import best_of
+
+_KEYWORD_LINES = [
+    "Decision: keep the store append-only",
+    "**Rejected: MongoDB** — overkill",
+    "Fixed: off-by-one in offset tracking",
+    "Learned: fsync the directory after rename",
+    "Preference: double quotes",
+]
+
+
+def build_corpus(messages: int, seed: int = 1) -> list[str]:
+    readme = Path(__file__).resolve().parents[2] / "README.md"
+    lines = [line for line in readme.read_text(encoding="utf-8").splitlines() if line.strip()]
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(messages):
+        start = rng.randrange(len(lines))
+        body = lines[start : start + rng.randint(3, 15)]
+        if rng.random() < 0.1:
+            body.insert(rng.randrange(len(body) + 1), rng.choice(_KEYWORD_LINES))
+        corpus.append("\n\n".join(body))
+    return corpus
+
+
+def per_pattern(corpus: list[str]) -> int:
+    found = 0
+    for text in corpus:
+        for pattern, _, _ in SEMANTIC_PATTERNS:
+            for _ in pattern.finditer(text):
+                found += 1
+    return found
+
+
+def single_pass(corpus: list[str]) -> int:
+    found = 0
+    for text in corpus:
+        resume_at = [0] * len(SEMANTIC_PATTERNS)
+        for match in _SEMANTIC_RE.finditer(text):
+            group = match.lastindex
+            index = _SEMANTIC_GROUPS[group]
+            if match.start() < resume_at[index]:
+                continue
+            resume_at[index] = match.end(group)
+            found += 1
+    return found
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=20000, help="assistant messages in the corpus")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.messages)
+    size_mb = sum(len(text) for text in corpus) / (1024 * 1024)
+    assert per_pattern(corpus) == single_pass(corpus)
+
+    before = best_of(lambda: per_pattern(corpus), args.repeat)
+    after = best_of(lambda: single_pass(corpus), args.repeat)
+    print(f"{args.messages} messages, {size_mb:.1f} MB, {single_pass(corpus)} keyword lines")
+    print(f"  per-pattern  {before * 1000:8.1f} ms  {size_mb / before:7.1f} MB/s")
+    print(f"  single pass  {after * 1000:8.1f} ms  {size_mb / after:7.1f} MB/s  ({before / after:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
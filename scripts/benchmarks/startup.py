@@ -0,0 +1,121 @@
+"""Benchmark: CLI startup imports, from `python -X importtime`.
+
+# WHAT: Runs `python -X importtime -m cortex <command>` for a few typical
+#       invocations and reports wall time, import time beyond
+#       interpreter startup and module count (medians), plus the slowest
+#       top-level imports.
+# WHY: Every hook is a fresh process, so import cost is paid at every
+#       turn end. A hook with nothing to do must not import the rest of
+#       the package; this fails (exit 1) if it does, or if early-exit
+#       import time goes over --budget-ms, so it can gate regressions.
+
+Everything runs under a temporary HOME, so ~/.cortex is not touched.
+
+Usage:
+    python -m scripts.benchmarks.startup [--runs 10] [--budget-ms 25] [--top 8]
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from scripts.benchmarks.common import _project_root, write_session_transcript
+
+# "import time: <self us> | <cumulative us> | <indent><module>"
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+# Modules a hook with nothing to do may import from this package.
+_EARLY_EXIT_ALLOWED = {"cortex", "cortex.__main__"}
+
+
+def _run(argv: list[str], payload: dict | None, env: dict) -> tuple[float, dict[str, int], dict[str, int]]:
+    """Run one invocation; return (wall ms, top-level cumulative us, all module self us)."""
+    data = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    started = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-X", "importtime", *argv], input=data, env=env, capture_output=True)
+    wall = (time.perf_counter() - started) * 1000
+    top: dict[str, int] = {}
+    modules: dict[str, int] = {}
+    for line in proc.stderr.decode("utf-8", "replace").splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        modules[name] = int(self_us)
+        if not indent:
+            top[name] = int(cumulative_us)
+    return wall, top, modules
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="runs per scenario (medians are reported)")
+    parser.add_argument("--budget-ms", type=float, default=25.0, help="max early-exit import time")
+    parser.add_argument("--top", type=int, default=8, help="slowest top-level imports to list per scenario")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="cx-") as tmp:
+        home = Path(tmp)
+        project = home / "project"
+        project.mkdir()
+        transcript = home / "session.jsonl"
+        write_session_transcript(transcript, 200, payload_bytes=512)
+        env = {
+            **os.environ,
+            "HOME": str(home),
+            "PYTHONPATH": str(_project_root / "src"),
+            "CORTEX_DAEMON_SOCKET": str(home / "none.sock"),
+        }
+        # (label, argv, stdin payload, hook should exit before real work)
+        scenarios = [
+            ("stop (stop_hook_active)", ["stop"], {"cwd": str(project), "stop_hook_active": True}, True),
+            ("stop (no transcript_path)", ["stop"], {"cwd": str(project)}, True),
+            ("stop (extract)", ["stop"], {"cwd": str(project), "transcript_path": str(transcript)}, False),
+            ("session-start", ["session-start"], {"cwd": str(project)}, False),
+            ("status", ["status"], None, False),
+        ]
+
+        # WHAT: Leave out what the interpreter imports before cortex runs.
+        # WHY: Interpreter startup is the same for any Python program;
+        # runpy is only there because of -m (the console script skips it).
+        _, baseline, _ = _run(["-c", "pass"], None, env)
+        startup = set(baseline) | {"runpy"}
+
+        failures = []
+        print(f"{'scenario':28} {'wall ms':>8} {'import ms':>10} {'modules':>8}")
+        for label, argv, payload, early_exit in scenarios:
+            walls, imports, counts = [], [], []
+            top: dict[str, int] = {}
+            modules: dict[str, int] = {}
+            for _ in range(args.runs):
+                wall, top, modules = _run(["-m", "cortex", *argv], payload, env)
+                top = {name: us for name, us in top.items() if name not in startup}
+                walls.append(wall)
+                imports.append(sum(top.values()) / 1000)
+                counts.append(len(modules))
+            import_ms = statistics.median(imports)
+            print(f"{label:28} {statistics.median(walls):8.1f} {import_ms:10.1f} {statistics.median(counts):8.0f}")
+            for name, us in sorted(top.items(), key=lambda item: -item[1])[: args.top]:
+                print(f"    {us / 1000:7.1f} ms  {name}")
+
+            if early_exit:
+                extra = sorted(m for m in modules if m.startswith("cortex") and m not in _EARLY_EXIT_ALLOWED)
+                if extra:
+                    failures.append(f"{label} imported {', '.join(extra)}")
+                if import_ms > args.budget_ms:
+                    failures.append(f"{label} import time {import_ms:.1f} ms > budget {args.budget_ms:.1f} ms")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""Benchmark: strip_code_blocks() against the old lazy-regex stripper.
+
+# WHAT: Times the current delimiter-pairing strip_code_blocks() and the
+#       previous two-regex version (``` / ~~~ blocks via [\\s\\S]*?, then
+#       `[^`]+` spans) on ordinary assistant text and on adversarial
+#       inputs, each at three sizes so the growth rate is visible. The
+#       old version is only correct for 3-character fences and
+#       single-backtick spans; its times are the speed bar, not a
+#       reference output.
+# WHY: Assistant messages with pasted logs, unbalanced fences and
+#       backtick soup go through this on every Layer 2 scan; cost must
+#       stay linear in message size.
+
+Usage:
+    python -m scripts.benchmarks.strip_code [--kb 64] [--repeat 5]
+"""
+
+import argparse
+import re
+import sys
+from collections.abc import Callable
+from pathlib import Path
+
+from cortex.transcript import strip_code_blocks
+from scripts.benchmarks.common import best_of
+
+_OLD_BLOCK_RE = re.compile(r"```[\s\S]*?```|~~~[\s\S]*?~~~", re.MULTILINE)
+_OLD_INLINE_RE = re.compile(r"`[^`]+`")
+
+
+def old_strip(text: str) -> str:
+    return _OLD_INLINE_RE.sub("", _OLD_BLOCK_RE.sub("", text))
+
+
+def _readme(n: int) -> str:
+    text = (Path(__file__).resolve().parents[2] / "README.md").read_text(encoding="utf-8")
+    return (text * (n // len(text) + 1))[:n]
+
+
+# name -> builder(size in chars)
+INPUTS: dict[str, Callable[[int], str]] = {
+    "README prose + code": _readme,
+    "unclosed fence + log": lambda n: "Here is the log:\n```\n" + "2026-02-01 INFO worker ready\n" * (n // 29),
+    "unclosed fence per line": lambda n: "```x\n" * (n // 5),
+    "alternating fence chars": lambda n: "```a~~~b" * (n // 8),
+    "nested long fences": lambda n: "Text\n````md\n```py\nx = 1\n```\n````\n" * (n // 37),
+    "growing fence lengths": lambda n: "".join("`" * k + "x" for k in range(3, 3 + int((2 * n) ** 0.5))),
+    "shrinking fence lengths": lambda n: "".join("`" * k + "x" for k in range(int((2 * n) ** 0.5), 2, -1)),
+    "single backticks": lambda n: "`a " * (n // 3),
+    "backtick soup": lambda n: "``a`b```c" * (n // 9),
+}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--kb", type=int, default=64, help="smallest input size in KB (then x2, x4)")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    sizes = [args.kb * 1024 * m for m in (1, 2, 4)]
+    print(f"{'input':<26}" + "".join(f"{f'{s // 1024} KB old/new (ms)':>26}" for s in sizes))
+    for name, build in INPUTS.items():
+        cells = []
+        for size in sizes:
+            text = build(size)
+            old = best_of(lambda t=text: old_strip(t), args.repeat)
+            new = best_of(lambda t=text: strip_code_blocks(t), args.repeat)
+            cells.append(f"{old * 1000:10.2f} / {new * 1000:8.2f}")
+        print(f"{name:<26}" + "".join(f"{c:>26}" for c in cells))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""Benchmark: sorting and decaying events on ISO strings vs cached epochs.
+
+# WHAT: Times sorting N events by created_at and ranking them by
+#       effective salience, parsing the ISO strings on every call (as
+#       before) and on Event's cached created_us / accessed_us, on fresh
+#       Events (cold: the cache fills during the pass) and on Events that
+#       were already ranked once (warm: a briefing followed by its
+#       verification, or a second section over the same events).
+# WHY: datetime.fromisoformat() ran inside every sort key and every
+#       effective_salience() call.
+
+Usage:
+    python -m scripts.benchmarks.timestamps [--events 50000] [--repeat 5]
+"""
+
+import argparse
+import sys
+from datetime import datetime, timezone
+from functools import partial
+
+from cortex.models import DEFAULT_DECAY_RATE, Event, created_key, effective_salience
+from scripts.benchmarks.common import best_of, synthetic_events
+
+
+def _parsed_salience(event: Event, now: datetime) -> float:
+    """effective_salience() as it was: parse accessed_at on every call."""
+    if event.immortal or not event.accessed_at:
+        return event.salience
+    accessed = datetime.fromisoformat(event.accessed_at)
+    if accessed.tzinfo is None:
+        accessed = accessed.replace(tzinfo=timezone.utc)
+    hours = max(0, (now - accessed).total_seconds() / 3600)
+    return event.salience * DEFAULT_DECAY_RATE**hours
+
+
+def _timed(fn, events_for, repeat: int) -> float:
+    """Best time of fn(events) over repeat runs, each on events_for()."""
+    best = float("inf")
+    for _ in range(repeat):
+        events = events_for()
+        best = min(best, best_of(partial(fn, events), 1))
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=50000, help="events to sort and score")
+    parser.add_argument("--repeat", type=int, default=5, help="calls per measurement (best is reported)")
+    args = parser.parse_args()
+
+    now = datetime.now(timezone.utc)
+    template = synthetic_events(args.events)
+
+    def fresh() -> list[Event]:
+        return [Event.from_dict(e.to_dict()) for e in template]
+
+    def warm() -> list[Event]:
+        events = fresh()
+        for event in events:
+            # Reading the properties fills Event's cached epochs.
+            _ = event.created_us, event.accessed_us
+        return events
+
+    cases = {
+        "sort by created_at": (
+            lambda events: sorted(events, key=lambda e: datetime.fromisoformat(e.created_at)),
+            lambda events: sorted(events, key=created_key),
+        ),
+        "rank by salience": (
+            lambda events: sorted(events, key=lambda e: _parsed_salience(e, now)),
+            lambda events: sorted(events, key=lambda e: effective_salience(e, now)),
+        ),
+    }
+    print(f"{args.events} events, best of {args.repeat}")
+    print(f"  {'':22} {'ISO strings':>12} {'epochs, cold':>13} {'epochs, warm':>13}")
+    for label, (strings, epochs) in cases.items():
+        parsed = _timed(strings, fresh, args.repeat) * 1000
+        cold = _timed(epochs, fresh, args.repeat) * 1000
+        cached = _timed(epochs, warm, args.repeat) * 1000
+        print(f"  {label:22} {parsed:9.2f} ms {cold:10.2f} ms {cached:10.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""Benchmark: picking a briefing's recent events by full sort vs streaming top-K.
+
+# WHAT: On a JSONL store of N events, times the full-recompute briefing
+#       selection two ways and reports the peak memory of each
+#       (tracemalloc): loading every event and sorting all non-immortal
+#       ones by effective salience (as before), and select_for_briefing()
+#       streaming events from the backend through a K-bounded heap.
+# WHY: The sort is O(N log N) and holds all N Events to return K of them.
+
+Usage:
+    python -m scripts.benchmarks.top_k [--events 50000] [--k 30] [--repeat 3]
+"""
+
+import argparse
+import gc
+import sys
+import tempfile
+import tracemalloc
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+
+from cortex.briefing_view import _active_plan, select_for_briefing
+from cortex.config import CortexConfig
+from cortex.models import Event, created_key, effective_salience
+from cortex.store import EventStore
+from scripts.benchmarks.common import best_of, synthetic_events
+
+_PROJECT_HASH = "benchbenchbench0"
+
+
+def _sorted_select(store: EventStore, k: int) -> dict:
+    """The recompute as it was: load everything, sort the rest, slice."""
+    now = datetime.now(timezone.utc)
+    events = store.load_all()
+    immortal = sorted([e for e in events if e.immortal], key=created_key, reverse=True)
+    active_plan = _active_plan(events)
+    included_ids = {e.id for e in immortal} | {e.id for e in active_plan}
+    remaining = [e for e in events if e.id not in included_ids]
+    remaining.sort(key=lambda e: effective_salience(e, now), reverse=True)
+    return {"immortal": immortal, "active_plan": active_plan, "recent": remaining[:k]}
+
+
+def _streamed_select(store: EventStore, k: int) -> dict:
+    events = (Event.from_dict(d) for d in store.backend.iter_raw())
+    return select_for_briefing(events, None, datetime.now(timezone.utc), k)
+
+
+def _peak(fn) -> int:
+    gc.collect()
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=50000, help="events in the store")
+    parser.add_argument("--k", type=int, default=30, help="events in the recent section")
+    parser.add_argument("--repeat", type=int, default=3, help="calls per measurement (best is reported)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config = CortexConfig(cortex_home=Path(tmp) / ".cortex", store_backend="jsonl")
+        store = EventStore(_PROJECT_HASH, config)
+        store.append_many(synthetic_events(args.events))
+
+        old, new = _sorted_select(store, args.k), _streamed_select(store, args.k)
+        same = all([e.id for e in old[s]] == [e.id for e in new[s]] for s in old)
+        results = {
+            "load all + full sort": (_sorted_select, best_of(lambda: _sorted_select(store, args.k), args.repeat)),
+            "stream + top-K heap": (_streamed_select, best_of(lambda: _streamed_select(store, args.k), args.repeat)),
+        }
+        mib = 1024 * 1024
+        print(f"{args.events} events, K={args.k}, jsonl backend, best of {args.repeat}")
+        for label, (fn, seconds) in results.items():
+            print(f"  {label:22} {seconds * 1000:8.1f} ms  peak {_peak(partial(fn, store, args.k)) / mib:7.1f} MiB")
+    if not same:
+        print("FAIL: selections differ")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
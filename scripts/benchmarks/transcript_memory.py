@@ -0,0 +1,89 @@
+"""Benchmark: resident memory per 10k transcript entries.
+
+# WHAT: Measures memory held by parsed TranscriptEntry objects, comparing
+#       the original representation (plain dataclass, full raw dict) with
+#       the current one (__slots__, slimmed toolUseResult, snapshot lines
+#       recognized without decoding).
+# WHY: Tool results repeat file contents and command output; keeping them
+#       resident per entry made hook RSS scale with transcript size.
+
+Usage:
+    python -m scripts.benchmarks.transcript_memory [--entries 10000] [--payload 4096]
+"""
+
+import argparse
+import dataclasses
+import gc
+import json
+import sys
+import tempfile
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+from cortex.transcript import TranscriptEntry, TranscriptReader
+from scripts.benchmarks.common import write_session_transcript
+
+# WHAT: TranscriptEntry's fields as a regular (dict-backed) dataclass.
+_LegacyEntry = dataclasses.make_dataclass(
+    "LegacyEntry",
+    [(f.name, f.type, f) for f in dataclasses.fields(TranscriptEntry)],
+)
+
+
+def read_legacy(path: Path) -> list:
+    """The original parser: decode every line, keep the full raw dict."""
+    entries = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            raw = json.loads(line)
+            message = raw.get("message", {})
+            content = message.get("content", [])
+            entries.append(
+                _LegacyEntry(
+                    record_type=raw.get("type", ""),
+                    uuid=raw.get("uuid", raw.get("messageId", "")),
+                    session_id=raw.get("sessionId", ""),
+                    role=message.get("role", ""),
+                    content_blocks=[{"type": "text", "text": content}] if isinstance(content, str) else content,
+                    raw=raw,
+                )
+            )
+    return entries
+
+
+def read_current(path: Path) -> list:
+    return TranscriptReader(path).read_all()
+
+
+def resident_bytes(load: Callable[[Path], list], path: Path) -> tuple[int, int]:
+    """Return (bytes still allocated while entries are held, entry count)."""
+    gc.collect()
+    tracemalloc.start()
+    entries = load(path)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, len(entries)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=10000, help="transcript lines")
+    parser.add_argument("--payload", type=int, default=4096, help="bytes of file content per tool result")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "tools.jsonl"
+        write_session_transcript(path, args.entries, args.payload)
+        print(f"Transcript: {path.stat().st_size / (1024 * 1024):.1f} MB, {args.entries} lines")
+
+        for name, load in (("legacy", read_legacy), ("current", read_current)):
+            held, count = resident_bytes(load, path)
+            per_10k = held / count * 10_000 / (1024 * 1024)
+            print(f"  {name:<8} {held / (1024 * 1024):8.1f} MB held  {per_10k:8.1f} MB per 10k entries")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
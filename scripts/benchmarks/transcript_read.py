@@ -0,0 +1,77 @@
+"""Benchmark: transcript reading throughput (MB/s).
+
+# WHAT: Compares the original text-mode readline() reader against
+#       TranscriptReader's binary, chunked line splitter, once per
+#       installed JSON codec. Both readers decode with the same codec in
+#       each row pair, so the gap between them is the splitting alone.
+# WHY: The Stop hook reads every new transcript byte; on marathon sessions
+#       that is hundreds of MB and reading dominates hook latency.
+
+Usage:
+    python -m scripts.benchmarks.transcript_read [--mb 50] [--repeat 3]
+"""
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+from cortex.codec import active_codec, available_codecs, use_codec
+from cortex.transcript import TranscriptReader, parse_entry
+from scripts.benchmarks.common import best_of, write_large_transcript
+
+
+def read_text_mode(path: Path) -> int:
+    """The pre-chunking reader: text mode, readline() + strip() per line."""
+    loads = active_codec().loads
+    count = 0
+    with open(path, "r", encoding="utf-8") as f:
+        while True:
+            line = f.readline()
+            if not line:
+                break
+            stripped = line.strip()
+            if not stripped:
+                continue
+            try:
+                raw = loads(stripped)
+            except ValueError:
+                continue
+            if isinstance(raw, dict):
+                parse_entry(raw)
+                count += 1
+        f.tell()
+    return count
+
+
+def read_chunked(path: Path) -> int:
+    """TranscriptReader.iter_new(): binary, bulk-buffered."""
+    count = 0
+    for _ in TranscriptReader(path).iter_new():
+        count += 1
+    return count
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mb", type=float, default=50.0, help="transcript size in MB")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per reader (best is reported)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "large.jsonl"
+        lines = write_large_transcript(path, args.mb)
+        size_mb = path.stat().st_size / (1024 * 1024)
+        print(f"Transcript: {size_mb:.1f} MB, {lines} lines")
+
+        for codec in available_codecs():
+            use_codec(codec)
+            assert read_text_mode(path) == read_chunked(path)
+            for name, reader in (("text readline", read_text_mode), ("binary chunked", read_chunked)):
+                seconds = best_of(lambda r=reader: r(path), args.repeat)
+                print(f"  {codec:<8} {name:<16} {seconds:7.3f} s  {size_mb / seconds:8.1f} MB/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
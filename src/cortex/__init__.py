@@ -7,70 +7,164 @@ are automatically loaded at session start.
 Public API:
     - Event, EventType, create_event: Core event model
     - CortexConfig, load_config, save_config: Configuration
-    - EventStore, HookState: Storage
-    - identify_project, get_project_hash: Project identity
+    - EventStore, SQLiteEventStore, HookState, open_store: Storage
+    - identify_project, get_project_hash, ProjectIndex: Project identity
     - TranscriptEntry, TranscriptReader: Transcript parsing
     - ToolCall, ToolResult: Tool interaction models
     - extract_text_content, extract_thinking_content: Content extraction
     - extract_tool_calls, extract_tool_results: Tool extraction
     - strip_code_blocks: Code block removal for keyword matching
-    - find_transcript_path, find_latest_transcript: Transcript discovery
+    - find_transcript_path, find_latest_transcript, find_session_transcripts: Transcript discovery
     - extract_events: Three-layer extraction pipeline
+    - extract_events_parallel: Process-pool extraction for large backfills
     - extract_structural, extract_semantic, extract_explicit: Individual layers
-    - generate_briefing, write_briefing_to_file: Briefing generation
+    - ExtractorRegistry, ExtractionContext, DEFAULT_REGISTRY: Pluggable extractors
+    - generate_briefing, write_briefing_to_file, BriefingCache: Briefing generation
     - read_payload, handle_stop, handle_precompact, handle_session_start: Hook handlers
-    - cmd_reset, cmd_status, cmd_init, get_init_hook_json: CLI commands
+    - HookEnv: Config, identity and store lookup for hook handlers
+    - backfill_project: Bulk ingestion of historical transcripts
+    - CortexDaemon, WarmEnv: Long-lived hook server (cortex daemon)
+    - cmd_reset, cmd_status, cmd_init, cmd_backfill, cmd_daemon, get_init_hook_json: CLI commands
+
+Each name is imported from its defining module on first access, so
+`import cortex` itself loads nothing else.
 """
 
 __version__ = "0.1.0"
 
-from cortex.briefing import generate_briefing, write_briefing_to_file
-from cortex.cli import cmd_init, cmd_reset, cmd_status, get_init_hook_json
-from cortex.config import CortexConfig, load_config, save_config
-from cortex.extractors import (
-    extract_events,
-    extract_explicit,
-    extract_semantic,
-    extract_structural,
-)
-from cortex.hooks import (
-    handle_precompact,
-    handle_session_start,
-    handle_stop,
-    read_payload,
-)
-from cortex.models import Event, EventType, create_event
-from cortex.project import get_project_hash, identify_project
-from cortex.store import EventStore, HookState
-from cortex.transcript import (
-    ToolCall,
-    ToolResult,
-    TranscriptEntry,
-    TranscriptReader,
-    extract_text_content,
-    extract_thinking_content,
-    extract_tool_calls,
-    extract_tool_results,
-    find_latest_transcript,
-    find_transcript_path,
-    strip_code_blocks,
-)
+# WHAT: Local stand-in for typing.TYPE_CHECKING.
+# WHY: Importing typing costs more than the rest of this module; type
+# checkers treat any constant named TYPE_CHECKING as true.
+TYPE_CHECKING = False
+
+# WHAT: Public names, by the module that defines them. Each module is
+# imported on first access to one of its names (PEP 562).
+# WHY: Every hook invocation is a fresh process. Importing the package
+# must not pull in extraction, storage, SQLite and process pools just
+# so `cortex stop` can notice it has nothing to do.
+_EXPORTS = {
+    "cortex.backfill": ("backfill_project",),
+    "cortex.briefing": ("BriefingCache", "generate_briefing", "write_briefing_to_file"),
+    "cortex.cli": ("cmd_backfill", "cmd_daemon", "cmd_init", "cmd_reset", "cmd_status", "get_init_hook_json"),
+    "cortex.config": ("CortexConfig", "load_config", "save_config"),
+    "cortex.daemon": ("CortexDaemon", "WarmEnv"),
+    "cortex.extractors": (
+        "DEFAULT_REGISTRY",
+        "extract_events",
+        "extract_events_parallel",
+        "extract_explicit",
+        "extract_semantic",
+        "extract_structural",
+    ),
+    "cortex.hooks": ("HookEnv", "handle_precompact", "handle_session_start", "handle_stop", "read_payload"),
+    "cortex.models": ("Event", "EventType", "create_event"),
+    "cortex.project": ("ProjectIndex", "get_project_hash", "identify_project"),
+    "cortex.registry": ("ExtractionContext", "ExtractorRegistry"),
+    "cortex.sqlite_store": ("SQLiteEventStore",),
+    "cortex.store": ("EventStore", "HookState", "open_store"),
+    "cortex.transcript": (
+        "ToolCall",
+        "ToolResult",
+        "TranscriptEntry",
+        "TranscriptReader",
+        "extract_text_content",
+        "extract_thinking_content",
+        "extract_tool_calls",
+        "extract_tool_results",
+        "find_latest_transcript",
+        "find_session_transcripts",
+        "find_transcript_path",
+        "strip_code_blocks",
+    ),
+}
+
+_MODULE_OF = {name: module for module, names in _EXPORTS.items() for name in names}
+
+if TYPE_CHECKING:
+    from cortex.backfill import backfill_project
+    from cortex.briefing import BriefingCache, generate_briefing, write_briefing_to_file
+    from cortex.cli import cmd_backfill, cmd_daemon, cmd_init, cmd_reset, cmd_status, get_init_hook_json
+    from cortex.config import CortexConfig, load_config, save_config
+    from cortex.daemon import CortexDaemon, WarmEnv
+    from cortex.extractors import (
+        DEFAULT_REGISTRY,
+        extract_events,
+        extract_events_parallel,
+        extract_explicit,
+        extract_semantic,
+        extract_structural,
+    )
+    from cortex.hooks import (
+        HookEnv,
+        handle_precompact,
+        handle_session_start,
+        handle_stop,
+        read_payload,
+    )
+    from cortex.models import Event, EventType, create_event
+    from cortex.project import ProjectIndex, get_project_hash, identify_project
+    from cortex.registry import ExtractionContext, ExtractorRegistry
+    from cortex.sqlite_store import SQLiteEventStore
+    from cortex.store import EventStore, HookState, open_store
+    from cortex.transcript import (
+        ToolCall,
+        ToolResult,
+        TranscriptEntry,
+        TranscriptReader,
+        extract_text_content,
+        extract_thinking_content,
+        extract_tool_calls,
+        extract_tool_results,
+        find_latest_transcript,
+        find_session_transcripts,
+        find_transcript_path,
+        strip_code_blocks,
+    )
+
+
+def __getattr__(name: str):
+    module = _MODULE_OF.get(name)
+    if module is None:
+        raise AttributeError(f"module 'cortex' has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
+    "DEFAULT_REGISTRY",
+    "BriefingCache",
     "CortexConfig",
+    "CortexDaemon",
     "Event",
     "EventStore",
     "EventType",
+    "ExtractionContext",
+    "ExtractorRegistry",
+    "HookEnv",
     "HookState",
+    "ProjectIndex",
+    "SQLiteEventStore",
     "ToolCall",
     "ToolResult",
     "TranscriptEntry",
     "TranscriptReader",
+    "WarmEnv",
+    "backfill_project",
+    "cmd_backfill",
+    "cmd_daemon",
     "cmd_init",
     "cmd_reset",
     "cmd_status",
     "create_event",
     "extract_events",
+    "extract_events_parallel",
     "extract_explicit",
     "extract_semantic",
     "extract_structural",
@@ -79,6 +173,7 @@ __all__ = [
     "extract_tool_calls",
     "extract_tool_results",
     "find_latest_transcript",
+    "find_session_transcripts",
     "find_transcript_path",
     "generate_briefing",
     "get_init_hook_json",
@@ -88,6 +183,7 @@ __all__ = [
     "handle_stop",
     "identify_project",
     "load_config",
+    "open_store",
     "read_payload",
     "save_config",
     "strip_code_blocks",
@@ -7,21 +7,119 @@ Usage:
     cortex reset         # clear store + state for current project
     cortex status        # show project hash, event count, last extraction
     cortex init          # print hook JSON for Claude Code settings
+    cortex backfill [--workers N]  # ingest all past transcripts for this project
+    cortex daemon        # serve hook commands from one long-lived process
 
     python -m cortex stop   # same
+
+Hook commands are handed to `cortex daemon` over its Unix socket when one
+is running, and handled in this process otherwise.
+
+Startup cost is paid on every turn, so this module imports only the
+standard library at load time. A hook whose payload means there is
+nothing to do exits before any other cortex module is imported, and
+each command imports just what it needs.
 """
 
+import json
+import os
 import sys
 
-from cortex.cli import cmd_init, cmd_reset, cmd_status
-from cortex.hooks import (
-    handle_precompact,
-    handle_session_start,
-    handle_stop,
-    read_payload,
-)
+USAGE = "Usage: cortex <stop|precompact|session-start|reset|status|init|backfill|daemon>\n"
+
+# Hook command -> handler name in cortex.hooks.
+HOOKS = {
+    "stop": "handle_stop",
+    "precompact": "handle_precompact",
+    "session-start": "handle_session_start",
+}
+
+# WHAT: Seconds to wait for the daemon to finish a hook.
+# WHY: Bounded below Claude Code's own hook timeout, so a wedged daemon
+# costs one slow turn instead of a killed hook.
+_DAEMON_TIMEOUT = 30.0
+
+
+def _parse_workers(args: list[str]) -> int | None:
+    """Return N from "--workers N", or None if absent or not a number."""
+    if "--workers" in args:
+        i = args.index("--workers")
+        if i + 1 < len(args) and args[i + 1].isdigit():
+            return int(args[i + 1])
+    return None
+
+
+def _daemon_socket_path() -> str:
+    """Same path as cortex.daemon.default_socket_path().
+
+    Duplicated so the client side needs only the standard library.
+    """
+    return os.environ.get("CORTEX_DAEMON_SOCKET") or os.path.join(os.path.expanduser("~"), ".cortex", "daemon.sock")
+
+
+def _call_daemon(command: str, raw_payload: str, socket_path: str | None = None) -> int | None:
+    """Hand a hook to the running daemon and relay its result.
+
+    Returns None if no daemon took the request, or the daemon refused it
+    without running it, so the caller should handle it in-process. Once the request is delivered the daemon owns
+    it: a lost reply is logged and reported as 0, because running the
+    hook again here would race the daemon on the same store.
+    """
+    path = socket_path or _daemon_socket_path()
+    if not os.path.exists(path):
+        return None
+    import socket
+
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    request = json.dumps({"command": command, "payload": raw_payload}).encode("utf-8")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(_DAEMON_TIMEOUT)
+        try:
+            sock.connect(path)
+            sock.sendall(request)
+            sock.shutdown(socket.SHUT_WR)
+        except OSError:
+            return None
+        try:
+            chunks = []
+            while chunk := sock.recv(65536):
+                chunks.append(chunk)
+            response = json.loads(b"".join(chunks))
+            code = response["code"]
+            if code is not None:
+                code = int(code)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            sys.stderr.write(f"[Cortex] No reply from daemon: {e}\n")
+            return 0
+    sys.stderr.write(response.get("stderr") or "")
+    return code
+
 
-USAGE = "Usage: cortex <stop|precompact|session-start|reset|status|init>\n"
+def _hook_has_work(hook_name: str, raw_payload: str) -> bool:
+    """False if the hook handler would return at once for this payload.
+
+    Mirrors the early returns at the top of each handler in cortex.hooks,
+    checked with the standard json module so no cortex import is needed.
+    Undecodable payloads count as work; the handler decides about those.
+    """
+    try:
+        payload = json.loads(raw_payload) if raw_payload.strip() else {}
+    except ValueError:
+        return True
+    if not isinstance(payload, dict) or not payload.get("cwd"):
+        return False
+    if hook_name == "stop":
+        return not payload.get("stop_hook_active") and bool(payload.get("transcript_path"))
+    return True
+
+
+def _read_stdin() -> str:
+    """Return all of stdin, or "" if it cannot be read."""
+    try:
+        return sys.stdin.read()
+    except (ValueError, OSError):
+        return ""
 
 
 def main() -> None:
@@ -36,25 +134,45 @@ def main() -> None:
         sys.exit(0)
 
     if arg == "reset":
+        from cortex.cli import cmd_reset
+
         sys.exit(cmd_reset())
     if arg == "status":
+        from cortex.cli import cmd_status
+
         sys.exit(cmd_status())
     if arg == "init":
+        from cortex.cli import cmd_init
+
         sys.exit(cmd_init())
+    if arg == "backfill":
+        from cortex.cli import cmd_backfill
+
+        sys.exit(cmd_backfill(max_workers=_parse_workers(sys.argv[2:])))
+    if arg == "daemon":
+        from cortex.cli import cmd_daemon
+
+        sys.exit(cmd_daemon())
 
     # Hook commands: require payload on stdin
     hook_name = arg
     if hook_name == "sessionstart":
         hook_name = "session-start"
 
-    if hook_name == "stop":
-        code = handle_stop(read_payload())
-    elif hook_name == "precompact":
-        code = handle_precompact(read_payload())
-    elif hook_name == "session-start":
-        code = handle_session_start(read_payload())
-    else:
+    if hook_name not in HOOKS:
         sys.stderr.write(f"Unknown command: {arg}. {USAGE}")
         sys.exit(1)
 
+    raw_payload = _read_stdin()
+    if not _hook_has_work(hook_name, raw_payload):
+        sys.exit(0)
+    code = _call_daemon(hook_name, raw_payload)
+    if code is None:
+        from cortex import hooks
+
+        code = getattr(hooks, HOOKS[hook_name])(hooks.parse_payload(raw_payload))
     sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Write-behind journal of event accesses for the file-backed event store.
+
+EventStore.mark_accessed() used to load every stored event, update
+accessed_at / access_count on the matching ones and rewrite the whole
+store. With the journal it appends one line to a sidecar file
+(access.jsonl) instead; readers apply the journal on top of the stored
+events, and the journal is folded into the store by a later full write.
+
+File format: one JSON object per mark_accessed() call,
+    {"at": "<ISO 8601 time>", "ids": ["<event id>", ...]}
+in call order. Replaying it sets each listed event's accessed_at to the
+latest "at" naming it and adds one to access_count per line naming it,
+which is what the same calls made directly against the store would do.
+
+Folding renames the journal aside before reading it, so accesses recorded
+while a fold runs stay in a fresh journal, and an interrupted fold loses
+those accesses rather than counting them twice.
+"""
+
+import os
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from cortex import codec
+
+# WHAT: Journal size at which mark_accessed() folds it into the store.
+# WHY: Every reader replays the whole journal; at this size that costs
+# about as much as the load it rides on, and one rewrite resets it.
+FOLD_BYTES = 256 * 1024
+
+
+class AccessJournal:
+    """Sidecar journal of pending accesses for one event store."""
+
+    def __init__(self, path: Path):
+        self._path = path
+        self._folding = path.with_suffix(".jsonl.folding")
+
+    @property
+    def path(self) -> Path:
+        """Path to the access.jsonl file."""
+        return self._path
+
+    def token(self) -> str:
+        """Stat identity of the journal ("" when there is none), for fingerprints."""
+        try:
+            st = self._path.stat()
+        except OSError:
+            return ""
+        return f"{st.st_ino}:{st.st_size}:{st.st_mtime_ns}"
+
+    def size(self) -> int:
+        """Bytes of pending accesses."""
+        try:
+            return self._path.stat().st_size
+        except OSError:
+            return 0
+
+    def append(self, ids: list[str], at: str) -> None:
+        """Record that ids were accessed at the given time.
+
+        One write of one line in append mode, without fsync: a lost
+        access only leaves an event's decay clock where it was.
+        """
+        line = codec.dumps({"at": at, "ids": ids}) + b"\n"
+        fd = os.open(self._path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+
+    def load(self) -> dict[str, tuple[str, int]]:
+        """Pending accesses: id -> (latest accessed_at, number of accesses)."""
+        return _read(self._path)
+
+    def take(self) -> dict[str, tuple[str, int]] | None:
+        """Start a fold: move the journal aside and return its accesses.
+
+        Returns None if nothing is pending. Call finish_fold() once the
+        accesses are in the store.
+        """
+        self._folding.unlink(missing_ok=True)
+        try:
+            self._path.rename(self._folding)
+        except FileNotFoundError:
+            return None
+        return _read(self._folding)
+
+    def finish_fold(self) -> None:
+        """End a fold started by take()."""
+        self._folding.unlink(missing_ok=True)
+
+    def discard(self) -> None:
+        """Drop every pending access (the events they name are gone)."""
+        self._path.unlink(missing_ok=True)
+        self._folding.unlink(missing_ok=True)
+
+
+def apply_accesses(records: Iterable[dict], accesses: dict[str, tuple[str, int]]) -> Iterator[dict]:
+    """Yield records with pending accesses applied (records are updated in place)."""
+    for record in records:
+        event_id = record.get("id")
+        access = accesses.get(event_id) if isinstance(event_id, str) else None
+        if access is not None:
+            record["accessed_at"] = access[0]
+            record["access_count"] = record.get("access_count", 0) + access[1]
+        yield record
+
+
+def _read(path: Path) -> dict[str, tuple[str, int]]:
+    """Replay a journal file, skipping blank, torn, or malformed lines."""
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return {}
+    loads = codec.active_codec().loads
+    accesses: dict[str, tuple[str, int]] = {}
+    for line in data.splitlines():
+        try:
+            entry = loads(line)
+        except ValueError:
+            continue
+        if not isinstance(entry, dict) or not isinstance(entry.get("ids"), list):
+            continue
+        at = entry.get("at", "")
+        for event_id in entry["ids"]:
+            count = accesses[event_id][1] if event_id in accesses else 0
+            accesses[event_id] = (at, count + 1)
+    return accesses
@@ -0,0 +1,376 @@
+"""Storage backends for the Cortex event store.
+
+EventStore delegates persistence of raw event dictionaries to a backend so
+the on-disk layout can change without touching query code. Two backends
+ship with Tier 0:
+
+- JsonArrayBackend: a single events.json array, rewritten atomically on
+  every change. Simple and human-readable; cost grows with store size.
+- JsonlSegmentBackend: append-only JSONL segment files that are fsync'd on
+  every append and periodically compacted into a single base file. An
+  append costs O(new events) regardless of history size.
+
+Backends are selected by CortexConfig.store_backend via open_backend().
+"""
+
+import os
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Protocol
+
+from cortex import codec
+from cortex.config import CortexConfig
+
+BACKEND_JSON = "json"
+BACKEND_JSONL = "jsonl"
+
+# WHAT: File name prefixes for the JSONL segment backend.
+# WHY: A base file is a compacted snapshot that supersedes every file
+# with a lower sequence number; segments hold appends made after it.
+# Renaming a finished base file into place is the compaction commit point.
+_BASE_PREFIX = "base-"
+_SEGMENT_PREFIX = "seg-"
+_SEGMENT_SUFFIX = ".jsonl"
+
+
+class StorageBackend(Protocol):
+    """Persistence interface for raw event dictionaries."""
+
+    name: str
+
+    def load_raw(self) -> list[dict]:
+        """Return every stored event dict in insertion order."""
+        ...
+
+    def iter_raw(self) -> Iterator[dict]:
+        """Yield every stored event dict in insertion order, holding as few as the format allows."""
+        ...
+
+    def append_raw(self, records: list[dict]) -> None:
+        """Durably append records after the existing ones."""
+        ...
+
+    def rewrite_raw(self, records: list[dict]) -> None:
+        """Atomically replace the full store contents with records."""
+        ...
+
+    def fingerprint(self) -> str:
+        """Cheap stat-based token that changes whenever the stored data does."""
+        ...
+
+
+class JsonArrayBackend:
+    """Stores events as one JSON array in events.json.
+
+    The entire file is read/written atomically. This is acceptable for
+    Tier 0 where event counts are in the hundreds, not thousands.
+    """
+
+    name = BACKEND_JSON
+
+    def __init__(self, project_dir: Path):
+        self._project_dir = project_dir
+        self._path = project_dir / "events.json"
+
+    @property
+    def path(self) -> Path:
+        """Path to the events.json file."""
+        return self._path
+
+    def load_raw(self) -> list[dict]:
+        """Load raw event dictionaries from the JSON file."""
+        if not self._path.exists():
+            return []
+        try:
+            content = self._path.read_bytes()
+            if not content.strip():
+                return []
+            data = codec.loads(content)
+            if isinstance(data, list):
+                return data
+            return []
+        except (ValueError, OSError):
+            return []
+
+    def iter_raw(self) -> Iterator[dict]:
+        """Iterate over load_raw(): one JSON array can only be decoded whole."""
+        return iter(self.load_raw())
+
+    def fingerprint(self) -> str:
+        """Identity of events.json: inode, size and mtime (one stat)."""
+        return stat_token(self._path)
+
+    def append_raw(self, records: list[dict]) -> None:
+        """Append by rewriting the whole array (read-modify-write)."""
+        if not records:
+            return
+        existing = self.load_raw()
+        existing.extend(records)
+        self.rewrite_raw(existing)
+
+    def rewrite_raw(self, records: list[dict]) -> None:
+        """Save raw event dictionaries to the JSON file atomically.
+
+        Uses temp file + rename for crash safety. The rename is atomic
+        on POSIX systems (macOS, Linux) for same-filesystem operations.
+        """
+        self._project_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.with_suffix(".json.tmp")
+        try:
+            tmp_path.write_bytes(codec.dumps_pretty(records))
+            tmp_path.rename(self._path)
+        except OSError:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+
+
+class JsonlSegmentBackend:
+    """Stores events as append-only JSONL segments under segments/.
+
+    Layout:
+        segments/base-00000007.jsonl   compacted snapshot (optional)
+        segments/seg-00000008.jsonl    appends after the snapshot
+        segments/seg-00000009.jsonl    ...
+
+    Appends go to the newest segment and are fsync'd before returning.
+    Once a segment reaches segment_max_bytes a new one is started; once
+    more than max_segments exist they are compacted into a new base file.
+    Files whose sequence number is at or below the newest base are stale
+    (left behind by an interrupted compaction) and are ignored on load.
+
+    On first use, an existing events.json from the JSON array backend is
+    migrated into a base file and renamed to events.json.migrated.
+    """
+
+    name = BACKEND_JSONL
+
+    def __init__(
+        self,
+        project_dir: Path,
+        segment_max_bytes: int = 4 * 1024 * 1024,
+        max_segments: int = 8,
+    ):
+        self._project_dir = project_dir
+        self._dir = project_dir / "segments"
+        self._segment_max_bytes = max(1, segment_max_bytes)
+        self._max_segments = max(1, max_segments)
+        self._migrate_legacy()
+
+    @property
+    def path(self) -> Path:
+        """Path to the segments directory."""
+        return self._dir
+
+    def segment_files(self) -> list[Path]:
+        """Live files in load order: newest base first, then later segments."""
+        base, segments = self._scan()
+        files = [path for _, path in segments]
+        if base is not None:
+            files.insert(0, base[1])
+        return files
+
+    def fingerprint(self) -> str:
+        """Names and stat identity of every live segment file."""
+        return "|".join(f"{path.name}:{stat_token(path)}" for path in self.segment_files())
+
+    def load_raw(self) -> list[dict]:
+        """Load raw event dictionaries from the base file and segments."""
+        records: list[dict] = []
+        for path in self.segment_files():
+            records.extend(_read_jsonl(path))
+        return records
+
+    def iter_raw(self) -> Iterator[dict]:
+        """Stream records from the base file and segments, one line at a time."""
+        for path in self.segment_files():
+            yield from _iter_jsonl(path)
+
+    def append_raw(self, records: list[dict]) -> None:
+        """Append records to the active segment and fsync.
+
+        A torn final line left by an interrupted write is terminated with a
+        newline first, so it is skipped on load without corrupting the
+        first record of this append.
+        """
+        if not records:
+            return
+        self._dir.mkdir(parents=True, exist_ok=True)
+        base, segments = self._scan()
+
+        if segments and segments[-1][1].stat().st_size < self._segment_max_bytes:
+            seq, path = segments[-1]
+        else:
+            seq = self._next_seq(base, segments)
+            path = self._dir / f"{_SEGMENT_PREFIX}{seq:08d}{_SEGMENT_SUFFIX}"
+            segments.append((seq, path))
+
+        payload = b"".join(_encode_line(r) for r in records)
+        with open(path, "ab+") as f:
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    payload = b"\n" + payload
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+
+        if len(segments) > self._max_segments:
+            self.compact()
+
+    def rewrite_raw(self, records: list[dict]) -> None:
+        """Write records as a new base file and drop everything older."""
+        self._dir.mkdir(parents=True, exist_ok=True)
+        base, segments = self._scan()
+        seq = self._next_seq(base, segments)
+        final = self._dir / f"{_BASE_PREFIX}{seq:08d}{_SEGMENT_SUFFIX}"
+        tmp_path = final.with_suffix(".jsonl.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(b"".join(_encode_line(r) for r in records))
+                f.flush()
+                os.fsync(f.fileno())
+            tmp_path.rename(final)
+        except OSError:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+        _fsync_dir(self._dir)
+        self._remove_superseded(seq)
+
+    def compact(self) -> None:
+        """Merge the base file and all segments into a single new base."""
+        self.rewrite_raw(self.load_raw())
+
+    def _scan(self) -> tuple[tuple[int, Path] | None, list[tuple[int, Path]]]:
+        """Return (newest base, live segments after it) sorted by sequence."""
+        if not self._dir.exists():
+            return None, []
+        bases: list[tuple[int, Path]] = []
+        segments: list[tuple[int, Path]] = []
+        for path in self._dir.iterdir():
+            seq = _parse_seq(path.name)
+            if seq is None:
+                continue
+            if path.name.startswith(_BASE_PREFIX):
+                bases.append((seq, path))
+            else:
+                segments.append((seq, path))
+        base = max(bases) if bases else None
+        floor = base[0] if base else -1
+        return base, sorted(s for s in segments if s[0] > floor)
+
+    @staticmethod
+    def _next_seq(base: tuple[int, Path] | None, segments: list[tuple[int, Path]]) -> int:
+        last = max([seq for seq, _ in segments] + ([base[0]] if base else [0]))
+        return last + 1
+
+    def _remove_superseded(self, base_seq: int) -> None:
+        """Delete files made obsolete by the base file at base_seq."""
+        for path in self._dir.iterdir():
+            seq = _parse_seq(path.name)
+            if seq is not None and seq < base_seq:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def _migrate_legacy(self) -> None:
+        """Import events.json from the JSON array backend, once."""
+        legacy = self._project_dir / "events.json"
+        if not legacy.exists() or self.segment_files():
+            return
+        records = JsonArrayBackend(self._project_dir).load_raw()
+        self.rewrite_raw(records)
+        legacy.rename(legacy.with_suffix(".json.migrated"))
+
+
+def open_backend(project_dir: Path, config: CortexConfig) -> StorageBackend:
+    """Return the storage backend selected by config.store_backend.
+
+    Unknown backend names fall back to the JSON array backend — Cortex
+    should always start, even with a mistyped config value.
+    """
+    if config.store_backend == BACKEND_JSONL:
+        return JsonlSegmentBackend(
+            project_dir,
+            segment_max_bytes=config.segment_max_bytes,
+            max_segments=config.max_segments,
+        )
+    return JsonArrayBackend(project_dir)
+
+
+def _encode_line(record: dict) -> bytes:
+    """Serialize one record as a compact JSONL line."""
+    return codec.dumps(record) + b"\n"
+
+
+def _read_jsonl(path: Path) -> list[dict]:
+    """Read one segment file, skipping blank, torn, or malformed lines."""
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return []
+    return list(_decode_lines(data.splitlines()))
+
+
+def _iter_jsonl(path: Path) -> Iterator[dict]:
+    """Like _read_jsonl(), but reads and decodes one line at a time."""
+    try:
+        f = open(path, "rb")
+    except OSError:
+        return
+    with f:
+        yield from _decode_lines(f)
+
+
+def _decode_lines(lines: Iterable[bytes]) -> Iterator[dict]:
+    """Decode JSONL lines, skipping blank, torn, or malformed ones."""
+    loads = codec.active_codec().loads
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = loads(line)
+        except ValueError:
+            continue
+        if isinstance(record, dict):
+            yield record
+
+
+def stat_token(path: Path) -> str:
+    """Return "inode:size:mtime_ns" for path, or "" if it does not exist.
+
+    The inode changes on every atomic temp-file rename, so rewrites are
+    detected even on filesystems with coarse mtime resolution.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return ""
+    return f"{st.st_ino}:{st.st_size}:{st.st_mtime_ns}"
+
+
+def _parse_seq(name: str) -> int | None:
+    """Extract the sequence number from a base/segment file name."""
+    if not name.endswith(_SEGMENT_SUFFIX):
+        return None
+    for prefix in (_BASE_PREFIX, _SEGMENT_PREFIX):
+        if name.startswith(prefix):
+            digits = name[len(prefix) : -len(_SEGMENT_SUFFIX)]
+            return int(digits) if digits.isdigit() else None
+    return None
+
+
+def _fsync_dir(path: Path) -> None:
+    """fsync a directory so a rename inside it survives a crash."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
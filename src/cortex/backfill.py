@@ -0,0 +1,264 @@
+"""Bulk ingestion of a project's historical Claude Code transcripts.
+
+The Stop hook only ever sees the transcript of the session that just
+ended. Backfill walks every main-session transcript in the project's
+~/.claude/projects/<encoded-path>/ directory and runs the same
+extraction pipeline over each one, so a project with months of history
+can be onboarded in one command.
+
+- Streaming: each file is read with TranscriptReader.iter_new() and the
+  extraction prefilter, so memory is bounded by one entry at a time.
+- Parallel: files are spread across a process pool; each worker parses
+  its own file, so only the extracted events cross process boundaries.
+- Resumable: the byte offset reached in each file is saved to
+  backfill.json as soon as that file's events are stored. An interrupted
+  run picks up where it stopped, and a repeat run only reads what the
+  transcripts gained since.
+"""
+
+import json
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from cortex.config import CortexConfig, get_project_dir
+from cortex.extractors import DEFAULT_REGISTRY, extract_events
+from cortex.store import open_store
+from cortex.transcript import TranscriptReader, find_session_transcripts
+
+
+@dataclass
+class FileResult:
+    """Outcome of extracting one transcript file.
+
+    Attributes:
+        path: Transcript path as a string.
+        events: Events extracted from the new part of the file.
+        start_offset: Byte offset reading started from.
+        end_offset: Byte offset to resume from next time.
+        entries: Entries decoded.
+        lines_skipped: Lines rejected by the prefilter.
+    """
+
+    path: str
+    events: list = field(default_factory=list)
+    start_offset: int = 0
+    end_offset: int = 0
+    entries: int = 0
+    lines_skipped: int = 0
+
+    @property
+    def bytes_read(self) -> int:
+        return self.end_offset - self.start_offset
+
+
+@dataclass
+class BackfillReport:
+    """Totals for one backfill run."""
+
+    files_total: int = 0
+    files_read: int = 0
+    bytes_read: int = 0
+    entries: int = 0
+    lines_skipped: int = 0
+    events_extracted: int = 0
+    events_added: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def mb_per_second(self) -> float:
+        if self.elapsed <= 0:
+            return 0.0
+        return self.bytes_read / (1024 * 1024) / self.elapsed
+
+    @property
+    def entries_per_second(self) -> float:
+        if self.elapsed <= 0:
+            return 0.0
+        return self.entries / self.elapsed
+
+
+class BackfillState:
+    """Per-file resume offsets for backfill.
+
+    Stored in ~/.cortex/projects/<hash>/backfill.json as
+    {"offsets": {"<transcript path>": <byte offset>}}.
+    """
+
+    def __init__(self, project_hash: str, config: CortexConfig | None = None):
+        self._config = config or CortexConfig()
+        self._project_dir = get_project_dir(project_hash, self._config)
+        self._state_path = self._project_dir / "backfill.json"
+
+    @property
+    def state_path(self) -> Path:
+        """Path to the backfill.json file."""
+        return self._state_path
+
+    def load(self) -> dict[str, int]:
+        """Return saved offsets by transcript path ({} if none or unreadable)."""
+        if not self._state_path.exists():
+            return {}
+        try:
+            data = json.loads(self._state_path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            return {}
+        offsets = data.get("offsets", {}) if isinstance(data, dict) else {}
+        return {path: offset for path, offset in offsets.items() if isinstance(offset, int)}
+
+    def save(self, offsets: dict[str, int]) -> None:
+        """Save offsets atomically."""
+        self._project_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._state_path.with_suffix(".json.tmp")
+        try:
+            tmp_path.write_text(json.dumps({"offsets": offsets}, indent=2), encoding="utf-8")
+            tmp_path.rename(self._state_path)
+        except OSError:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+
+    def clear(self) -> None:
+        """Forget all offsets so the next backfill starts from scratch."""
+        try:
+            self._state_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def extract_file(path: str, from_offset: int = 0, project: str = "", git_branch: str = "") -> FileResult:
+    """Extract events from one transcript starting at from_offset.
+
+    Runs in worker processes, so it takes and returns only picklable
+    values. The file stem is the default session ID: Claude Code names
+    main-session transcripts <session-uuid>.jsonl.
+    """
+    reader = TranscriptReader(Path(path))
+    events = extract_events(
+        reader.iter_new(from_offset=from_offset, prefilter=DEFAULT_REGISTRY.prefilter()),
+        session_id=Path(path).stem,
+        project=project,
+        git_branch=git_branch,
+    )
+    return FileResult(
+        path=path,
+        events=events,
+        start_offset=from_offset,
+        end_offset=max(reader.last_offset, from_offset),
+        entries=reader.entries_read,
+        lines_skipped=reader.lines_skipped,
+    )
+
+
+def backfill_project(
+    project_hash: str,
+    transcript_dir: Path,
+    config: CortexConfig | None = None,
+    project: str = "",
+    git_branch: str = "",
+    max_workers: int | None = None,
+    on_file: Callable[[FileResult], None] | None = None,
+) -> BackfillReport:
+    """Ingest every main-session transcript in transcript_dir.
+
+    Files are processed oldest first. Each file's events are appended to
+    the store, then its offset is saved, in that order, so an interrupted
+    run never skips events. Events stored twice after a crash between
+    the two writes are dropped by the store's content-hash dedup.
+
+    Args:
+        project_hash: Project whose store receives the events.
+        transcript_dir: The project's Claude Code transcript directory.
+        config: Cortex configuration.
+        project: Project identifier recorded on events.
+        git_branch: Fallback git branch (entries usually carry their own).
+        max_workers: Worker processes; defaults to os.cpu_count().
+            One worker, or a single file to read, runs in-process.
+        on_file: Called with each FileResult once it is stored.
+
+    Returns:
+        A BackfillReport with totals and throughput.
+    """
+    config = config or CortexConfig()
+    started = time.perf_counter()
+    report = BackfillReport()
+    state = BackfillState(project_hash, config)
+    offsets = state.load()
+
+    pending: list[tuple[str, int]] = []
+    for path in find_session_transcripts(transcript_dir):
+        report.files_total += 1
+        key = str(path)
+        offset = offsets.get(key, 0)
+        try:
+            size = path.stat().st_size
+        except OSError:
+            continue
+        if offset > size:
+            # WHAT: Start over on a file that shrank.
+            # WHY: It was truncated or replaced; the old offset is meaningless.
+            offset = 0
+        if offset < size:
+            pending.append((key, offset))
+
+    store = open_store(project_hash, config)
+    count_before = store.count()
+    try:
+        for result in _extract_all(pending, project, git_branch, max_workers):
+            if result.events:
+                store.append_many(result.events)
+            offsets[result.path] = result.end_offset
+            state.save(offsets)
+
+            report.files_read += 1
+            report.bytes_read += result.bytes_read
+            report.entries += result.entries
+            report.lines_skipped += result.lines_skipped
+            report.events_extracted += len(result.events)
+            if on_file is not None:
+                on_file(result)
+        report.events_added = store.count() - count_before
+    finally:
+        close = getattr(store, "close", None)
+        if close is not None:
+            close()
+
+    report.elapsed = time.perf_counter() - started
+    return report
+
+
+def _extract_all(
+    pending: list[tuple[str, int]],
+    project: str,
+    git_branch: str,
+    max_workers: int | None,
+):
+    """Yield a FileResult per pending (path, offset), in pending order."""
+    workers = min(max_workers or os.cpu_count() or 1, len(pending))
+    done = 0
+    if workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                # WHAT: One task per file, results in submission order.
+                # WHY: Offsets are committed oldest file first, and the
+                # store sees events in the same order as a serial run.
+                for result in pool.map(
+                    extract_file,
+                    [path for path, _ in pending],
+                    [offset for _, offset in pending],
+                    [project] * len(pending),
+                    [git_branch] * len(pending),
+                ):
+                    done += 1
+                    yield result
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            # WHAT: Finish in-process if the pool cannot start or dies.
+            # WHY: Results already yielded are stored and their offsets
+            # saved; the remaining files are simply read serially.
+            pass
+    for path, offset in pending[done:]:
+        yield extract_file(path, offset, project, git_branch)
@@ -5,22 +5,38 @@ Converts stored events into a markdown context document loaded at session start
 tiered inclusion (immortal, active plan, recent).
 """
 
+import hashlib
+import json
+import os
+import time
 from pathlib import Path
 
-from cortex.config import CortexConfig, load_config
+from cortex.config import CortexConfig, get_project_dir, load_config
 from cortex.models import Event
 from cortex.project import get_project_hash
-from cortex.store import EventStore
+from cortex.sqlite_store import SQLiteEventStore
+from cortex.store import EventStore, open_store
 
 # Approximate characters per token for budget enforcement (conservative for English/code).
 CHARS_PER_TOKEN = 4
 
+# WHAT: How long a cached briefing may be served while the store is unchanged.
+# WHY: Decay scales every event's salience by the same factor per hour, so
+# the salience ranking (and the briefing text) only changes when the store
+# does. Events with no parseable accessed_at do not decay, though, so a
+# day-old entry is re-rendered to bound drift for such legacy data.
+CACHE_MAX_AGE_SECONDS = 24 * 3600
+
+# Cached briefings kept per project (one per branch and config in use).
+_CACHE_MAX_ENTRIES = 16
+
 
 def generate_briefing(
     project_hash: str | None = None,
     project_path: str | None = None,
     config: CortexConfig | None = None,
     branch: str | None = None,
+    store: "EventStore | SQLiteEventStore | None" = None,
 ) -> str:
     """Generate a markdown briefing from stored events for the given project.
 
@@ -33,6 +49,7 @@ def generate_briefing(
                       via get_project_hash(project_path). Ignored if project_hash set.
         config: Optional config. Defaults to load_config().
         branch: Optional git branch filter for events.
+        store: Already-open store for the project. Defaults to open_store().
 
     Returns:
         Markdown string suitable for cortex-briefing.md.
@@ -47,9 +64,17 @@ def generate_briefing(
         project_hash = get_project_hash(project_path)
 
     config = config or load_config()
-    store = EventStore(project_hash, config)
-    data = store.load_for_briefing(branch=branch)
+    if store is None:
+        store = open_store(project_hash, config)
+    content, _ = _render(store.load_for_briefing(branch=branch), config)
+    return content
+
 
+def _render(data: dict[str, list[Event]], config: CortexConfig) -> tuple[str, list[str]]:
+    """Render load_for_briefing() output within the budget.
+
+    Returns the markdown and the ids of the events it shows.
+    """
     immortal = data["immortal"]
     active_plan = data["active_plan"]
     recent = data["recent"]
@@ -59,14 +84,17 @@ def generate_briefing(
     max_summary = config.max_summary_decisions
 
     parts: list[str] = []
+    shown: list[str] = []
     used = 0
 
-    def add(s: str) -> bool:
+    def add(s: str, event: Event | None = None) -> bool:
         nonlocal used
         if used + len(s) > max_chars:
             return False
         parts.append(s)
         used += len(s)
+        if event is not None:
+            shown.append(event.id)
         return True
 
     # Section: Decisions & Rejections (immortal)
@@ -75,39 +103,39 @@ def generate_briefing(
 
     if full_immortal or summary_immortal:
         if not add("# Decisions & Rejections\n\n"):
-            return "".join(parts)
+            return "".join(parts), shown
         for e in full_immortal:
             line = _format_event_line(e, full=True)
-            if not add(line):
-                return "".join(parts)
+            if not add(line, e):
+                return "".join(parts), shown
         for e in summary_immortal:
             line = _format_event_line(e, full=False)
-            if not add(line):
-                return "".join(parts)
+            if not add(line, e):
+                return "".join(parts), shown
         if not add("\n"):
-            return "".join(parts)
+            return "".join(parts), shown
 
     # Section: Active Plan
     if active_plan:
         if not add("## Active Plan\n\n"):
-            return "".join(parts)
+            return "".join(parts), shown
         for e in active_plan:
             line = _format_event_line(e, full=True)
-            if not add(line):
-                return "".join(parts)
+            if not add(line, e):
+                return "".join(parts), shown
         if not add("\n"):
-            return "".join(parts)
+            return "".join(parts), shown
 
     # Section: Recent Context
     if recent:
         if not add("## Recent Context\n\n"):
-            return "".join(parts)
+            return "".join(parts), shown
         for e in recent:
             line = _format_event_line(e, full=True)
-            if not add(line):
-                return "".join(parts)
+            if not add(line, e):
+                return "".join(parts), shown
 
-    return "".join(parts)
+    return "".join(parts), shown
 
 
 def _format_event_line(event: Event, full: bool = True) -> str:
@@ -129,25 +157,147 @@ def write_briefing_to_file(
     project_path: str | None = None,
     config: CortexConfig | None = None,
     branch: str | None = None,
-) -> None:
+    store: "EventStore | SQLiteEventStore | None" = None,
+) -> bool:
     """Generate a briefing and write it to a file for use by Phase 6 hooks.
 
     Creates parent directories if needed. Typical output_path:
     .claude/rules/cortex-briefing.md
 
+    The rendered briefing is served from BriefingCache while the store's
+    generation is unchanged, and the file is left untouched (no mtime
+    change) when it already holds the same content. With
+    config.mark_briefing_accessed, the events a fresh render shows are
+    marked accessed.
+
     Args:
         output_path: File path to write the markdown briefing.
         project_hash: 16-char project hash. If None, project_path must be set.
         project_path: Project directory path (used to derive project_hash if needed).
         config: Optional config. Defaults to load_config().
         branch: Optional git branch filter for events.
+        store: Already-open store for the project. Defaults to open_store().
+
+    Returns:
+        True if the file was written, False if it was already current.
+
+    Raises:
+        ValueError: If neither project_hash nor project_path is provided.
     """
+    if project_hash is None and project_path is None:
+        raise ValueError("Either project_hash or project_path must be provided")
+    if project_hash is None:
+        assert project_path is not None  # Guaranteed by check above
+        project_hash = get_project_hash(project_path)
+
+    config = config or load_config()
+    if store is None:
+        store = open_store(project_hash, config)
+
+    # WHAT: Read the generation before rendering.
+    # WHY: If a write lands in between, the entry is filed under the older
+    # generation, so the next call misses instead of serving stale text.
+    cache = BriefingCache(project_hash, config)
+    generation = store.generation()
+    content = cache.get(branch, generation)
+    if content is None:
+        content, shown = _render(store.load_for_briefing(branch=branch), config)
+        cacheable = True
+        if config.mark_briefing_accessed and shown:
+            # WHAT: Mark what was shown accessed, then file the entry under
+            # the generation that includes those accesses, unless another
+            # write landed while rendering; then leave it uncached.
+            # WHY: mark_accessed() is a write; keyed by the older generation
+            # the entry would miss on every call. Keyed by the newer one it
+            # would also cover the other write, whose events it never saw.
+            # Accesses only move events already shown, so the cached text
+            # can at most lag their order in "recent" until the next write.
+            cacheable = store.generation() == generation
+            store.mark_accessed(shown)
+            generation = store.generation()
+        if cacheable:
+            cache.put(branch, generation, content)
+
     output_path = Path(output_path)
+    try:
+        if output_path.read_text(encoding="utf-8") == content:
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    content = generate_briefing(
-        project_hash=project_hash,
-        project_path=project_path,
-        config=config,
-        branch=branch,
-    )
     output_path.write_text(content, encoding="utf-8")
+    return True
+
+
+def config_fingerprint(config: CortexConfig) -> str:
+    """Short hash of every config value, for keying cached briefings."""
+    encoded = json.dumps(config.to_dict(), sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+class BriefingCache:
+    """Rendered briefings for one project, keyed by branch and config.
+
+    Stored in ~/.cortex/projects/<hash>/briefing-cache.json as
+    {"entries": {"<branch>:<config fingerprint>": {"generation",
+    "rendered_at", "content"}}}. An entry is served only while the store
+    generation it was rendered from is still current and it is younger
+    than CACHE_MAX_AGE_SECONDS. Any read or write failure is a miss.
+
+    A lookup is not a single stat: it reads the store generation (one
+    stat for events.json, a directory listing plus one stat per segment
+    for JSONL, stats of events.db and its WAL for SQLite) and parses the
+    whole cache file, which holds up to _CACHE_MAX_ENTRIES briefings.
+    """
+
+    def __init__(self, project_hash: str, config: CortexConfig | None = None):
+        self._config = config or CortexConfig()
+        self._path = get_project_dir(project_hash, self._config) / "briefing-cache.json"
+        self._fingerprint = config_fingerprint(self._config)
+
+    @property
+    def path(self) -> Path:
+        """Path to the briefing-cache.json file."""
+        return self._path
+
+    def get(self, branch: str | None, generation: str, now: float | None = None) -> str | None:
+        """Return the cached briefing for branch at generation, or None."""
+        entry = self._load().get(self._key(branch))
+        if entry is None or entry.get("generation") != generation:
+            return None
+        now = time.time() if now is None else now
+        rendered_at = entry.get("rendered_at")
+        if not isinstance(rendered_at, (int, float)) or not 0 <= now - rendered_at < CACHE_MAX_AGE_SECONDS:
+            return None
+        content = entry.get("content")
+        return content if isinstance(content, str) else None
+
+    def put(self, branch: str | None, generation: str, content: str, now: float | None = None) -> None:
+        """Record content as the briefing for branch at generation."""
+        entries = self._load()
+        entries.pop(self._key(branch), None)
+        entries[self._key(branch)] = {
+            "generation": generation,
+            "rendered_at": time.time() if now is None else now,
+            "content": content,
+        }
+        # Entries are kept in insertion order, so the oldest go first.
+        for key in list(entries)[:-_CACHE_MAX_ENTRIES]:
+            del entries[key]
+        tmp_path = self._path.with_suffix(f".json.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(json.dumps({"entries": entries}), encoding="utf-8")
+            tmp_path.rename(self._path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+    def _key(self, branch: str | None) -> str:
+        return f"{branch or ''}:{self._fingerprint}"
+
+    def _load(self) -> dict[str, dict]:
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            return {}
+        entries = data.get("entries", {}) if isinstance(data, dict) else {}
+        return {key: entry for key, entry in entries.items() if isinstance(entry, dict)}
@@ -0,0 +1,531 @@
+"""Materialized briefing view for the file-backed event store.
+
+EventStore.load_for_briefing() used to decode every stored event, filter
+by branch and sort the lot by effective salience on each call. The view
+keeps just the events a briefing can draw from in a sidecar file
+(briefing-view.json), updated as events are appended or accessed, so a
+briefing costs O(K + immortal events + active plan) instead of O(N log N).
+
+Per branch filter, the view holds:
+
+- immortal: every immortal event
+- plans: the latest PLAN_CREATED and the PLAN_STEP_COMPLETED events
+  created since (the active plan is picked from these). When a newer
+  plan arrives, the older events move to "extras" or "top" and compete
+  for "recent" like any other; immortal ones stay in "immortal" too
+- extras: events whose salience does not decay (no parseable accessed_at,
+  accessed_at in the future, or zero salience); always scored exactly
+- top: a min-heap of the 2K decaying events with the highest decay key,
+  K being CortexConfig.briefing_recent_limit
+
+Decay multiplies every event's salience by DEFAULT_DECAY_RATE per hour
+since its last access, so ranking by effective salience at any moment is
+ranking by log(salience) - log(rate) * hours(accessed_at), which does not
+depend on "now". The heap holds twice the number of events a briefing
+shows; candidates are re-scored exactly at query time, so rounding
+between the two orderings cannot change which events are chosen.
+
+Like hashes.idx, the file is stamped with the store fingerprint (backend
+plus access journal) of the store state it describes. If the store
+changes without the view (a crash between the two writes, another tool,
+another backend) the stamp no longer matches and the view is rebuilt
+from a full load.
+
+Appends are logged rather than rewritten: each one adds a line to
+briefing-view.log, and loading replays the log over the snapshot. The
+snapshot holds every immortal event once per branch filter, so
+rewriting it would make a Stop hook's append cost grow with the history.
+Any other change, or a log past _LOG_FOLD_BYTES, writes a new snapshot.
+"""
+
+import heapq
+import math
+import os
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+
+from cortex import codec
+from cortex.models import DEFAULT_DECAY_RATE, Event, EventType, created_key, decay_us, epoch_now_us
+
+_VERSION = 2
+
+# WHAT: Branch filters kept in the view at once.
+# WHY: Every kept filter is updated on every append; a long-lived project
+# can see many branches, but only the recent few are ever briefed.
+_MAX_BRANCHES = 8
+
+# WHAT: Log size at which the next save writes a full snapshot instead.
+# WHY: Every fresh process replays the log on load; past this size that
+# costs more than the snapshot write it saved.
+_LOG_FOLD_BYTES = 256 * 1024
+
+_PLAN_TYPES = (EventType.PLAN_CREATED, EventType.PLAN_STEP_COMPLETED)
+_LOG_DECAY = math.log(DEFAULT_DECAY_RATE)
+# created_key() of no plan at all; stored as plan_key None (JSON has no -inf)
+_NO_PLAN = float("-inf")
+
+
+def select_for_briefing(events: Iterable[Event], branch: str | None, now: datetime, limit: int) -> dict:
+    """Pick the briefing sections from events, in store order, in one pass.
+
+    The reference computation behind EventStore.load_for_briefing(); the
+    view must always agree with it (see EventStore.verify_briefing_view()).
+    events may be a stream straight from the backend: only immortal and
+    plan events and the best `limit` of the rest are held at once.
+
+    Args:
+        events: Every stored event in insertion order.
+        branch: Optional git branch filter.
+        now: Time to compute effective salience at.
+        limit: Number of events in the "recent" section.
+
+    Returns:
+        Dict with "immortal", "active_plan", and "recent" keys.
+    """
+    key = branch or ""
+    immortal: list[Event] = []
+    plans: list[tuple[int, Event]] = []
+
+    def others():
+        for seq, event in enumerate(events):
+            if not _matches(event, key):
+                continue
+            if event.immortal:
+                immortal.append(event)
+            if event.type in _PLAN_TYPES:
+                plans.append((seq, event))
+            elif not event.immortal:
+                yield seq, event
+
+    stream = others()
+    top = _top_recent(stream, limit, now)
+    for _ in stream:  # nlargest() reads nothing when limit <= 0
+        pass
+
+    # Immortal events (decisions, rejections) sorted by recency
+    immortal.sort(key=created_key, reverse=True)
+    active_plan = _active_plan([event for _, event in plans])
+
+    # Recent events: top by effective salience, excluding already-included
+    # events. Plan events outside the active plan compete with the rest.
+    # WHY filtering by id after the top-K is exact: copies of an event
+    # share its id, type and immortality, so only plan events (never in
+    # the heap) can match an active-plan id.
+    included_ids = {e.id for e in immortal} | {e.id for e in active_plan}
+    candidates = [(seq, e) for seq, e in plans if not e.immortal and e.id not in included_ids]
+    candidates.extend((seq, e) for seq, e in top if e.id not in included_ids)
+
+    return {
+        "immortal": immortal,
+        "active_plan": active_plan,
+        "recent": [event for _, event in _top_recent(candidates, limit, now)],
+    }
+
+
+def _top_recent(pairs: Iterable[tuple[int, Event]], limit: int, now: datetime) -> list[tuple[int, Event]]:
+    """The limit (seq, event) pairs with the highest effective salience, best first.
+
+    A bounded heap over a stream: O(N log K) time, O(K) memory. Equal
+    scores go to the lower seq, as in a stable descending sort.
+    """
+    score = _salience_key(now)
+    return heapq.nlargest(limit, pairs, key=lambda pair: (score(pair[1]), -pair[0]))
+
+
+def _active_plan(events: list[Event]) -> list[Event]:
+    """Most recent PLAN_CREATED + its PLAN_STEP_COMPLETED events."""
+    plan_events = sorted(
+        [e for e in events if e.type == EventType.PLAN_CREATED],
+        key=created_key,
+        reverse=True,
+    )
+    if not plan_events:
+        return []
+    latest_plan = plan_events[0]
+    # Find completed steps that came after this plan was created
+    plan_created = created_key(latest_plan)
+    completed_steps = [e for e in events if e.type == EventType.PLAN_STEP_COMPLETED and created_key(e) >= plan_created]
+    return [latest_plan, *sorted(completed_steps, key=created_key)]
+
+
+def _salience_key(now: datetime):
+    """Sort key giving effective_salience(event, now), with now converted once."""
+    now_us = epoch_now_us(now)
+
+    def key(event: Event) -> float:
+        if event.immortal:
+            return event.salience
+        return decay_us(event.salience, event.accessed_us, now_us)
+
+    return key
+
+
+def _decay_key(event: Event, now_us: int) -> float | None:
+    """Time-invariant rank key for a decaying event, or None if it does not decay."""
+    accessed = event.accessed_us
+    if event.immortal or accessed is None:
+        return None
+    try:
+        if accessed > now_us or event.salience <= 0:
+            return None
+        return math.log(event.salience) - _LOG_DECAY * accessed / 10**6 / 3600
+    except (ValueError, TypeError):
+        return None
+
+
+def _matches(event: Event, branch: str) -> bool:
+    return not branch or event.git_branch == branch or not event.git_branch
+
+
+class BriefingView:
+    """Sidecar materialized view of one EventStore's briefing candidates.
+
+    Snapshot format (JSON): {"version", "fingerprint", "limit", "count",
+    "branches": {"<branch or ''>": {"immortal", "plans", "extras": [[seq,
+    event]], "plan_key", "top": [[key, -seq, event]]}}}. seq is an event's
+    position in store order, which breaks salience ties the way a stable
+    sort does; plan_key is the created_key of the latest plan.
+
+    Log format (JSONL, next to the snapshot): one {"from", "to", "records"}
+    line per append, taking the view from fingerprint "from" to "to" by
+    adding records. Lines that do not continue the chain are ignored.
+    """
+
+    def __init__(self, path: Path, limit: int):
+        self._path = path
+        self._log_path = path.with_suffix(".log")
+        self._limit = max(0, limit)
+        self._fingerprint: str | None = None
+        self._count = 0
+        self._branches: dict[str, dict] = {}
+        # What save() must write: the log lines since the files on disk
+        # described _disk_fingerprint, unless a full snapshot is needed.
+        self._disk_fingerprint: str | None = None
+        self._pending: list[dict] = []
+        self._full = False
+
+    @property
+    def path(self) -> Path:
+        """Path to the briefing-view.json file."""
+        return self._path
+
+    def current(self, fingerprint: str) -> bool:
+        """Return True if the view describes the store at fingerprint.
+
+        Served from memory, or loaded from the snapshot and the log
+        when they lead to that stamp. Otherwise the view is emptied and
+        False returned.
+        """
+        if self._fingerprint == fingerprint:
+            return True
+        self._fingerprint = None
+        self._branches = {}
+        self._disk_fingerprint = None
+        self._pending = []
+        self._full = False
+        try:
+            data = codec.loads(self._path.read_bytes())
+        except (OSError, ValueError):
+            return False
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != _VERSION
+            or data.get("limit") != self._limit
+            or not isinstance(data.get("fingerprint"), str)
+            or not isinstance(data.get("branches"), dict)
+        ):
+            return False
+        self._fingerprint = data["fingerprint"]
+        self._count = data.get("count", 0)
+        self._branches = data["branches"]
+        if self._fingerprint != fingerprint:
+            self._replay_log(fingerprint)
+        if self._fingerprint != fingerprint:
+            self._fingerprint = None
+            self._branches = {}
+            self._pending = []
+            return False
+        self._disk_fingerprint = fingerprint
+        self._pending = []
+        return True
+
+    def has_branch(self, branch: str | None) -> bool:
+        """True if the (current) view holds candidates for branch."""
+        return (branch or "") in self._branches
+
+    def build(self, raw: Iterable[dict], branch: str | None, fingerprint: str) -> None:
+        """Add a view for branch from every stored event (raw, in store order).
+
+        raw may be a stream from the backend; the decaying events pass
+        through the bounded "top" heap, so they are never all held.
+        Keeps the views already held if they are current; otherwise the
+        view restarts with just this branch.
+        """
+        if self._fingerprint != fingerprint:
+            self._branches = {}
+        key = branch or ""
+        now_us = epoch_now_us()
+        view = _empty_view()
+        count = 0
+        for seq, record in enumerate(raw):
+            count += 1
+            event = Event.from_dict(record)
+            if _matches(event, key):
+                for item in _place(view, seq, event, now_us):
+                    self._push(view["top"], item)
+        self._branches.pop(key, None)
+        self._branches[key] = view
+        while len(self._branches) > _MAX_BRANCHES:
+            del self._branches[next(iter(self._branches))]
+        self._fingerprint = fingerprint
+        self._count = count
+        self._full = True
+
+    def add(self, records: list[dict], fingerprint: str) -> None:
+        """Account for records appended after the events the view describes.
+
+        Call only while current() held for the store before the append;
+        fingerprint is the store's fingerprint after it.
+        """
+        self._pending.append({"from": self._fingerprint, "to": fingerprint, "records": records})
+        now_us = epoch_now_us()
+        for offset, record in enumerate(records):
+            event = Event.from_dict(record)
+            seq = self._count + offset
+            for key, view in self._branches.items():
+                if _matches(event, key):
+                    for item in _place(view, seq, event, now_us):
+                        self._push(view["top"], item)
+        self._count += len(records)
+        self._fingerprint = fingerprint
+
+    def replace(self, records: dict[int, dict], fingerprint: str) -> None:
+        """Account for in-place updates to stored events (by seq).
+
+        Used after mark_accessed(): each event is taken out of every
+        section and placed again with its new accessed_at.
+        """
+        now_us = epoch_now_us()
+        ids = {record.get("id") for record in records.values()}
+        for key, view in self._branches.items():
+            for section in ("immortal", "plans", "extras"):
+                view[section] = [pair for pair in view[section] if pair[1].get("id") not in ids]
+            view["top"] = [item for item in view["top"] if item[2].get("id") not in ids]
+            heapq.heapify(view["top"])
+            for seq, record in records.items():
+                event = Event.from_dict(record)
+                if _matches(event, key):
+                    for item in _place(view, seq, event, now_us):
+                        self._push(view["top"], item)
+        self._fingerprint = fingerprint
+        self._full = True
+
+    def touch(self, ids: list[str], accessed_at: str, fingerprint: str) -> bool:
+        """Account for mark_accessed(ids) using the records the view holds.
+
+        Works when every id names an event the view holds in some branch
+        filter, as events taken from a briefing always are; each is then
+        re-placed like replace() does. Otherwise nothing changes and False
+        is returned: the view cannot place an event it never saw, so the
+        caller leaves it stale to be rebuilt.
+        """
+        wanted = set(ids)
+        found: dict[int, dict] = {}
+        for view in self._branches.values():
+            for section in ("immortal", "plans", "extras"):
+                found.update((seq, record) for seq, record in view[section] if record.get("id") in wanted)
+            found.update((-neg_seq, record) for _, neg_seq, record in view["top"] if record.get("id") in wanted)
+        if {record.get("id") for record in found.values()} != wanted:
+            return False
+        updated = {
+            seq: {**record, "accessed_at": accessed_at, "access_count": record.get("access_count", 0) + 1}
+            for seq, record in found.items()
+        }
+        self.replace(updated, fingerprint)
+        return True
+
+    def restamp(self, fingerprint: str) -> None:
+        """Describe the store at fingerprint, whose events read back unchanged."""
+        self._fingerprint = fingerprint
+        self._full = True
+
+    def reset(self, fingerprint: str) -> None:
+        """Describe an empty store, keeping the branch filters in use."""
+        self._branches = {key: _empty_view() for key in self._branches}
+        self._count = 0
+        self._fingerprint = fingerprint
+        self._full = True
+
+    def select(self, branch: str | None, now: datetime) -> dict:
+        """Answer load_for_briefing(branch) from the view (see select_for_briefing)."""
+        view = self._branches[branch or ""]
+        immortal = sorted(view["immortal"], key=lambda pair: pair[0])
+        immortal_events = sorted(
+            (Event.from_dict(record) for _, record in immortal),
+            key=created_key,
+            reverse=True,
+        )
+        plans = [(seq, Event.from_dict(record)) for seq, record in sorted(view["plans"], key=lambda pair: pair[0])]
+        active_plan = _active_plan([event for _, event in plans])
+
+        included_ids = {e.id for e in immortal_events} | {e.id for e in active_plan}
+        candidates = list(plans)
+        candidates.extend((seq, Event.from_dict(record)) for seq, record in view["extras"])
+        candidates.extend((-neg_seq, Event.from_dict(record)) for _, neg_seq, record in view["top"])
+        candidates = [(seq, event) for seq, event in candidates if event.id not in included_ids]
+        recent = [event for _, event in _top_recent(candidates, self._limit, now)]
+
+        return {
+            "immortal": immortal_events,
+            "active_plan": active_plan,
+            "recent": recent,
+        }
+
+    def save(self) -> None:
+        """Persist changes since the last load or save. Failing to write is not an error.
+
+        Appends since then go to the log in one write; anything else (or
+        a long log) writes a full snapshot atomically.
+        """
+        if self._fingerprint is None:
+            return
+        if not self._full:
+            if self._fingerprint == self._disk_fingerprint:
+                return
+            if self._pending and self._pending[0]["from"] == self._disk_fingerprint and self._append_log():
+                return
+        self._save_snapshot()
+
+    def _append_log(self) -> bool:
+        """Append the pending log lines; False if a snapshot is due instead."""
+        try:
+            if self._log_path.stat().st_size >= _LOG_FOLD_BYTES:
+                return False
+        except OSError:
+            pass
+        data = b"".join(codec.dumps(entry) + b"\n" for entry in self._pending)
+        try:
+            fd = os.open(self._log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+        except OSError:
+            return False
+        self._disk_fingerprint = self._fingerprint
+        self._pending = []
+        return True
+
+    def _save_snapshot(self) -> None:
+        data = {
+            "version": _VERSION,
+            "fingerprint": self._fingerprint,
+            "limit": self._limit,
+            "count": self._count,
+            "branches": self._branches,
+        }
+        tmp_path = self._path.with_suffix(".json.tmp")
+        try:
+            tmp_path.write_bytes(codec.dumps(data))
+            # The log continues the old snapshot; drop it first, so a crash
+            # in between leaves a stale view rather than a mismatched pair.
+            self._log_path.unlink(missing_ok=True)
+            tmp_path.rename(self._path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            return
+        self._disk_fingerprint = self._fingerprint
+        self._pending = []
+        self._full = False
+
+    def _replay_log(self, fingerprint: str) -> None:
+        """Apply logged appends that continue the loaded snapshot, up to fingerprint."""
+        try:
+            lines = self._log_path.read_bytes().splitlines()
+        except OSError:
+            return
+        for line in lines:
+            try:
+                entry = codec.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(entry, dict) or entry.get("from") != self._fingerprint:
+                continue
+            records, to = entry.get("records"), entry.get("to")
+            if not isinstance(records, list) or not isinstance(to, str):
+                continue
+            self.add(records, to)
+            if to == fingerprint:
+                return
+
+    @property
+    def _capacity(self) -> int:
+        return 2 * self._limit
+
+    def _push(self, heap: list, item: list) -> None:
+        if len(heap) < self._capacity:
+            heapq.heappush(heap, item)
+        elif heap and item[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, item)
+
+
+def _empty_view() -> dict:
+    return {"immortal": [], "plans": [], "plan_key": None, "extras": [], "top": []}
+
+
+def _place(view: dict, seq: int, event: Event, now_us: int) -> list[list]:
+    """File event into its sections; return the heap items it adds to "top".
+
+    A plan event that is, or could become, part of the active plan goes
+    to "plans" (and to "immortal" as well if immortal); a newer
+    PLAN_CREATED moves the events no longer in the active plan out.
+    """
+    record = event.to_dict()
+    if event.immortal:
+        view["immortal"].append([seq, record])
+    items: list[list] = []
+    if event.type in _PLAN_TYPES and _plan_candidate(view, event, items, now_us):
+        view["plans"].append([seq, record])
+    elif not event.immortal:
+        item = _rank(view, seq, event, record, now_us)
+        if item is not None:
+            items.append(item)
+    return items
+
+
+def _plan_candidate(view: dict, event: Event, items: list[list], now_us: int) -> bool:
+    """True if event belongs in "plans"; demotes events a newer plan supersedes.
+
+    _active_plan() takes the PLAN_CREATED with the highest created_key
+    and the steps created at or after it, so anything created before the
+    latest plan can never be part of the active plan again. plan_key is
+    that highest key, None while there is none (or it is unparseable:
+    every step then qualifies either way).
+    """
+    created = created_key(event)
+    floor = _NO_PLAN if view["plan_key"] is None else view["plan_key"]
+    if created < floor:
+        return False
+    if event.type == EventType.PLAN_CREATED and created > floor:
+        view["plan_key"] = created
+        kept = []
+        for seq, record in view["plans"]:
+            older = Event.from_dict(record)
+            if created_key(older) >= created:
+                kept.append([seq, record])
+            elif not older.immortal:
+                item = _rank(view, seq, older, record, now_us)
+                if item is not None:
+                    items.append(item)
+        view["plans"] = kept
+    return True
+
+
+def _rank(view: dict, seq: int, event: Event, record: dict, now_us: int) -> list | None:
+    """File a mortal event in "extras", or return its "top" heap item."""
+    key = _decay_key(event, now_us)
+    if key is None:
+        view["extras"].append([seq, record])
+        return None
+    return [key, -seq, record]
@@ -1,17 +1,22 @@
-"""CLI commands for Cortex: reset, status, init.
+"""CLI commands for Cortex: reset, status, init, backfill, daemon.
 
 Used by __main__.py. Reset clears event store and hook state for a project.
 Status prints project identity and store counts. Init prints hook JSON for
-Claude Code settings.
+Claude Code settings. Backfill ingests a project's historical transcripts.
+Daemon serves hook requests from a long-lived process.
 """
 
 import json
 import os
 import sys
 
+from cortex.backfill import BackfillState, FileResult, backfill_project
+from cortex.codec import use_codec
 from cortex.config import load_config
-from cortex.project import identify_project
-from cortex.store import EventStore, HookState
+from cortex.daemon import serve
+from cortex.project import ProjectIndex
+from cortex.store import HookState, open_store
+from cortex.transcript import find_transcript_path
 
 # Default state keys for clearing HookState (must match HookState.load() defaults).
 _RESET_STATE = {
@@ -34,13 +39,14 @@ def cmd_reset(cwd: str | None = None) -> int:
         if not work_dir:
             print("Cortex reset: no cwd.", file=sys.stderr)
             return 1
-        identity = identify_project(work_dir)
-        project_hash = identity["hash"]
         config = load_config()
-        store = EventStore(project_hash, config)
+        use_codec(config.json_codec)
+        project_hash = ProjectIndex(config).identify(work_dir)["hash"]
+        store = open_store(project_hash, config)
         state = HookState(project_hash, config)
         store.clear()
         state.save(_RESET_STATE)
+        BackfillState(project_hash, config).clear()
         print(f"Cortex memory reset for project {project_hash}.")
         return 0
     except Exception as e:
@@ -51,6 +57,7 @@ def cmd_reset(cwd: str | None = None) -> int:
 def cmd_status(cwd: str | None = None) -> int:
     """Print project identity, event count, and last extraction time.
 
+    Then lists every project Cortex has seen, from the project index.
     Uses os.getcwd() if cwd is None. Returns 0 on success, 1 on error.
     """
     try:
@@ -58,10 +65,12 @@ def cmd_status(cwd: str | None = None) -> int:
         if not work_dir:
             print("Cortex status: no cwd.", file=sys.stderr)
             return 1
-        identity = identify_project(work_dir)
-        project_hash = identity["hash"]
         config = load_config()
-        store = EventStore(project_hash, config)
+        use_codec(config.json_codec)
+        index = ProjectIndex(config)
+        identity = index.identify(work_dir)
+        project_hash = identity["hash"]
+        store = open_store(project_hash, config)
         state = HookState(project_hash, config)
         state_data = state.load()
         count = store.count()
@@ -70,12 +79,77 @@ def cmd_status(cwd: str | None = None) -> int:
         print(f"hash: {project_hash}")
         print(f"events: {count}")
         print(f"last_extraction: {last_extraction}")
+        projects = index.projects()
+        print(f"known projects: {len(projects)}")
+        for project in projects:
+            print(f"  {project['hash']}  {project['git_branch']:<20}  {project['path']}")
         return 0
     except Exception as e:
         print(f"Cortex status error: {e}", file=sys.stderr)
         return 1
 
 
+def cmd_backfill(cwd: str | None = None, max_workers: int | None = None) -> int:
+    """Ingest every historical transcript for the project in cwd.
+
+    Prints one line per transcript read and a throughput summary.
+    Safe to interrupt and re-run: per-file offsets resume where the
+    last run stopped. Returns 0 on success, 1 on error.
+    """
+    try:
+        work_dir = (os.getcwd() if cwd is None else cwd).strip()
+        if not work_dir:
+            print("Cortex backfill: no cwd.", file=sys.stderr)
+            return 1
+        transcript_dir = find_transcript_path(work_dir)
+        if transcript_dir is None:
+            print(f"Cortex backfill: no transcripts found for {work_dir}.", file=sys.stderr)
+            return 1
+        config = load_config()
+        use_codec(config.json_codec)
+        identity = ProjectIndex(config).identify(work_dir)
+
+        def on_file(result: FileResult) -> None:
+            mb = result.bytes_read / (1024 * 1024)
+            print(f"  {os.path.basename(result.path)}: {mb:.1f} MB, {len(result.events)} events")
+
+        report = backfill_project(
+            identity["hash"],
+            transcript_dir,
+            config,
+            project=identity["path"],
+            git_branch=identity["git_branch"],
+            max_workers=max_workers,
+            on_file=on_file,
+        )
+        mb = report.bytes_read / (1024 * 1024)
+        print(
+            f"backfill: {report.files_read}/{report.files_total} transcripts, {mb:.1f} MB, "
+            f"{report.entries} entries, {report.events_added} events added "
+            f"in {report.elapsed:.1f}s ({report.mb_per_second:.1f} MB/s, "
+            f"{report.entries_per_second:.0f} entries/s)"
+        )
+        return 0
+    except Exception as e:
+        print(f"Cortex backfill error: {e}", file=sys.stderr)
+        return 1
+
+
+def cmd_daemon() -> int:
+    """Serve hook requests on the daemon socket until interrupted.
+
+    Hook commands hand their payload to this process when it is running
+    and handle it themselves when it is not. Returns 0 on a clean stop,
+    1 on error (e.g. a daemon is already running).
+    """
+    try:
+        serve()
+        return 0
+    except Exception as e:
+        print(f"Cortex daemon error: {e}", file=sys.stderr)
+        return 1
+
+
 def get_init_hook_json() -> str:
     """Return the hook configuration JSON for Claude Code settings.
 
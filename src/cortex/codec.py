@@ -0,0 +1,192 @@
+"""Pluggable JSON codec for Cortex's hot decode/encode paths.
+
+JSON decoding is the largest single cost of reading big transcripts and
+event stores. This module picks the fastest available JSON library once,
+at import time, and exposes it behind a small uniform interface:
+
+- "orjson": used if importable (fastest decode and encode)
+- "msgspec": used if importable and orjson is not
+- "json": the standard library, always available
+
+CortexConfig.json_codec ("auto" by default) overrides the choice; see
+use_codec(). Every codec has the same contract:
+
+- loads(data) accepts str or UTF-8 bytes holding exactly one JSON
+  document and raises ValueError (json.JSONDecodeError and
+  UnicodeDecodeError are subclasses) on malformed input.
+- dumps(obj) returns compact UTF-8 bytes with non-ASCII left unescaped.
+- dumps_pretty(obj) uses the layout of
+  json.dumps(obj, indent=2, ensure_ascii=False): same indentation,
+  separators and key order. Number spellings can differ (orjson writes
+  1e-07 as 1e-7), so files are equal as JSON, not always byte for byte.
+
+Entry points (hooks, the daemon, CLI commands) activate the configured
+codec with use_codec(config.json_codec) after loading config.
+"""
+
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+CODEC_AUTO = "auto"
+CODEC_JSON = "json"
+CODEC_ORJSON = "orjson"
+CODEC_MSGSPEC = "msgspec"
+
+# WHAT: Preference order for automatic selection.
+_AUTO_ORDER = (CODEC_ORJSON, CODEC_MSGSPEC, CODEC_JSON)
+
+
+@dataclass(frozen=True)
+class JsonCodec:
+    """One JSON implementation behind Cortex's codec contract.
+
+    Attributes:
+        name: Codec name ("json", "orjson" or "msgspec").
+        loads: Decode one JSON document from str or bytes.
+        dumps: Encode compactly to UTF-8 bytes.
+        dumps_pretty: Encode with 2-space indentation to UTF-8 bytes.
+    """
+
+    name: str
+    loads: Callable[[str | bytes], Any]
+    dumps: Callable[[Any], bytes]
+    dumps_pretty: Callable[[Any], bytes]
+
+
+def _make_stdlib() -> JsonCodec:
+    decoder = json.JSONDecoder()
+    raw_decode = decoder.raw_decode
+
+    def loads(data: str | bytes) -> Any:
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        # WHAT: Call raw_decode() directly, falling back to json.loads().
+        # WHY: json.loads() adds a wrapper call plus two whitespace regex
+        # scans per document; on transcripts that is ~10% of decode time.
+        # raw_decode() rejects leading whitespace, which json.loads handles.
+        try:
+            obj, end = raw_decode(data)
+        except json.JSONDecodeError:
+            return json.loads(data)
+        if end != len(data) and not data[end:].isspace():
+            raise json.JSONDecodeError("Extra data", data, end)
+        return obj
+
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def dumps_pretty(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+    return JsonCodec(CODEC_JSON, loads, dumps, dumps_pretty)
+
+
+def _make_orjson() -> JsonCodec:
+    import orjson
+
+    def dumps_pretty(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    # orjson.JSONDecodeError already subclasses json.JSONDecodeError.
+    return JsonCodec(CODEC_ORJSON, orjson.loads, orjson.dumps, dumps_pretty)
+
+
+def _make_msgspec() -> JsonCodec:
+    import msgspec
+
+    decode = msgspec.json.Decoder().decode
+    encode = msgspec.json.Encoder().encode
+
+    def loads(data: str | bytes) -> Any:
+        try:
+            return decode(data)
+        except msgspec.DecodeError as e:
+            # WHAT: Re-raise as ValueError.
+            # WHY: msgspec.DecodeError is not a ValueError; callers only
+            # catch ValueError regardless of codec.
+            raise ValueError(str(e)) from None
+
+    def dumps_pretty(obj: Any) -> bytes:
+        return msgspec.json.format(encode(obj), indent=2)
+
+    return JsonCodec(CODEC_MSGSPEC, loads, encode, dumps_pretty)
+
+
+_FACTORIES: dict[str, Callable[[], JsonCodec]] = {
+    CODEC_JSON: _make_stdlib,
+    CODEC_ORJSON: _make_orjson,
+    CODEC_MSGSPEC: _make_msgspec,
+}
+
+_cache: dict[str, JsonCodec] = {}
+
+
+def get_codec(name: str) -> JsonCodec | None:
+    """Return the named codec, or None if its library is not installed.
+
+    "auto" returns the first available codec in preference order.
+    """
+    if name == CODEC_AUTO:
+        for candidate in _AUTO_ORDER:
+            codec = get_codec(candidate)
+            if codec is not None:
+                return codec
+    if name in _cache:
+        return _cache[name]
+    factory = _FACTORIES.get(name)
+    if factory is None:
+        return None
+    try:
+        codec = factory()
+    except ImportError:
+        return None
+    _cache[name] = codec
+    return codec
+
+
+def available_codecs() -> list[str]:
+    """Names of the codecs whose libraries are importable."""
+    return [name for name in _AUTO_ORDER if get_codec(name) is not None]
+
+
+def use_codec(name: str) -> JsonCodec:
+    """Make the named codec the active one for this process.
+
+    Unknown or uninstalled names fall back to "auto" — Cortex should
+    always start, even with a mistyped config value.
+
+    Returns:
+        The codec now active.
+    """
+    global _active
+    _active = get_codec(name) or get_codec(CODEC_AUTO) or _make_stdlib()
+    return _active
+
+
+def active_codec() -> JsonCodec:
+    """Return the codec currently in use.
+
+    Hot loops should bind active_codec().loads once rather than calling
+    the module-level loads() per document.
+    """
+    return _active
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode one JSON document with the active codec."""
+    return _active.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode obj compactly with the active codec."""
+    return _active.dumps(obj)
+
+
+def dumps_pretty(obj: Any) -> bytes:
+    """Encode obj with 2-space indentation with the active codec."""
+    return _active.dumps_pretty(obj)
+
+
+_active: JsonCodec = use_codec(CODEC_AUTO)
@@ -55,10 +55,46 @@ class CortexConfig:
     max_full_decisions: int = 50
     max_summary_decisions: int = 30
 
+    # WHAT: Number of non-immortal events in a briefing's "recent" section.
+    # WHY: Every store selects them with a bounded top-K in O(N log K)
+    # time and builds only K Events, so raising K costs little. The file
+    # stores stream records through the heap (O(K) memory); SQLite holds
+    # the scoring columns of all N rows so it can score them at once.
+    # Both stores read this value, so they produce identical briefings.
+    briefing_recent_limit: int = 30
+
+    # WHAT: Mark the events shown in each freshly rendered briefing as
+    # accessed (EventStore.mark_accessed), resetting their decay clocks.
+    # Their stored salience is left as is; reinforcement_multiplier only
+    # applies to models.reinforce_event().
+    # WHY: Restarting decay keeps useful context in the briefing. Off by
+    # default because it changes what later briefings show; it costs one
+    # journal append (or one indexed UPDATE on SQLite) per render.
+    mark_briefing_accessed: bool = False
+
     # Decision tiering thresholds (paper §9.4 — immortal event growth management)
     decision_active_sessions: int = 20
     decision_aging_sessions: int = 50
 
+    # WHAT: Event store persistence backend ("json", "jsonl" or "sqlite").
+    # WHY: "json" rewrites one events.json array per append (fine for
+    # hundreds of events). "jsonl" appends to fsync'd segment files so a
+    # Stop hook costs O(new events) regardless of history size. "sqlite"
+    # answers briefing queries from indexes instead of full scans.
+    store_backend: str = "json"
+
+    # JSONL segment backend tuning: roll to a new segment once the active one
+    # reaches segment_max_bytes; compact all segments into one base file once
+    # more than max_segments have accumulated.
+    segment_max_bytes: int = 4 * 1024 * 1024
+    max_segments: int = 8
+
+    # WHAT: JSON library for transcripts and the event store ("auto",
+    # "json", "orjson" or "msgspec").
+    # WHY: Decoding dominates transcript parsing; "auto" uses the fastest
+    # installed library. Pin a value to rule a library out on one machine.
+    json_codec: str = "auto"
+
     def to_dict(self) -> dict:
         """Serialize to a JSON-compatible dictionary."""
         data = asdict(self)
@@ -77,8 +113,14 @@ class CortexConfig:
             max_briefing_tokens=data.get("max_briefing_tokens", defaults.max_briefing_tokens),
             max_full_decisions=data.get("max_full_decisions", defaults.max_full_decisions),
             max_summary_decisions=data.get("max_summary_decisions", defaults.max_summary_decisions),
+            briefing_recent_limit=data.get("briefing_recent_limit", defaults.briefing_recent_limit),
+            mark_briefing_accessed=data.get("mark_briefing_accessed", defaults.mark_briefing_accessed),
             decision_active_sessions=data.get("decision_active_sessions", defaults.decision_active_sessions),
             decision_aging_sessions=data.get("decision_aging_sessions", defaults.decision_aging_sessions),
+            store_backend=data.get("store_backend", defaults.store_backend),
+            segment_max_bytes=data.get("segment_max_bytes", defaults.segment_max_bytes),
+            max_segments=data.get("max_segments", defaults.max_segments),
+            json_codec=data.get("json_codec", defaults.json_codec),
         )
 
 
@@ -0,0 +1,237 @@
+"""Long-lived Cortex server that hook invocations talk to over a Unix socket.
+
+A one-shot `cortex stop` pays for interpreter start, imports, config
+load, git subprocesses and store setup on every turn. `cortex daemon`
+pays them once: it listens on ~/.cortex/daemon.sock and runs the same
+hook handlers in-process, with a WarmEnv that keeps config, project
+identities and open stores between requests.
+
+The hook command stays the same. `cortex <hook>` first tries the socket
+(see cortex.__main__) and handles the hook itself if no daemon answers,
+so the daemon is purely an accelerator.
+
+Protocol: one request per connection. The client sends one JSON object
+and shuts down its write side:
+
+    {"command": "stop", "payload": "<raw hook stdin>"}
+
+The server answers with one JSON object and closes:
+
+    {"code": 0, "stderr": "<anything the handler logged>"}
+
+"ping" answers {"code": 0} without running a handler. A request the
+daemon cannot run (malformed, unknown command) gets "code": null, and
+the client handles the hook in-process instead, so hooks still exit 0.
+"""
+
+import contextlib
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+from collections.abc import Callable
+from pathlib import Path
+
+from cortex.backends import stat_token
+from cortex.codec import use_codec
+from cortex.config import CortexConfig, get_config_path, load_config
+from cortex.hooks import (
+    HookEnv,
+    handle_precompact,
+    handle_session_start,
+    handle_stop,
+    parse_payload,
+)
+from cortex.salience import load_numpy
+from cortex.sqlite_store import SQLiteEventStore
+from cortex.store import EventStore, open_store
+
+# WHAT: Environment variable that overrides the socket path.
+# WHY: Lets tests and side-by-side installs use their own daemon. Read
+# by the client shim in cortex.__main__ too, which keeps its own copy of
+# default_socket_path() so it can run without importing this package.
+SOCKET_ENV = "CORTEX_DAEMON_SOCKET"
+SOCKET_NAME = "daemon.sock"
+
+# WHAT: Whether this platform has Unix domain sockets.
+# WHY: Windows builds of Python lack them. There `cortex daemon` reports
+# an error and hooks simply always run in-process.
+HAS_UNIX_SOCKETS = hasattr(socket, "AF_UNIX")
+
+# Largest request accepted; hook payloads are a few hundred bytes.
+_MAX_REQUEST_BYTES = 1024 * 1024
+
+HANDLERS: dict[str, Callable[[dict, HookEnv], int]] = {
+    "stop": handle_stop,
+    "precompact": handle_precompact,
+    "session-start": handle_session_start,
+}
+
+
+def default_socket_path() -> Path:
+    """Return $CORTEX_DAEMON_SOCKET, or ~/.cortex/daemon.sock."""
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return Path(override)
+    return Path.home() / ".cortex" / SOCKET_NAME
+
+
+class WarmEnv(HookEnv):
+    """HookEnv that keeps config, identities and stores in memory.
+
+    Every cached value is keyed on a cheap stat of the files it came
+    from, so a long-lived daemon never serves anything a fresh hook
+    process would not:
+
+    - config: reloaded when config.json changes; open stores are then
+      dropped, since they were opened with the old settings.
+    - identity: identify_project() caches git info per repository
+      itself, keyed on the .git files it reads.
+    - stores: one per project, so in-memory hash sets and SQLite
+      connections are reused. Stores re-check their files on each call.
+    """
+
+    def __init__(self, cortex_home: Path | None = None):
+        self._cortex_home = cortex_home
+        self._config: CortexConfig | None = None
+        self._config_token: str | None = None
+        self._stores: dict[str, EventStore | SQLiteEventStore] = {}
+
+    def config(self) -> CortexConfig:
+        """Return the config, reloading it if config.json changed."""
+        path = self._cortex_home / "config.json" if self._cortex_home else get_config_path()
+        token = stat_token(path)
+        if self._config is None or token != self._config_token:
+            self._config = load_config(self._cortex_home)
+            use_codec(self._config.json_codec)
+            self._config_token = token
+            self.close()
+        return self._config
+
+    def store(self, project_hash: str, config: CortexConfig) -> "EventStore | SQLiteEventStore":
+        """Return the project's store, opening it on first use."""
+        store = self._stores.get(project_hash)
+        if store is None:
+            store = open_store(project_hash, config)
+            self._stores[project_hash] = store
+        return store
+
+    def close(self) -> None:
+        """Close and forget every open store."""
+        for store in self._stores.values():
+            close = getattr(store, "close", None)
+            if close is not None:
+                close()
+        self._stores = {}
+
+
+def handle_request(request: dict, env: HookEnv) -> dict:
+    """Run one decoded request and return the response object."""
+    command = request.get("command")
+    if command == "ping":
+        return {"code": 0}
+    handler = HANDLERS.get(command) if isinstance(command, str) else None
+    if handler is None:
+        return {"code": None, "stderr": f"Unknown command: {command}\n"}
+    payload = parse_payload(request.get("payload") or "")
+    # WHAT: Capture what the handler logs and send it back to the client.
+    # WHY: Handlers report errors on stderr; the hook process, not the
+    # daemon's terminal, is where Claude Code looks for them. Requests are
+    # served one at a time, so swapping sys.stderr is safe.
+    captured = io.StringIO()
+    with contextlib.redirect_stderr(captured):
+        code = handler(payload, env)
+    return {"code": code, "stderr": captured.getvalue()}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: "CortexDaemon"
+
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.read(_MAX_REQUEST_BYTES) or b"{}")
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+            response = handle_request(request, self.server.env)
+        except ValueError as e:
+            response = {"code": None, "stderr": f"[Cortex] Bad daemon request: {e}\n"}
+        except Exception as e:
+            response = {"code": 0, "stderr": f"[Cortex] Daemon error: {e}\n"}
+        # The client may already be gone (is_running() probes just connect).
+        with contextlib.suppress(OSError):
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+# Unix-only: socketserver has no UnixStreamServer elsewhere (see serve()).
+if HAS_UNIX_SOCKETS:
+
+    class CortexDaemon(socketserver.UnixStreamServer):
+        """Unix socket server running hook handlers against a WarmEnv.
+
+        Requests are served one at a time, in arrival order, which also
+        serializes every write to the stores it holds open.
+        """
+
+        def __init__(self, socket_path: Path, env: HookEnv | None = None):
+            self.socket_path = Path(socket_path)
+            self.env = env or WarmEnv()
+            self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+            _remove_stale_socket(self.socket_path)
+            super().__init__(str(self.socket_path), _RequestHandler)
+            os.chmod(self.socket_path, 0o600)
+
+        def server_close(self) -> None:
+            super().server_close()
+            with contextlib.suppress(FileNotFoundError):
+                self.socket_path.unlink()
+            close = getattr(self.env, "close", None)
+            if close is not None:
+                close()
+
+
+def is_running(socket_path: Path) -> bool:
+    """True if a daemon is accepting connections on socket_path."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(1.0)
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+def serve(socket_path: Path | None = None, env: HookEnv | None = None) -> None:
+    """Serve hook requests on socket_path until interrupted.
+
+    SIGTERM stops the server cleanly, removing the socket file.
+
+    Raises:
+        RuntimeError: If another daemon is already listening there, or
+            the platform has no Unix domain sockets.
+    """
+    if not HAS_UNIX_SOCKETS:
+        raise RuntimeError("the daemon needs Unix domain sockets, which this platform lacks")
+    socket_path = socket_path or default_socket_path()
+    signal.signal(signal.SIGTERM, _exit_on_sigterm)
+    # Import NumPy (if installed) now rather than on the first large briefing.
+    load_numpy()
+    with CortexDaemon(socket_path, env) as server:
+        print(f"Cortex daemon listening on {socket_path}", file=sys.stderr)
+        with contextlib.suppress(KeyboardInterrupt):
+            server.serve_forever()
+
+
+def _exit_on_sigterm(signum, frame) -> None:
+    raise SystemExit(0)
+
+
+def _remove_stale_socket(socket_path: Path) -> None:
+    """Delete a socket file left by a daemon that is no longer running."""
+    if not socket_path.exists():
+        return
+    if is_running(socket_path):
+        raise RuntimeError(f"a Cortex daemon is already running on {socket_path}")
+    socket_path.unlink()
@@ -5,21 +5,38 @@ Converts parsed TranscriptEntries into Cortex Events using three layers:
 - Layer 2 (Semantic): Keyword scanning — "Decision:", "Rejected:", "Fixed:" → event classification
 - Layer 3 (Explicit): [MEMORY:] tag extraction from user and assistant messages
 
-Each layer is a standalone function returning list[Event]. The pipeline
-orchestrator extract_events() runs all three and deduplicates results.
+Each layer is a standalone function returning list[Event], and is also
+registered in DEFAULT_REGISTRY (see cortex.registry), which dispatches
+each entry only to the layers that consume its record and block types.
+The pipeline orchestrator extract_events() runs the registry and
+deduplicates results. extract_events_parallel() does the same across a
+process pool for large backfills.
 """
 
+import os
 import re
+from collections.abc import Iterable, Sequence
 
 from cortex.models import EventType, content_hash, create_event
+from cortex.registry import ExtractionContext, ExtractorRegistry
 from cortex.transcript import (
+    CONTENT_TYPE_TEXT,
+    CONTENT_TYPE_TOOL_RESULT,
+    CONTENT_TYPE_TOOL_USE,
+    RECORD_TYPE_ASSISTANT,
+    RECORD_TYPE_USER,
     TranscriptEntry,
-    extract_text_content,
-    extract_tool_calls,
-    extract_tool_results,
-    strip_code_blocks,
 )
 
+# ============================================================
+# Layer 1 Constants: Structural needles
+# ============================================================
+
+# WHAT: Raw JSON text present in every line Layer 1 can act on.
+# WHY: Tool calls are "tool_use" content blocks; plan-step completions
+# need a TodoWrite toolUseResult with a non-empty newTodos list.
+STRUCTURAL_NEEDLES = ('"tool_use"', '"newTodos"')
+
 # ============================================================
 # Layer 2 Constants: Semantic keyword patterns
 # ============================================================
@@ -37,6 +54,46 @@ SEMANTIC_PATTERNS: list[tuple[re.Pattern, EventType, float]] = [
     (re.compile(r"(?m)^\s*\*{0,2}Preference:\s*(.+)"), EventType.PREFERENCE_NOTED, 0.8),
 ]
 
+
+def _combine_semantic_patterns(patterns: list) -> tuple[re.Pattern, dict[int, int]]:
+    """Compile SEMANTIC_PATTERNS into one regex that scans text once.
+
+    Each pattern becomes an alternative inside a lookahead anchored at
+    line start, so the match itself is zero-width: finditer() visits
+    every line start and reports which pattern (if any) matches there,
+    without consuming text another pattern could also match.
+
+    Returns:
+        (combined regex, {outer group number: index into patterns}).
+        The pattern's own content group is the outer group number + 1.
+    """
+    alternatives = []
+    group_to_index: dict[int, int] = {}
+    group = 1
+    for index, (pattern, _, _) in enumerate(patterns):
+        if not pattern.pattern.startswith("(?m)^"):
+            raise ValueError(f"semantic pattern must start with (?m)^: {pattern.pattern}")
+        body = pattern.pattern[len("(?m)") :]
+        if pattern.flags & re.IGNORECASE:
+            body = f"(?i:{body})"
+        alternatives.append(f"({body})")
+        group_to_index[group] = index
+        group += 1 + pattern.groups
+    combined = re.compile(r"(?m)^(?=" + "|".join(alternatives) + ")")
+    return combined, group_to_index
+
+
+# WHAT: All SEMANTIC_PATTERNS as one regex, for a single scan per message.
+# WHY: Six separate finditer() passes scanned every assistant message six
+# times; one pass over line starts finds every keyword line.
+_SEMANTIC_RE, _SEMANTIC_GROUPS = _combine_semantic_patterns(SEMANTIC_PATTERNS)
+
+# WHAT: Literal text every SEMANTIC_PATTERNS match must contain.
+# WHY: The semantic layer's prefilter needles (see DEFAULT_REGISTRY). Keep in sync
+# with SEMANTIC_PATTERNS; "Error resolved:" is case-insensitive there.
+SEMANTIC_NEEDLES = ("Decision:", "Rejected:", "Fixed:", "Learned:", "Lesson:", "TIL:", "Preference:")
+SEMANTIC_NEEDLES_IGNORE_CASE = ("Error resolved:",)
+
 # ============================================================
 # Layer 3 Constants: Explicit [MEMORY:] tag pattern
 # ============================================================
@@ -46,6 +103,7 @@ SEMANTIC_PATTERNS: list[tuple[re.Pattern, EventType, float]] = [
 # Non-greedy match avoids consuming across multiple tags on the same line.
 _MEMORY_TAG_RE = re.compile(r"\[MEMORY:\s*(.+?)\]", re.DOTALL)
 
+EXPLICIT_NEEDLES = ("[MEMORY:",)
 
 # ============================================================
 # Layer 1: Structural Extraction (tool call observation)
@@ -78,18 +136,22 @@ def extract_structural(
     Returns:
         List of Event objects extracted from tool observations.
     """
-    sid = entry.session_id or session_id
-    branch = entry.git_branch or git_branch
+    return _structural(ExtractionContext(entry, session_id, project, git_branch))
+
+
+def _structural(ctx: ExtractionContext) -> list:
+    """Layer 1 over a shared ExtractionContext (see extract_structural)."""
+    entry = ctx.entry
     events = []
 
     if entry.is_assistant:
-        for call in extract_tool_calls(entry):
-            event = _event_from_tool_call(call.name, call.input, sid, project, branch)
+        for call in ctx.tool_calls:
+            event = _event_from_tool_call(call.name, call.input, ctx.session_id, ctx.project, ctx.git_branch)
             if event is not None:
                 events.append(event)
 
     if entry.is_user:
-        events.extend(_extract_plan_step_completions(entry, sid, project, branch))
+        events.extend(_plan_step_completions(ctx))
 
     return events
 
@@ -166,8 +228,13 @@ def _extract_plan_step_completions(
     Compares oldTodos vs newTodos in the toolUseResult envelope to find
     todos that transitioned to "completed" status.
     """
+    return _plan_step_completions(ExtractionContext(entry, session_id, project, git_branch))
+
+
+def _plan_step_completions(ctx: ExtractionContext) -> list:
+    """PLAN_STEP_COMPLETED detection over a shared ExtractionContext."""
     events = []
-    for result in extract_tool_results(entry):
+    for result in ctx.tool_results:
         meta = result.metadata
         old_todos = meta.get("oldTodos", [])
         new_todos = meta.get("newTodos", [])
@@ -188,9 +255,9 @@ def _extract_plan_step_completions(
                 create_event(
                     EventType.PLAN_STEP_COMPLETED,
                     content=content,
-                    session_id=session_id,
-                    project=project,
-                    git_branch=git_branch,
+                    session_id=ctx.session_id,
+                    project=ctx.project,
+                    git_branch=ctx.git_branch,
                     metadata={"tool": "TodoWrite"},
                     provenance="structural",
                 )
@@ -240,27 +307,44 @@ def extract_semantic(
     Returns:
         List of Event objects from keyword matches.
     """
-    if not entry.is_assistant:
-        return []
+    return _semantic(ExtractionContext(entry, session_id, project, git_branch))
 
-    text = extract_text_content(entry)
-    if not text:
+
+def _semantic(ctx: ExtractionContext) -> list:
+    """Layer 2 over a shared ExtractionContext (see extract_semantic)."""
+    if not ctx.entry.is_assistant or not ctx.text:
         return []
 
-    stripped = strip_code_blocks(text)
+    stripped = ctx.stripped_text
     if not stripped.strip():
         return []
 
-    sid = entry.session_id or session_id
-    branch = entry.git_branch or git_branch
     events = []
 
-    for pattern, event_type, confidence in SEMANTIC_PATTERNS:
-        for match in pattern.finditer(stripped):
+    # WHAT: Collect matches per pattern, then emit in SEMANTIC_PATTERNS order.
+    # WHY: Keeps the event order (and so dedup winners) identical to running
+    # each pattern's finditer() in turn. A pattern's match also spans the
+    # blank lines before it and its capture may run onto the next line, so
+    # a line start inside that span is not a new match for the same pattern
+    # (finditer() would have resumed after it), though it can be for another.
+    matches: list[list[str]] = [[] for _ in SEMANTIC_PATTERNS]
+    resume_at = [0] * len(SEMANTIC_PATTERNS)
+    for match in _SEMANTIC_RE.finditer(stripped):
+        group = match.lastindex
+        # Every alternative is one outer group, so some group always matched.
+        assert group is not None
+        index = _SEMANTIC_GROUPS[group]
+        if match.start() < resume_at[index]:
+            continue
+        resume_at[index] = match.end(group)
+        matches[index].append(match.group(group + 1))
+
+    for (pattern, event_type, confidence), captured in zip(SEMANTIC_PATTERNS, matches, strict=True):
+        for raw_content in captured:
             # WHAT: Strip trailing bold markers and whitespace from capture.
             # WHY: "**Decision: Use SQLite**" captures "Use SQLite**" —
             # we need to clean the trailing markdown.
-            content = match.group(1).strip().rstrip("*").strip()
+            content = raw_content.strip().rstrip("*").strip()
             if not content:
                 continue
 
@@ -268,9 +352,9 @@ def extract_semantic(
                 create_event(
                     event_type,
                     content=content,
-                    session_id=sid,
-                    project=project,
-                    git_branch=branch,
+                    session_id=ctx.session_id,
+                    project=ctx.project,
+                    git_branch=ctx.git_branch,
                     confidence=confidence,
                     metadata={"keyword": pattern.pattern},
                     provenance="semantic",
@@ -308,15 +392,19 @@ def extract_explicit(
     Returns:
         List of Event objects from [MEMORY:] tags.
     """
+    return _explicit(ExtractionContext(entry, session_id, project, git_branch))
+
+
+def _explicit(ctx: ExtractionContext) -> list:
+    """Layer 3 over a shared ExtractionContext (see extract_explicit)."""
+    entry = ctx.entry
     if not entry.is_message:
         return []
 
-    text = extract_text_content(entry)
+    text = ctx.text
     if not text:
         return []
 
-    sid = entry.session_id or session_id
-    branch = entry.git_branch or git_branch
     source = "user" if entry.is_user else "assistant"
     events = []
 
@@ -329,9 +417,9 @@ def extract_explicit(
             create_event(
                 EventType.KNOWLEDGE_ACQUIRED,
                 content=content,
-                session_id=sid,
-                project=project,
-                git_branch=branch,
+                session_id=ctx.session_id,
+                project=ctx.project,
+                git_branch=ctx.git_branch,
                 confidence=1.0,
                 metadata={"source": source},
                 provenance="explicit",
@@ -341,52 +429,179 @@ def extract_explicit(
     return events
 
 
+# ============================================================
+# Extractor Registry
+# ============================================================
+
+# WHAT: The registry extract_events() runs by default.
+# WHY: Declaring what each layer consumes lets the pipeline skip entries
+# a layer cannot act on (snapshots, summaries, tool-result-only user
+# entries for Layer 2) without calling it, and the needles build the
+# line prefilter hooks and backfill read with: most transcript lines
+# (plain assistant text, tool output, file snapshots) cannot produce an
+# event, and a substring scan is far cheaper than JSON decoding.
+# Register additional extractors here to add them to every hook and
+# backfill; one registered without needles turns the prefilter off.
+DEFAULT_REGISTRY = ExtractorRegistry()
+DEFAULT_REGISTRY.register(
+    "structural",
+    _structural,
+    record_types=(RECORD_TYPE_ASSISTANT, RECORD_TYPE_USER),
+    block_types=(CONTENT_TYPE_TOOL_USE, CONTENT_TYPE_TOOL_RESULT),
+    needles=STRUCTURAL_NEEDLES,
+)
+DEFAULT_REGISTRY.register(
+    "semantic",
+    _semantic,
+    record_types=(RECORD_TYPE_ASSISTANT,),
+    block_types=(CONTENT_TYPE_TEXT,),
+    needles=SEMANTIC_NEEDLES,
+    ignore_case=SEMANTIC_NEEDLES_IGNORE_CASE,
+)
+DEFAULT_REGISTRY.register(
+    "explicit",
+    _explicit,
+    record_types=(RECORD_TYPE_ASSISTANT, RECORD_TYPE_USER),
+    block_types=(CONTENT_TYPE_TEXT,),
+    needles=EXPLICIT_NEEDLES,
+)
+
+
 # ============================================================
 # Pipeline Orchestration
 # ============================================================
 
 
 def extract_events(
-    entries: list[TranscriptEntry],
+    entries: Iterable[TranscriptEntry],
     session_id: str = "",
     project: str = "",
     git_branch: str = "",
+    registry: ExtractorRegistry | None = None,
 ) -> list:
     """Run all three extraction layers and return deduplicated events.
 
     This is the main entry point for the extraction pipeline.
-    Processes each TranscriptEntry through all three layers,
-    then removes duplicates by content hash.
+    Processes each TranscriptEntry through the registered extractors
+    (DEFAULT_REGISTRY unless registry is given), dropping duplicates
+    by content hash as it goes.
+
+    entries is consumed once, in order, and no entry is retained after
+    it has been processed — pass TranscriptReader.iter_new() to stream a
+    transcript with memory bounded by one entry plus the emitted events.
 
     Args:
         entries: Parsed TranscriptEntry objects (from TranscriptReader).
         session_id: Default session ID (overridden by entry-level values).
         project: Project identifier string.
         git_branch: Default git branch (overridden by entry-level values).
+        registry: Extractors to run; defaults to DEFAULT_REGISTRY.
 
     Returns:
         Deduplicated list of Event objects.
     """
-    events = []
+    run = (registry or DEFAULT_REGISTRY).run
+    seen: set[str] = set()
+    unique: list = []
     for entry in entries:
-        events.extend(extract_structural(entry, session_id, project, git_branch))
-        events.extend(extract_semantic(entry, session_id, project, git_branch))
-        events.extend(extract_explicit(entry, session_id, project, git_branch))
+        _add_unique(unique, seen, run(ExtractionContext(entry, session_id, project, git_branch)))
+
+    return unique
+
+
+# WHAT: Inputs smaller than this are extracted serially.
+# WHY: Starting a process pool and pickling entries costs ~50-100 ms,
+# more than extracting a few thousand entries in-process. Hooks handle
+# one session's new entries and should never pay that.
+PARALLEL_MIN_ENTRIES = 5000
+
+# WHAT: Shards per worker.
+# WHY: Several shards per worker evens out skew (a few entries with
+# huge TodoWrite lists or long texts) without drowning in IPC overhead.
+_SHARDS_PER_WORKER = 4
+
+
+def extract_events_parallel(
+    entries: Sequence[TranscriptEntry],
+    session_id: str = "",
+    project: str = "",
+    git_branch: str = "",
+    max_workers: int | None = None,
+    min_entries: int = PARALLEL_MIN_ENTRIES,
+) -> list:
+    """Run extract_events() across a process pool for large inputs.
+
+    entries is split into contiguous shards that worker processes extract
+    independently. Shard results are concatenated in input order and then
+    deduplicated once, so the output matches extract_events() exactly:
+    same events, same order, first occurrence kept.
+
+    Workers run DEFAULT_REGISTRY as registered at import time, and their
+    extractor stats stay in the worker processes.
+
+    Falls back to extract_events() in-process when there are fewer than
+    min_entries entries, when only one worker is available, or when a
+    process pool cannot be started.
+
+    Args:
+        entries: Parsed TranscriptEntry objects.
+        session_id: Default session ID (overridden by entry-level values).
+        project: Project identifier string.
+        git_branch: Default git branch (overridden by entry-level values).
+        max_workers: Worker processes; defaults to os.cpu_count().
+        min_entries: Smallest input that is worth a process pool.
+
+    Returns:
+        Deduplicated list of Event objects.
+    """
+    workers = max_workers or os.cpu_count() or 1
+    if workers <= 1 or len(entries) < max(min_entries, 2):
+        return extract_events(entries, session_id, project, git_branch)
+
+    # WHAT: Import the process pool only when one is used.
+    # WHY: It pulls in multiprocessing (~20 ms), which every hook
+    # invocation would otherwise pay for at import.
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+
+    shard_size = -(-len(entries) // (workers * _SHARDS_PER_WORKER))
+    shards = [entries[i : i + shard_size] for i in range(0, len(entries), shard_size)]
+    try:
+        with ProcessPoolExecutor(max_workers=min(workers, len(shards))) as pool:
+            # WHAT: pool.map yields results in submission order.
+            # WHY: Deterministic output regardless of which shard finishes first.
+            results = pool.map(
+                extract_events,
+                shards,
+                [session_id] * len(shards),
+                [project] * len(shards),
+                [git_branch] * len(shards),
+            )
+            events = [event for shard_events in results for event in shard_events]
+    except (OSError, NotImplementedError, BrokenProcessPool):
+        # WHAT: Extract in-process if the pool cannot run.
+        # WHY: Some sandboxes forbid fork or lack /dev/shm semaphores;
+        # a slow backfill beats a failed one.
+        return extract_events(entries, session_id, project, git_branch)
 
     return _deduplicate(events)
 
 
-def _deduplicate(events: list) -> list:
-    """Remove duplicate events using content hash.
+def _add_unique(unique: list, seen: set[str], events: list) -> None:
+    """Append events whose content hash has not been seen yet.
 
     Content hash is based on type + content + session_id, so the
     same fact in different sessions is preserved (stated again = signal).
     """
-    seen: set[str] = set()
-    unique = []
     for event in events:
         h = content_hash(event)
         if h not in seen:
             seen.add(h)
             unique.append(event)
+
+
+def _deduplicate(events: list) -> list:
+    """Remove duplicate events using content hash."""
+    unique: list = []
+    _add_unique(unique, set(), events)
     return unique
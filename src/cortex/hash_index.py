@@ -0,0 +1,94 @@
+"""Persistent content-hash index for event store deduplication.
+
+EventStore.append_many() must skip events whose content hash is already
+stored. Without an index that means decoding every stored event and
+hashing it on every Stop hook. The index keeps those hashes in a sidecar
+file (hashes.idx) so a dedup check is a set lookup.
+
+File format:
+    b"CXHI1:" + 32 hex chars + b"\\n"   header: digest of the store fingerprint
+    8 bytes per hash                    raw content_hash() digests, appended
+
+The header records which state of the store the hashes describe, using the
+backend's stat-based fingerprint. If the store changes behind the index's
+back (a crash between the two writes, a manual edit, another backend) the
+fingerprint no longer matches and the index is rebuilt from the store.
+"""
+
+import hashlib
+import os
+from collections.abc import Iterable
+from pathlib import Path
+
+_MAGIC = b"CXHI1:"
+_HEADER_LEN = len(_MAGIC) + 32 + 1
+_DIGEST_LEN = 8
+
+
+def digest(hex_hash: str) -> bytes:
+    """Pack a 16-char content_hash() string into its 8 raw bytes."""
+    return bytes.fromhex(hex_hash)
+
+
+class HashIndex:
+    """Sidecar set of content hashes for one event store."""
+
+    def __init__(self, path: Path):
+        self._path = path
+
+    @property
+    def path(self) -> Path:
+        """Path to the hashes.idx file."""
+        return self._path
+
+    def load(self, fingerprint: str) -> set[bytes] | None:
+        """Return the stored hashes, or None if missing or stale.
+
+        Args:
+            fingerprint: The store's current fingerprint. The index is only
+                         trusted if it was last stamped with the same one.
+        """
+        try:
+            data = self._path.read_bytes()
+        except OSError:
+            return None
+        if data[:_HEADER_LEN] != _header(fingerprint):
+            return None
+        body = memoryview(data)[_HEADER_LEN:]
+        usable = len(body) - len(body) % _DIGEST_LEN
+        return {bytes(body[i : i + _DIGEST_LEN]) for i in range(0, usable, _DIGEST_LEN)}
+
+    def write(self, hashes: Iterable[bytes], fingerprint: str) -> None:
+        """Replace the index with hashes, stamped with fingerprint."""
+        tmp_path = self._path.with_suffix(".idx.tmp")
+        try:
+            tmp_path.write_bytes(_header(fingerprint) + b"".join(hashes))
+            tmp_path.rename(self._path)
+        except OSError:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+
+    def append(self, hashes: Iterable[bytes], fingerprint: str) -> None:
+        """Append hashes and restamp the header with fingerprint.
+
+        Hashes are written before the header so an interrupted call
+        leaves a stale header, which forces a rebuild on next load.
+        """
+        payload = b"".join(hashes)
+        try:
+            with open(self._path, "r+b") as f:
+                if payload:
+                    f.seek(0, os.SEEK_END)
+                    f.write(payload)
+                    f.flush()
+                f.seek(0)
+                f.write(_header(fingerprint))
+        except FileNotFoundError:
+            return
+
+
+def _header(fingerprint: str) -> bytes:
+    """Fixed-width header identifying the store state the index describes."""
+    fp_digest = hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()[:32]
+    return _MAGIC + fp_digest.encode("ascii") + b"\n"
@@ -3,18 +3,24 @@
 Stop, PreCompact, and SessionStart handlers read JSON payloads from stdin,
 perform incremental transcript extraction and briefing generation, and always
 exit 0 so Claude Code never blocks on hook failure.
+
+Handlers get config, project identity and stores from a HookEnv. The
+default resolves everything fresh on every call, as a one-shot hook
+process must; `cortex daemon` passes one that keeps them warm between
+requests (see cortex.daemon).
 """
 
-import json
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+from cortex import codec
 from cortex.briefing import write_briefing_to_file
-from cortex.config import load_config
-from cortex.extractors import extract_events
-from cortex.project import identify_project
-from cortex.store import EventStore, HookState
+from cortex.config import CortexConfig, load_config
+from cortex.extractors import DEFAULT_REGISTRY, extract_events
+from cortex.project import ProjectIndex
+from cortex.sqlite_store import SQLiteEventStore
+from cortex.store import EventStore, HookState, open_store
 from cortex.transcript import (
     TranscriptReader,
     find_latest_transcript,
@@ -22,6 +28,31 @@ from cortex.transcript import (
 )
 
 
+class HookEnv:
+    """Source of config, project identity and stores for hook handlers.
+
+    Looks everything up fresh on each call. Subclasses may cache, as long
+    as what they return matches what a fresh lookup would.
+    """
+
+    def config(self) -> CortexConfig:
+        """Return the current configuration, with its JSON codec activated."""
+        config = load_config()
+        codec.use_codec(config.json_codec)
+        return config
+
+    def identify(self, cwd: str, config: CortexConfig) -> dict:
+        """Return identify_project(cwd), via the persistent project index."""
+        return ProjectIndex(config).identify(cwd)
+
+    def store(self, project_hash: str, config: CortexConfig) -> "EventStore | SQLiteEventStore":
+        """Return the event store for a project."""
+        return open_store(project_hash, config)
+
+
+_FRESH_ENV = HookEnv()
+
+
 def read_payload() -> dict:
     """Read JSON payload from stdin.
 
@@ -29,15 +60,23 @@ def read_payload() -> dict:
     Hooks must not crash the IDE.
     """
     try:
-        raw = sys.stdin.read()
+        return parse_payload(sys.stdin.read())
+    except (ValueError, OSError):
+        return {}
+
+
+def parse_payload(raw: str | bytes) -> dict:
+    """Decode a hook payload; {} if it is empty or not a JSON object."""
+    try:
         if not raw.strip():
             return {}
-        return json.loads(raw)
-    except (json.JSONDecodeError, OSError):
+        payload = codec.loads(raw)
+    except ValueError:
         return {}
+    return payload if isinstance(payload, dict) else {}
 
 
-def handle_stop(payload: dict) -> int:
+def handle_stop(payload: dict, env: HookEnv | None = None) -> int:
     """Handle Stop hook: incremental transcript extraction and event storage.
 
     If stop_hook_active is true, returns 0 immediately to avoid recursion.
@@ -45,6 +84,7 @@ def handle_stop(payload: dict) -> int:
     since last_transcript_position, extracts events, appends to store,
     updates state. On any exception logs to stderr and returns 0.
     """
+    env = env or _FRESH_ENV
     try:
         if payload.get("stop_hook_active"):
             return 0
@@ -53,17 +93,16 @@ def handle_stop(payload: dict) -> int:
         if not cwd:
             return 0
 
-        identity = identify_project(cwd)
-        project_hash = identity["hash"]
-        git_branch = identity["git_branch"]
-        session_id = payload.get("session_id", "")
         transcript_path_str = payload.get("transcript_path")
-
         if not transcript_path_str:
             return 0
 
-        config = load_config()
-        store = EventStore(project_hash, config)
+        config = env.config()
+        identity = env.identify(cwd, config)
+        project_hash = identity["hash"]
+        git_branch = identity["git_branch"]
+        session_id = payload.get("session_id", "")
+        store = env.store(project_hash, config)
         state = HookState(project_hash, config)
         state_data = state.load()
 
@@ -76,9 +115,21 @@ def handle_stop(payload: dict) -> int:
         if not transcript_path.exists():
             return 0
 
+        # WHAT: Stream entries straight into extraction, skipping lines
+        # no extractor can use before they are decoded.
+        # WHY: Marathon-session transcripts run to hundreds of MB; the
+        # pipeline holds one entry at a time instead of the whole file.
         reader = TranscriptReader(transcript_path)
-        entries = reader.read_new(from_offset=from_offset)
-        if not entries:
+        events = extract_events(
+            reader.iter_new(from_offset=from_offset, prefilter=DEFAULT_REGISTRY.prefilter()),
+            session_id=session_id,
+            project=identity.get("path", cwd),
+            git_branch=git_branch,
+        )
+        # WHAT: Count a session only if some line got past the prefilter.
+        # WHY: Lines skipped unread carry nothing to extract; the offset
+        # still moves past them.
+        if not reader.entries_read:
             state.update(
                 last_transcript_position=reader.last_offset,
                 last_transcript_path=transcript_path_str,
@@ -87,12 +138,6 @@ def handle_stop(payload: dict) -> int:
             )
             return 0
 
-        events = extract_events(
-            entries,
-            session_id=session_id,
-            project=identity.get("path", cwd),
-            git_branch=git_branch,
-        )
         if events:
             store.append_many(events)
 
@@ -109,7 +154,7 @@ def handle_stop(payload: dict) -> int:
         return 0
 
 
-def handle_precompact(payload: dict) -> int:
+def handle_precompact(payload: dict, env: HookEnv | None = None) -> int:
     """Handle PreCompact hook: optional extraction then regenerate briefing.
 
     PreCompact does not provide transcript_path; discovers transcript via
@@ -117,20 +162,21 @@ def handle_precompact(payload: dict) -> int:
     incremental extraction as Stop if transcript found, then writes
     .claude/rules/cortex-briefing.md. On exception logs to stderr and returns 0.
     """
+    env = env or _FRESH_ENV
     try:
         cwd = payload.get("cwd")
         if not cwd:
             return 0
 
-        identity = identify_project(cwd)
+        config = env.config()
+        identity = env.identify(cwd, config)
         project_hash = identity["hash"]
         git_branch = identity["git_branch"]
-        config = load_config()
+        store = env.store(project_hash, config)
 
         transcript_dir = find_transcript_path(cwd)
         transcript_path = find_latest_transcript(transcript_dir) if transcript_dir else None
         if transcript_path:
-            store = EventStore(project_hash, config)
             state = HookState(project_hash, config)
             state_data = state.load()
             last_path = state_data.get("last_transcript_path", "")
@@ -138,17 +184,15 @@ def handle_precompact(payload: dict) -> int:
             if str(transcript_path) != last_path:
                 from_offset = 0
             reader = TranscriptReader(transcript_path)
-            entries = reader.read_new(from_offset=from_offset)
-            if entries:
-                session_id = state_data.get("last_session_id", "")
-                events = extract_events(
-                    entries,
-                    session_id=session_id,
-                    project=identity.get("path", cwd),
-                    git_branch=git_branch,
-                )
-                if events:
-                    store.append_many(events)
+            events = extract_events(
+                reader.iter_new(from_offset=from_offset, prefilter=DEFAULT_REGISTRY.prefilter()),
+                session_id=state_data.get("last_session_id", ""),
+                project=identity.get("path", cwd),
+                git_branch=git_branch,
+            )
+            if events:
+                store.append_many(events)
+            if reader.entries_read or reader.lines_skipped:
                 state.update(
                     last_transcript_position=reader.last_offset,
                     last_transcript_path=str(transcript_path),
@@ -158,9 +202,10 @@ def handle_precompact(payload: dict) -> int:
         briefing_path = Path(cwd) / ".claude" / "rules" / "cortex-briefing.md"
         write_briefing_to_file(
             briefing_path,
-            project_path=cwd,
+            project_hash=project_hash,
             config=config,
             branch=git_branch or None,
+            store=store,
         )
         return 0
     except Exception as e:
@@ -168,26 +213,28 @@ def handle_precompact(payload: dict) -> int:
         return 0
 
 
-def handle_session_start(payload: dict) -> int:
+def handle_session_start(payload: dict, env: HookEnv | None = None) -> int:
     """Handle SessionStart hook: generate and write briefing for new session.
 
     Writes .claude/rules/cortex-briefing.md so the session gets current
     context. On exception logs to stderr and returns 0.
     """
+    env = env or _FRESH_ENV
     try:
         cwd = payload.get("cwd")
         if not cwd:
             return 0
 
-        identity = identify_project(cwd)
+        config = env.config()
+        identity = env.identify(cwd, config)
         git_branch = identity.get("git_branch") or None
-        config = load_config()
         briefing_path = Path(cwd) / ".claude" / "rules" / "cortex-briefing.md"
         write_briefing_to_file(
             briefing_path,
-            project_path=cwd,
+            project_hash=identity["hash"],
             config=config,
             branch=git_branch,
+            store=env.store(identity["hash"], config),
         )
         return 0
     except Exception as e:
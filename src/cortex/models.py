@@ -9,7 +9,7 @@ import enum
 import hashlib
 import uuid
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 
 class EventType(enum.Enum):
@@ -57,6 +57,8 @@ IMMORTAL_TYPES: set[EventType] = {
     EventType.APPROACH_REJECTED,
 }
 
+_TYPES_BY_VALUE: dict[str, EventType] = {t.value: t for t in EventType}
+
 # WHAT: Default decay rate applied per hour to non-immortal events.
 # WHY: 0.995/hour means a salience-0.7 event is ~0.55 after 48 hours,
 # ~0.30 after 7 days. These are initial estimates — calibrated from
@@ -68,13 +70,26 @@ DEFAULT_DECAY_RATE = 0.995
 # boosts salience by 20%, capped at 1.0.
 DEFAULT_REINFORCEMENT_MULTIPLIER = 1.2
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Sort position of a missing or unparseable timestamp: before every real one.
+_NO_TIME = float("-inf")
+
+# WHAT: The last datetime passed to epoch_now_us() and its conversion.
+# WHY: Ranking calls effective_salience(event, now) once per event with
+# the same now; converting it costs more than the decay itself.
+_last_now: tuple = (None, 0)
 
-@dataclass
+
+@dataclass(slots=True)
 class Event:
     """A single captured event in the Cortex memory system.
 
     Events are immutable facts extracted from Claude Code sessions.
     They are stored in the event store and projected into briefings.
+    Slotted, so no per-instance __dict__ is ever allocated, even with
+    the cached timestamp fields set (see scripts/benchmarks/event_memory.py).
     """
 
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -92,6 +107,35 @@ class Event:
     immortal: bool = False
     provenance: str = ""
 
+    # WHAT: Epoch microseconds parsed from created_at / accessed_at, with
+    # the string each was parsed from; filled on first use of created_us /
+    # accessed_us and never serialized.
+    # WHY: Sorting and decay ran datetime.fromisoformat() on every
+    # comparison. Keyed by the string, so assigning a new timestamp to the
+    # field is picked up. Plain fields rather than a (string, value) tuple:
+    # tuples are GC-tracked, and a tuple per event on a 50k-event load
+    # sets off full collections.
+    _created_from: str | None = field(default=None, init=False, repr=False, compare=False)
+    _created_us: int | None = field(default=None, init=False, repr=False, compare=False)
+    _accessed_from: str | None = field(default=None, init=False, repr=False, compare=False)
+    _accessed_us: int | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def created_us(self) -> int | None:
+        """created_at as epoch microseconds, or None if empty or unparseable."""
+        if self._created_from is not self.created_at:
+            self._created_us = epoch_us(self.created_at)
+            self._created_from = self.created_at
+        return self._created_us
+
+    @property
+    def accessed_us(self) -> int | None:
+        """accessed_at as epoch microseconds, or None if empty or unparseable."""
+        if self._accessed_from is not self.accessed_at:
+            self._accessed_us = epoch_us(self.accessed_at)
+            self._accessed_from = self.accessed_at
+        return self._accessed_us
+
     def to_dict(self) -> dict:
         """Serialize to a JSON-compatible dictionary."""
         return {
@@ -114,14 +158,18 @@ class Event:
     @classmethod
     def from_dict(cls, data: dict) -> "Event":
         """Deserialize from a dictionary (e.g., loaded from JSON)."""
+        # WHAT: Look up type in a dict and generate an id only if missing.
+        # WHY: EventType(value) goes through the Enum metaclass, and a
+        # get() default is evaluated even when the key is present; both
+        # ran for every event on every full load.
         return cls(
-            id=data.get("id", str(uuid.uuid4())),
+            id=data["id"] if "id" in data else str(uuid.uuid4()),
             session_id=data.get("session_id", ""),
             project=data.get("project", ""),
             git_branch=data.get("git_branch", ""),
-            type=EventType(data["type"]) if "type" in data else EventType.KNOWLEDGE_ACQUIRED,
+            type=_event_type(data["type"]) if "type" in data else EventType.KNOWLEDGE_ACQUIRED,
             content=data.get("content", ""),
-            metadata=data.get("metadata", {}),
+            metadata=data["metadata"] if "metadata" in data else {},
             salience=data.get("salience", 0.5),
             confidence=data.get("confidence", 1.0),
             created_at=data.get("created_at", ""),
@@ -132,6 +180,64 @@ class Event:
         )
 
 
+# WHAT: Names of the stored Event fields, and the value from_dict() gives
+# each when a record lacks it (id excepted: projections report "" rather
+# than a fresh random id).
+EVENT_FIELDS: tuple[str, ...] = tuple(name for name in Event.__dataclass_fields__ if not name.startswith("_"))
+_RECORD_DEFAULTS: dict = {
+    "id": "",
+    "session_id": "",
+    "project": "",
+    "git_branch": "",
+    "content": "",
+    "salience": 0.5,
+    "confidence": 1.0,
+    "created_at": "",
+    "accessed_at": "",
+    "access_count": 0,
+    "immortal": False,
+    "provenance": "",
+}
+
+
+def record_fields(record: dict, names: tuple[str, ...]) -> tuple:
+    """Values of the named fields of a stored event, without building an Event.
+
+    Values are what Event.from_dict(record) would hold: type is an
+    EventType and missing fields take from_dict()'s defaults. immortal is
+    always a bool, whatever the record stored.
+    """
+    return tuple(_record_field(record, name) for name in names)
+
+
+def check_field_names(names: tuple[str, ...]) -> None:
+    """Raise ValueError unless every name is a stored Event field."""
+    unknown = [name for name in names if name not in EVENT_FIELDS]
+    if unknown:
+        raise ValueError(f"Not Event fields: {', '.join(unknown)}")
+
+
+def _record_field(record: dict, name: str):
+    if name in record:
+        value = record[name]
+        if name == "type":
+            return _event_type(value)
+        return bool(value) if name == "immortal" else value
+    if name == "type":
+        return EventType.KNOWLEDGE_ACQUIRED
+    if name == "metadata":
+        return {}
+    return _RECORD_DEFAULTS[name]
+
+
+def _event_type(value: str) -> EventType:
+    try:
+        return _TYPES_BY_VALUE[value]
+    except (KeyError, TypeError):
+        # Unknown values raise ValueError, as EventType(value) always did.
+        return EventType(value)
+
+
 def create_event(
     event_type: EventType,
     content: str,
@@ -174,6 +280,7 @@ def effective_salience(event: Event, now: datetime | None = None) -> float:
 
     Formula: salience * (decay_rate ^ hours_since_last_access)
     Immortal events always return their raw salience (no decay).
+    Uses the event's cached accessed_us, so accessed_at is parsed once.
 
     Args:
         event: The event to calculate salience for.
@@ -184,28 +291,83 @@ def effective_salience(event: Event, now: datetime | None = None) -> float:
     """
     if event.immortal:
         return event.salience
+    return decay_us(event.salience, event.accessed_us, epoch_now_us(now))
 
-    if now is None:
-        now = datetime.now(timezone.utc)
 
-    if not event.accessed_at:
-        return event.salience
+def decayed_salience(
+    salience: float,
+    accessed_at: str,
+    immortal: bool = False,
+    now: datetime | None = None,
+) -> float:
+    """Field-level form of effective_salience().
+
+    Lets storage backends score rows without building an Event first.
+    """
+    if immortal:
+        return salience
+    return decay_us(salience, epoch_us(accessed_at), epoch_now_us(now))
 
+
+def decay_us(salience: float, accessed_us: int | None, now_us: int) -> float:
+    """Decay salience from its last access to now, both in epoch microseconds.
+
+    The single decay formula behind effective_salience() and every
+    store's ranking. accessed_us of None (no usable timestamp) means no
+    decay; an access in the future counts as now.
+    """
+    if accessed_us is None:
+        return salience
+    hours_elapsed = (now_us - accessed_us) / 10**6 / 3600
+    if hours_elapsed < 0:
+        hours_elapsed = 0
     try:
-        last_accessed = datetime.fromisoformat(event.accessed_at)
-        # WHAT: Ensure timezone-aware comparison
-        # WHY: fromisoformat may return naive datetime from older data
-        if last_accessed.tzinfo is None:
-            last_accessed = last_accessed.replace(tzinfo=timezone.utc)
-        if now.tzinfo is None:
-            now = now.replace(tzinfo=timezone.utc)
-
-        hours_elapsed = max(0, (now - last_accessed).total_seconds() / 3600)
-        return event.salience * (DEFAULT_DECAY_RATE**hours_elapsed)
-    except (ValueError, TypeError):
-        # WHAT: If timestamp parsing fails, return raw salience
+        return salience * (DEFAULT_DECAY_RATE**hours_elapsed)
+    except TypeError:
+        # WHAT: Return raw salience for a non-numeric salience
         # WHY: Defensive — don't let bad data crash the system
-        return event.salience
+        return salience
+
+
+def epoch_us(timestamp: str) -> int | None:
+    """Parse an ISO 8601 timestamp to epoch microseconds.
+
+    Integer microseconds are exact, so differences match datetime
+    arithmetic. Returns None for empty or unparseable input.
+    """
+    if not timestamp:
+        return None
+    try:
+        parsed = datetime.fromisoformat(timestamp)
+    except (ValueError, TypeError):
+        return None
+    # WHAT: Treat naive timestamps as UTC
+    # WHY: Older data was written without an offset
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return (parsed - _EPOCH) // _MICROSECOND
+
+
+def epoch_now_us(now: datetime | None = None) -> int:
+    """Epoch microseconds of now (default: current UTC time; naive means UTC)."""
+    global _last_now
+    if now is None:
+        now = datetime.now(timezone.utc)
+    elif now is _last_now[0]:
+        return _last_now[1]
+    value = ((now if now.tzinfo else now.replace(tzinfo=timezone.utc)) - _EPOCH) // _MICROSECOND
+    _last_now = (now, value)
+    return value
+
+
+def created_key(event: Event) -> float:
+    """Sort key ordering events by when they were created.
+
+    Compares instants rather than strings, so naive and offset timestamps
+    from older data sort correctly; unparseable ones sort first.
+    """
+    created = event.created_us
+    return _NO_TIME if created is None else created
 
 
 def reinforce_event(event: Event) -> Event:
@@ -246,3 +408,14 @@ def content_hash(event: Event) -> str:
     """
     raw = f"{event.type.value}:{event.content}:{event.session_id}"
     return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def raw_content_hash(data: dict) -> str:
+    """content_hash() for a stored event dict, without building an Event.
+
+    Applies the same defaults as Event.from_dict(), so
+    raw_content_hash(d) == content_hash(Event.from_dict(d)).
+    """
+    event_type = data.get("type", EventType.KNOWLEDGE_ACQUIRED.value)
+    raw = f"{event_type}:{data.get('content', '')}:{data.get('session_id', '')}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
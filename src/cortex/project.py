@@ -1,14 +1,26 @@
 """Project identity resolution for Cortex.
 
 Determines the current project's identity (hash, git branch, git info)
-from the working directory. Uses subprocess for git operations with
-defensive error handling — a non-git directory still works.
+from the working directory. Git info is read straight from the .git
+directory (HEAD, loose refs, packed-refs, loose commit objects) and
+cached until those files change; the git command is only run for
+layouts the reader does not handle. A non-git directory still works.
+
+ProjectIndex persists identities across processes, so a hook in a known
+project only stats a few .git files instead of resolving anything.
 """
 
 import hashlib
+import json
+import os
 import subprocess
+import zlib
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+from cortex.config import CortexConfig, get_cortex_home
+
 
 def get_project_hash(project_path: str) -> str:
     """Generate a deterministic hash for a project directory.
@@ -34,21 +46,10 @@ def get_git_branch(project_path: str) -> str:
         project_path: Path to the project directory.
 
     Returns:
-        Branch name string, or "unknown" if not a git repo or on error.
+        Branch name string ("HEAD" when detached), or "unknown" if not a
+        git repo or on error.
     """
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            cwd=project_path,
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()
-    except (subprocess.SubprocessError, FileNotFoundError, OSError):
-        pass
-    return "unknown"
+    return _git_info(project_path)["branch"]
 
 
 def get_git_info(project_path: str) -> dict:
@@ -64,13 +65,215 @@ def get_git_info(project_path: str) -> dict:
     Returns:
         Dict with keys: branch, last_commit_hash, last_commit_time
     """
-    info = {
-        "branch": "unknown",
-        "last_commit_hash": "",
-        "last_commit_time": "",
+    return dict(_git_info(project_path))
+
+
+def find_git_dir(project_path: str | Path) -> tuple[Path, Path] | None:
+    """Locate the repository containing project_path without running git.
+
+    Walks up from project_path to the first .git entry. A .git file (as
+    in linked worktrees and submodules) is followed through its
+    "gitdir: <path>" line, and that directory's commondir file, if any,
+    names the directory holding the shared refs and objects.
+
+    Returns:
+        (git_dir, common_dir), or None if no repository was found.
+        git_dir holds HEAD; common_dir holds refs, packed-refs and objects.
+    """
+    try:
+        current = Path(project_path).resolve()
+    except (OSError, RuntimeError):
+        return None
+    for directory in (current, *current.parents):
+        dot_git = directory / ".git"
+        if dot_git.is_dir():
+            return dot_git, dot_git
+        if dot_git.is_file():
+            try:
+                first_line = dot_git.read_text(encoding="utf-8").splitlines()[0]
+            except (OSError, UnicodeDecodeError, IndexError):
+                return None
+            if not first_line.startswith("gitdir:"):
+                return None
+            git_dir = (directory / first_line[len("gitdir:") :].strip()).resolve()
+            common_dir = git_dir
+            try:
+                common = (git_dir / "commondir").read_text(encoding="utf-8").strip()
+                common_dir = (git_dir / common).resolve()
+            except OSError:
+                pass
+            return git_dir, common_dir
+    return None
+
+
+# WHAT: Git info per repository, with the stat key it was read under.
+# WHY: Hooks run on every turn and the daemon serves many of them; HEAD,
+# the branch's loose ref and packed-refs only change on checkout,
+# commit, fetch or gc, so a handful of stats decides whether to reread.
+_GIT_INFO_CACHE: dict[Path, tuple[tuple, dict]] = {}
+
+_DEFAULT_GIT_INFO = {"branch": "unknown", "last_commit_hash": "", "last_commit_time": ""}
+
+# Longest chain of symbolic refs followed before giving up.
+_MAX_SYMREF_DEPTH = 5
+
+
+def _git_info(project_path: str) -> dict:
+    """Return cached git info for project_path (do not mutate the result).
+
+    Reads .git directly. Falls back to the git command when the files
+    say something this reader does not handle (GIT_DIR in the
+    environment, an unborn or reftable branch, a packed commit object).
+    """
+    if "GIT_DIR" in os.environ:
+        return _git_info_subprocess(project_path)
+    found = find_git_dir(project_path)
+    if found is None:
+        return _DEFAULT_GIT_INFO
+    git_dir, common_dir = found
+
+    key = _stat_key(_watched_files(git_dir, common_dir))
+    cached = _GIT_INFO_CACHE.get(git_dir)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    info = _read_git_info(git_dir, common_dir)
+    if info is None:
+        info = _git_info_subprocess(project_path)
+    elif not info["last_commit_time"]:
+        info["last_commit_time"] = _commit_time_subprocess(project_path, info["last_commit_hash"])
+    _GIT_INFO_CACHE[git_dir] = (key, info)
+    return info
+
+
+def _watched_files(git_dir: Path, common_dir: Path) -> list[Path]:
+    """HEAD, the ref it names, and packed-refs: what git info is read from."""
+    head = git_dir / "HEAD"
+    paths = [head, common_dir / "packed-refs"]
+    try:
+        content = head.read_bytes()
+    except OSError:
+        content = b""
+    if content.startswith(b"ref:"):
+        paths.append(common_dir / content[4:].strip().decode("utf-8", "replace"))
+    return paths
+
+
+def _stat_key(paths: Iterable[Path]) -> tuple:
+    """(mtime_ns, size, inode) of each path, None for a missing one."""
+    key: list[tuple[int, int, int] | None] = []
+    for path in paths:
+        try:
+            st = path.stat()
+            key.append((st.st_mtime_ns, st.st_size, st.st_ino))
+        except OSError:
+            key.append(None)
+    return tuple(key)
+
+
+def _read_git_info(git_dir: Path, common_dir: Path) -> dict | None:
+    """Read branch, commit hash and commit time from the .git files.
+
+    Returns None if the git command is needed to get the branch and
+    hash right. last_commit_time is "" if the commit is not a loose
+    object.
+    """
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+    if head.startswith("ref:"):
+        ref = head[len("ref:") :].strip()
+        sha = _resolve_ref(common_dir, ref)
+        if sha is None:
+            return None
+        branch = ref.removeprefix("refs/heads/")
+    elif _is_sha(head):
+        sha = head
+        branch = "HEAD"
+    else:
+        return None
+    return {
+        "branch": branch,
+        "last_commit_hash": sha,
+        "last_commit_time": _loose_commit_time(common_dir, sha),
     }
 
-    info["branch"] = get_git_branch(project_path)
+
+def _resolve_ref(common_dir: Path, ref: str) -> str | None:
+    """Resolve a ref name to a commit hash via loose refs, then packed-refs."""
+    for _ in range(_MAX_SYMREF_DEPTH):
+        try:
+            value = (common_dir / ref).read_text(encoding="utf-8").strip()
+        except (OSError, UnicodeDecodeError):
+            return _packed_ref(common_dir, ref)
+        if value.startswith("ref:"):
+            ref = value[len("ref:") :].strip()
+            continue
+        return value if _is_sha(value) else None
+    return None
+
+
+def _packed_ref(common_dir: Path, ref: str) -> str | None:
+    """Look ref up in packed-refs ("<sha> <ref>" lines)."""
+    try:
+        lines = (common_dir / "packed-refs").read_text(encoding="utf-8").splitlines()
+    except (OSError, UnicodeDecodeError):
+        return None
+    for line in lines:
+        if line.startswith(("#", "^")):
+            continue
+        sha, _, name = line.partition(" ")
+        if name == ref and _is_sha(sha):
+            return sha
+    return None
+
+
+def _loose_commit_time(common_dir: Path, sha: str) -> str:
+    """Author date of a loose commit object in git's %aI format, or ""."""
+    try:
+        raw = zlib.decompress((common_dir / "objects" / sha[:2] / sha[2:]).read_bytes())
+    except (OSError, zlib.error):
+        return ""
+    header, _, body = raw.partition(b"\0")
+    if not header.startswith(b"commit "):
+        return ""
+    for line in body.split(b"\n"):
+        if not line:
+            break
+        if line.startswith(b"author "):
+            try:
+                timestamp, offset = line.rsplit(b" ", 2)[1:]
+                sign = -1 if offset.startswith(b"-") else 1
+                minutes = int(offset[-4:-2]) * 60 + int(offset[-2:])
+                tz = timezone(sign * timedelta(minutes=minutes))
+                return datetime.fromtimestamp(int(timestamp), tz).isoformat()
+            except (ValueError, OverflowError, OSError):
+                return ""
+    return ""
+
+
+def _is_sha(value: str) -> bool:
+    """True for a 40- or 64-character lowercase hex object name."""
+    return len(value) in (40, 64) and all(c in "0123456789abcdef" for c in value)
+
+
+def _git_info_subprocess(project_path: str) -> dict:
+    """get_git_info() via the git command."""
+    info = dict(_DEFAULT_GIT_INFO)
+
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
+            cwd=project_path,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        if result.returncode == 0:
+            info["branch"] = result.stdout.strip()
+    except (subprocess.SubprocessError, FileNotFoundError, OSError):
+        pass
 
     try:
         result = subprocess.run(
@@ -92,6 +295,23 @@ def get_git_info(project_path: str) -> dict:
     return info
 
 
+def _commit_time_subprocess(project_path: str, sha: str) -> str:
+    """Author date of one commit via the git command, or ""."""
+    try:
+        result = subprocess.run(
+            ["git", "log", "-1", "--format=%aI", sha],
+            cwd=project_path,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        if result.returncode == 0:
+            return result.stdout.strip()
+    except (subprocess.SubprocessError, FileNotFoundError, OSError):
+        pass
+    return ""
+
+
 def identify_project(cwd: str) -> dict:
     """Identify a project from its working directory.
 
@@ -104,9 +324,153 @@ def identify_project(cwd: str) -> dict:
         Dict with keys: path, hash, git_branch, git_info
     """
     resolved_path = str(Path(cwd).resolve())
+    git_info = get_git_info(resolved_path)
     return {
         "path": resolved_path,
         "hash": get_project_hash(resolved_path),
-        "git_branch": get_git_branch(resolved_path),
-        "git_info": get_git_info(resolved_path),
+        "git_branch": git_info["branch"],
+        "git_info": git_info,
+    }
+
+
+class ProjectIndex:
+    """Persistent map from working directory to project identity.
+
+    Stored in ~/.cortex/projects/index/ as one file per cwd, named by a
+    hash of it and holding {"cwd", "hash", "path", "git_branch",
+    "git_info", "git_files", "git_key"}. git_files are the .git files the
+    git info was read from and git_key their (mtime_ns, size, inode) at
+    the time: an entry is served only while those stats still match.
+    Entries for directories outside a git repository are kept for listing
+    but are always re-identified, since a later `git init` leaves nothing
+    to stat.
+
+    Hooks in different projects run concurrently; with one file per cwd,
+    each writes only its own entry, so none can drop another's.
+    """
+
+    def __init__(self, config: CortexConfig | None = None):
+        self._config = config or CortexConfig()
+        self._path = get_cortex_home(self._config) / "projects" / "index"
+
+    @property
+    def path(self) -> Path:
+        """Directory holding the entry files."""
+        return self._path
+
+    def entry_path(self, cwd: str) -> Path:
+        """Path to the entry file for cwd."""
+        return self._path / f"{hashlib.sha256(cwd.encode('utf-8')).hexdigest()[:16]}.json"
+
+    def get(self, cwd: str) -> dict | None:
+        """Return the entry for cwd, or None if there is none (or it is unreadable)."""
+        return _read_entry(self.entry_path(cwd), cwd)
+
+    def load(self) -> dict[str, dict]:
+        """Return every entry by cwd ({} if none)."""
+        try:
+            paths = sorted(self._path.glob("*.json"))
+        except OSError:
+            return {}
+        projects = {}
+        for path in paths:
+            entry = _read_entry(path)
+            if entry is not None:
+                projects[entry["cwd"]] = entry
+        return projects
+
+    def save(self, cwd: str, entry: dict) -> None:
+        """Save the entry for cwd atomically."""
+        path = self.entry_path(cwd)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # A per-process temp name keeps concurrent saves of the same
+        # entry from clobbering each other's half-written file.
+        tmp_path = path.with_suffix(f".json.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(json.dumps({**entry, "cwd": cwd}, indent=2), encoding="utf-8")
+            tmp_path.rename(path)
+        except OSError:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+
+    def identify(self, cwd: str) -> dict:
+        """Return identify_project(cwd), from the index while it is current.
+
+        A miss identifies the project and records it. Failing to write
+        the index is not an error; the next call just misses again.
+        """
+        entry = self.get(cwd)
+        if entry is not None and entry.get("git_files"):
+            key = _stat_key(Path(f) for f in entry["git_files"])
+            if _json_key(key) == entry.get("git_key"):
+                try:
+                    return _identity_from(entry)
+                except (KeyError, TypeError):
+                    pass
+
+        # WHAT: Take the stat key before reading git info.
+        # WHY: If git changes in between, the entry records the older
+        # stats, so the next call misses instead of serving stale info.
+        found = find_git_dir(cwd) if "GIT_DIR" not in os.environ else None
+        git_files = _watched_files(*found) if found else []
+        key = _stat_key(git_files)
+        identity = identify_project(cwd)
+        new_entry = {
+            "cwd": cwd,
+            "hash": identity["hash"],
+            "path": identity["path"],
+            "git_branch": identity["git_branch"],
+            "git_info": identity["git_info"],
+            "git_files": [str(f) for f in git_files],
+            "git_key": _json_key(key),
+        }
+        if new_entry != entry:
+            try:
+                self.save(cwd, new_entry)
+            except OSError:
+                pass
+        return identity
+
+    def projects(self) -> list[dict]:
+        """Known projects, one per hash, sorted by path.
+
+        Each dict has path, hash and git_branch (as last seen).
+        """
+        by_hash: dict[str, dict] = {}
+        for entry in self.load().values():
+            if "hash" in entry and "path" in entry:
+                by_hash[entry["hash"]] = {
+                    "path": entry["path"],
+                    "hash": entry["hash"],
+                    "git_branch": entry.get("git_branch", "unknown"),
+                }
+        return sorted(by_hash.values(), key=lambda p: p["path"])
+
+
+def _read_entry(path: Path, cwd: str | None = None) -> dict | None:
+    """Read one index entry file; None if missing, unreadable, or for another cwd."""
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        return None
+    if not isinstance(entry, dict) or not isinstance(entry.get("cwd"), str):
+        return None
+    if cwd is not None and entry["cwd"] != cwd:
+        return None
+    return entry
+
+
+def _json_key(key: tuple) -> list:
+    """A stat key as it round-trips through JSON."""
+    return [list(k) if k is not None else None for k in key]
+
+
+def _identity_from(entry: dict) -> dict:
+    """Rebuild an identify_project() result from an index entry."""
+    return {
+        "path": entry["path"],
+        "hash": entry["hash"],
+        "git_branch": entry["git_branch"],
+        "git_info": dict(entry["git_info"]),
     }
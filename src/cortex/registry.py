@@ -0,0 +1,229 @@
+"""Extractor registry for the event extraction pipeline.
+
+An extractor is a function from an ExtractionContext to a list of
+Events. Each one is registered with the record types and content block
+types it consumes, so the pipeline only calls it for entries it can act
+on. The context exposes the entry's cached derived views (text,
+stripped text, tool calls, tool results), so no derivation runs twice
+for one entry.
+
+Every extractor counts its calls, the events it returned, and the time
+spent in it (per process), so the hot one is easy to spot:
+
+    for stats in DEFAULT_REGISTRY.stats():
+        print(stats.name, stats.calls, stats.seconds)
+
+Extractors may also declare needles: literal text present in the raw
+JSONL line of every entry they can act on. prefilter() combines them
+into the LineFilter hooks and backfill read transcripts with, so lines
+no extractor can use are never decoded. An extractor without needles
+turns the prefilter off, since any line might matter to it.
+
+The three built-in layers are registered in cortex.extractors.
+"""
+
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+from cortex.transcript import LineFilter, ToolCall, ToolResult, TranscriptEntry
+
+
+class ExtractionContext:
+    """One entry plus the pipeline defaults, shared by all extractors.
+
+    The derived views delegate to the entry's own cached views, so each
+    is computed at most once per entry however many extractors read it.
+
+    Attributes:
+        entry: The TranscriptEntry being extracted.
+        session_id: The entry's session ID, or the pipeline default.
+        project: Project identifier.
+        git_branch: The entry's git branch, or the pipeline default.
+    """
+
+    __slots__ = ("entry", "session_id", "project", "git_branch")
+
+    def __init__(self, entry: TranscriptEntry, session_id: str = "", project: str = "", git_branch: str = ""):
+        self.entry = entry
+        self.session_id = entry.session_id or session_id
+        self.project = project
+        self.git_branch = entry.git_branch or git_branch
+
+    @property
+    def block_types(self) -> frozenset[str]:
+        """Types of the entry's content blocks."""
+        return self.entry.block_types
+
+    @property
+    def text(self) -> str:
+        """extract_text_content(entry)."""
+        return self.entry.text
+
+    @property
+    def stripped_text(self) -> str:
+        """strip_code_blocks(text)."""
+        return self.entry.stripped_text
+
+    @property
+    def tool_calls(self) -> list[ToolCall]:
+        """extract_tool_calls(entry)."""
+        return self.entry.tool_calls
+
+    @property
+    def tool_results(self) -> list[ToolResult]:
+        """extract_tool_results(entry)."""
+        return self.entry.tool_results
+
+
+@dataclass
+class ExtractorStats:
+    """Cumulative cost of one extractor in this process."""
+
+    name: str
+    calls: int = 0
+    events: int = 0
+    seconds: float = 0.0
+
+
+class Extractor:
+    """A registered extractor and the entries it consumes.
+
+    Attributes:
+        name: Unique name within the registry.
+        func: Called with an ExtractionContext; returns a list of Events.
+        record_types: Record types (entry.record_type) it consumes.
+        block_types: Content block types it consumes; the entry must have
+            at least one. None means any entry of a matching record type.
+        needles: Text the raw line of every entry it acts on contains
+            verbatim (see LineFilter). None means it may act on any line.
+        ignore_case: Further needles matched in any letter case.
+        stats: Call count, events returned and time spent so far.
+    """
+
+    __slots__ = ("name", "func", "record_types", "block_types", "needles", "ignore_case", "stats")
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[ExtractionContext], list],
+        record_types: Iterable[str],
+        block_types: Iterable[str] | None = None,
+        needles: Iterable[str] | None = None,
+        ignore_case: Iterable[str] = (),
+    ):
+        self.name = name
+        self.func = func
+        self.record_types = frozenset(record_types)
+        self.block_types = frozenset(block_types) if block_types is not None else None
+        self.needles = tuple(needles) if needles is not None else None
+        self.ignore_case = tuple(ignore_case)
+        self.stats = ExtractorStats(name)
+
+
+class ExtractorRegistry:
+    """Ordered set of extractors run over each transcript entry.
+
+    Extractors run in registration order, and their events are emitted
+    in that order, entry by entry.
+    """
+
+    def __init__(self):
+        self._extractors: list[Extractor] = []
+        self._by_record_type: dict[str, list[Extractor]] = {}
+        self._prefilter: LineFilter | None = LineFilter(())
+
+    @property
+    def extractors(self) -> list[Extractor]:
+        """Registered extractors in run order."""
+        return list(self._extractors)
+
+    def register(
+        self,
+        name: str,
+        func: Callable[[ExtractionContext], list],
+        record_types: Iterable[str],
+        block_types: Iterable[str] | None = None,
+        needles: Iterable[str] | None = None,
+        ignore_case: Iterable[str] = (),
+    ) -> Extractor:
+        """Add an extractor after the existing ones.
+
+        Args:
+            name: Unique name within the registry.
+            func: Called with an ExtractionContext; returns a list of Events.
+            record_types: Record types it consumes.
+            block_types: Content block types it consumes (None: any).
+            needles: Text every raw JSONL line it acts on contains
+                verbatim. Leave None if there is none; the prefilter is
+                then off for this registry.
+            ignore_case: Needles matched in any letter case. Only used
+                together with needles.
+
+        Raises:
+            ValueError: If an extractor with this name is already registered.
+        """
+        if any(e.name == name for e in self._extractors):
+            raise ValueError(f"extractor already registered: {name}")
+        extractor = Extractor(name, func, record_types, block_types, needles, ignore_case)
+        self._extractors.append(extractor)
+        self._reindex()
+        return extractor
+
+    def unregister(self, name: str) -> None:
+        """Remove the named extractor, if registered."""
+        self._extractors = [e for e in self._extractors if e.name != name]
+        self._reindex()
+
+    def prefilter(self) -> LineFilter | None:
+        """Line filter passing every line some registered extractor may use.
+
+        The union of the extractors' needles, or None (decode every line)
+        if any extractor was registered without needles.
+        """
+        return self._prefilter
+
+    def run(self, ctx: ExtractionContext) -> list:
+        """Run every extractor that wants ctx's entry; return their events."""
+        candidates = self._by_record_type.get(ctx.entry.record_type)
+        if not candidates:
+            return []
+        block_types = ctx.block_types
+        clock = time.perf_counter
+        events: list = []
+        for extractor in candidates:
+            wanted = extractor.block_types
+            if wanted is not None and wanted.isdisjoint(block_types):
+                continue
+            started = clock()
+            found = extractor.func(ctx)
+            stats = extractor.stats
+            stats.seconds += clock() - started
+            stats.calls += 1
+            stats.events += len(found)
+            events.extend(found)
+        return events
+
+    def stats(self) -> list[ExtractorStats]:
+        """Per-extractor cost counters, in run order."""
+        return [e.stats for e in self._extractors]
+
+    def reset_stats(self) -> None:
+        """Zero every extractor's counters."""
+        for extractor in self._extractors:
+            extractor.stats = ExtractorStats(extractor.name)
+
+    def _reindex(self) -> None:
+        """Rebuild the record-type dispatch table and the prefilter."""
+        by_type: dict[str, list[Extractor]] = {}
+        for extractor in self._extractors:
+            for record_type in extractor.record_types:
+                by_type.setdefault(record_type, []).append(extractor)
+        self._by_record_type = by_type
+        if any(e.needles is None for e in self._extractors):
+            self._prefilter = None
+        else:
+            self._prefilter = LineFilter(
+                [n for e in self._extractors for n in e.needles or ()],
+                ignore_case=[n for e in self._extractors for n in e.ignore_case],
+            )
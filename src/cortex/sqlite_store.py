@@ -0,0 +1,368 @@
+"""SQLite-backed event store for Cortex.
+
+Drop-in alternative to EventStore for large projects. Every query that
+EventStore answers by loading all events and filtering in Python is
+answered here by an indexed SQL query, so SessionStart latency no longer
+grows linearly with store size.
+
+The database runs in WAL mode so a reader (SessionStart) never blocks on a
+writer (Stop). Each row keeps the full event as JSON alongside the columns
+used for filtering; accessed_at and access_count live only in columns so
+mark_accessed is a single UPDATE.
+
+Storage location: ~/.cortex/projects/<hash>/events.db
+Selected with CortexConfig.store_backend = "sqlite" (see open_store()).
+"""
+
+import sqlite3
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from pathlib import Path
+
+from cortex import codec
+from cortex.config import CortexConfig, get_project_dir
+from cortex.models import Event, EventType, check_field_names, content_hash, epoch_us, record_fields
+from cortex.salience import SalienceColumns
+
+_TABLE = """
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    type TEXT NOT NULL,
+    git_branch TEXT NOT NULL DEFAULT '',
+    immortal INTEGER NOT NULL DEFAULT 0,
+    salience REAL NOT NULL DEFAULT 0.5,
+    created_at TEXT NOT NULL DEFAULT '',
+    accessed_at TEXT NOT NULL DEFAULT '',
+    access_count INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL,
+    created_us INTEGER,
+    accessed_us INTEGER
+);
+"""
+
+# WHAT: created_at / accessed_at as epoch microseconds (NULL when
+# unparseable), written alongside the ISO strings.
+# WHY: Ordering by the strings sorts naive and offset timestamps from
+# older data lexically, not by instant, and ranking parsed accessed_at on
+# every query. NULL sorts first ascending and last descending, like
+# models.created_key() puts unparseable timestamps before every real one.
+_EPOCH_COLUMNS = ("created_us", "accessed_us")
+
+# WHAT: PRAGMA user_version of a database whose migrations have all run.
+# WHY: Lets an up-to-date database skip them with one PRAGMA on open.
+_SCHEMA_VERSION = 1
+
+_INDEXES = """
+DROP INDEX IF EXISTS idx_events_type_created;
+DROP INDEX IF EXISTS idx_events_created;
+DROP INDEX IF EXISTS idx_events_immortal;
+CREATE INDEX IF NOT EXISTS idx_events_id ON events(id);
+CREATE INDEX IF NOT EXISTS idx_events_hash ON events(content_hash);
+CREATE INDEX IF NOT EXISTS idx_events_type_created_us ON events(type, created_us);
+CREATE INDEX IF NOT EXISTS idx_events_created_us ON events(created_us);
+CREATE INDEX IF NOT EXISTS idx_events_branch ON events(git_branch);
+CREATE INDEX IF NOT EXISTS idx_events_immortal_us ON events(immortal, created_us);
+"""
+
+# WHAT: Event fields stored in columns of their own.
+# WHY: iter_fields() selects these directly instead of decoding data.
+_COLUMN_FIELDS = frozenset(
+    {"id", "type", "git_branch", "immortal", "salience", "created_at", "accessed_at", "access_count"}
+)
+
+# WHAT: Chunk size for IN (...) lists.
+# WHY: Older SQLite builds cap bound parameters at 999 per statement.
+_MAX_PARAMS = 500
+
+
+class SQLiteEventStore:
+    """SQLite-backed event store for a single project.
+
+    Implements the same interface as EventStore. On first open, an
+    existing events.json is imported and renamed to events.json.migrated.
+    """
+
+    def __init__(self, project_hash: str, config: CortexConfig | None = None):
+        self._project_hash = project_hash
+        self._config = config or CortexConfig()
+        self._project_dir = get_project_dir(project_hash, self._config)
+        self._db_path = self._project_dir / "events.db"
+        self._conn = sqlite3.connect(self._db_path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_TABLE)
+        self._migrate_epoch_columns()
+        self._conn.executescript(_INDEXES)
+        self._migrate_legacy()
+
+    @property
+    def db_path(self) -> Path:
+        """Path to the events.db file."""
+        return self._db_path
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def generation(self) -> str:
+        """Cheap token that changes whenever the stored events do.
+
+        Stat identity of events.db plus the WAL file while it holds
+        frames. An empty or missing WAL is left out: closing the last
+        connection checkpoints and deletes it, which changes no data.
+        """
+        parts = []
+        for path in (self._db_path, self._db_path.with_name(self._db_path.name + "-wal")):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            if st.st_size:
+                parts.append(f"{path.name}:{st.st_ino}:{st.st_size}:{st.st_mtime_ns}")
+        return "|".join(parts)
+
+    def append(self, event: Event) -> None:
+        """Append a single event to the store."""
+        with self._conn:
+            self._insert([event])
+
+    def append_many(self, events: list[Event]) -> None:
+        """Append multiple events, skipping content-hash duplicates.
+
+        Deduplicates against the store (via the content_hash index) and
+        within the batch, matching EventStore.append_many().
+        """
+        if not events:
+            return
+
+        seen: set[str] = set()
+        new_events = []
+        for event in events:
+            h = content_hash(event)
+            if h in seen:
+                continue
+            seen.add(h)
+            row = self._conn.execute("SELECT 1 FROM events WHERE content_hash = ? LIMIT 1", (h,)).fetchone()
+            if row is None:
+                new_events.append(event)
+
+        if new_events:
+            with self._conn:
+                self._insert(new_events)
+
+    def load_all(self) -> list[Event]:
+        """Load all events from the store in insertion order."""
+        return self._select("ORDER BY seq")
+
+    def load_recent(self, n: int = 50) -> list[Event]:
+        """Load the N most recent events, sorted by created_at descending."""
+        return self._select("ORDER BY created_us DESC, seq LIMIT ?", (n,))
+
+    def load_by_type(self, event_type: EventType) -> list[Event]:
+        """Load all events of a specific type."""
+        return self._select("WHERE type = ? ORDER BY seq", (event_type.value,))
+
+    def load_immortal(self) -> list[Event]:
+        """Load all immortal events (decisions and rejections)."""
+        return self._select("WHERE immortal = 1 ORDER BY seq")
+
+    def iter_ids(self) -> Iterator[str]:
+        """Iterate over stored event ids in store order, without building Events."""
+        return (row[0] for row in self._conn.execute("SELECT id FROM events ORDER BY seq"))
+
+    def iter_fields(self, *names: str) -> Iterator[tuple]:
+        """Iterate over the named fields of every stored event, in store order.
+
+        Same contract as EventStore.iter_fields(). Fields with a column
+        of their own are read from it; asking for any other decodes the
+        stored JSON, but still builds no Event.
+        """
+        check_field_names(names)
+        if not _COLUMN_FIELDS.issuperset(names):
+            return (record_fields(record, names) for record in self._records())
+        rows = self._conn.execute(f"SELECT {', '.join(names)} FROM events ORDER BY seq")
+        if "type" not in names and "immortal" not in names:
+            return (tuple(row) for row in rows)
+        # type and immortal are stored as text and 0/1.
+        return (record_fields(dict(zip(names, row, strict=True)), names) for row in rows)
+
+    def load_for_briefing(self, branch: str | None = None) -> dict:
+        """Load events structured for briefing generation.
+
+        Same contract as EventStore.load_for_briefing(): returns a dict
+        with "immortal", "active_plan", and "recent" keys.
+        """
+        branch_sql = ""
+        branch_params: tuple = ()
+        if branch:
+            branch_sql = " AND (git_branch = ? OR git_branch = '')"
+            branch_params = (branch,)
+
+        immortal = self._select(
+            f"WHERE immortal = 1{branch_sql} ORDER BY created_us DESC, seq",
+            branch_params,
+        )
+
+        active_plan: list[Event] = []
+        latest = self._select(
+            f"WHERE type = ?{branch_sql} ORDER BY created_us DESC, seq LIMIT 1",
+            (EventType.PLAN_CREATED.value, *branch_params),
+        )
+        if latest:
+            plan = latest[0]
+            # A plan with no parseable created_at sorts before every step.
+            steps = self._select(
+                f"WHERE type = ? AND (? IS NULL OR created_us >= ?){branch_sql} ORDER BY created_us, seq",
+                (EventType.PLAN_STEP_COMPLETED.value, plan.created_us, plan.created_us, *branch_params),
+            )
+            active_plan = [plan, *steps]
+
+        # WHAT: Fetch only the scoring columns and rank them in Python.
+        # WHY: Scoring in SQL needs a Python callback per row plus a full
+        # sort; SalienceColumns scores every row at once (vectorized when
+        # NumPy is available) and only keeps the top K. Rows come in seq
+        # order, so ties still go to the earlier event.
+        # NOT INDEXED: most rows match, and a rowid-order table scan beats
+        # an index lookup per row followed by a sort on seq.
+        # Immortal rows are already excluded by "immortal = 0".
+        excluded = [e.id for e in active_plan]
+        plan_sql = ""
+        if excluded:
+            plan_sql = f" AND id NOT IN ({','.join('?' * len(excluded))})"
+        rows = self._conn.execute(
+            "SELECT seq, salience, accessed_us FROM events NOT INDEXED"
+            f" WHERE immortal = 0{branch_sql}{plan_sql} ORDER BY seq",
+            (*branch_params, *excluded),
+        ).fetchall()
+        columns = SalienceColumns([row[1] for row in rows], [row[2] for row in rows])
+        limit = self._config.briefing_recent_limit
+        top = [rows[i][0] for i in columns.top_k(limit, datetime.now(timezone.utc))]
+        by_seq: dict[int, Event] = {}
+        for i in range(0, len(top), _MAX_PARAMS):
+            chunk = sorted(top[i : i + _MAX_PARAMS])
+            events = self._select(f"WHERE seq IN ({','.join('?' * len(chunk))}) ORDER BY seq", tuple(chunk))
+            by_seq.update(zip(chunk, events, strict=True))
+        recent = [by_seq[seq] for seq in top]
+
+        return {
+            "immortal": immortal,
+            "active_plan": active_plan,
+            "recent": recent,
+        }
+
+    def mark_accessed(self, event_ids: list[str]) -> None:
+        """Update accessed_at and access_count for specified events."""
+        if not event_ids:
+            return
+        now = datetime.now(timezone.utc).isoformat()
+        now_us = epoch_us(now)
+        ids = list(dict.fromkeys(event_ids))
+        with self._conn:
+            for i in range(0, len(ids), _MAX_PARAMS):
+                chunk = ids[i : i + _MAX_PARAMS]
+                self._conn.execute(
+                    "UPDATE events SET accessed_at = ?, accessed_us = ?, access_count = access_count + 1"
+                    f" WHERE id IN ({','.join('?' * len(chunk))})",
+                    (now, now_us, *chunk),
+                )
+
+    def clear(self) -> None:
+        """Remove all events from the store."""
+        with self._conn:
+            self._conn.execute("DELETE FROM events")
+
+    def count(self) -> int:
+        """Return the number of events in the store."""
+        return self._conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+    def _insert(self, events: list[Event]) -> None:
+        """Insert events in order. Caller owns the transaction."""
+        self._conn.executemany(
+            "INSERT INTO events (id, content_hash, type, git_branch, immortal, salience,"
+            " created_at, accessed_at, access_count, data, created_us, accessed_us)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    e.id,
+                    content_hash(e),
+                    e.type.value,
+                    e.git_branch,
+                    int(e.immortal),
+                    e.salience,
+                    e.created_at,
+                    e.accessed_at,
+                    e.access_count,
+                    codec.dumps(e.to_dict()).decode("utf-8"),
+                    e.created_us,
+                    e.accessed_us,
+                )
+                for e in events
+            ],
+        )
+
+    def _records(self) -> Iterator[dict]:
+        """Stored events as dicts in store order, with the live access columns."""
+        loads = codec.active_codec().loads
+        for data, accessed_at, access_count in self._conn.execute(
+            "SELECT data, accessed_at, access_count FROM events ORDER BY seq"
+        ):
+            record = loads(data)
+            record["accessed_at"] = accessed_at
+            record["access_count"] = access_count
+            yield record
+
+    def _select(self, clause: str, params: tuple = ()) -> list[Event]:
+        """Run a SELECT over events and rebuild Event objects."""
+        rows = self._conn.execute(f"SELECT data, accessed_at, access_count FROM events {clause}", params)
+        loads = codec.active_codec().loads
+        events = []
+        for data, accessed_at, access_count in rows:
+            event = Event.from_dict(loads(data))
+            event.accessed_at = accessed_at
+            event.access_count = access_count
+            events.append(event)
+        return events
+
+    def _migrate_epoch_columns(self) -> None:
+        """Add and backfill created_us / accessed_us in databases that predate them."""
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] >= _SCHEMA_VERSION:
+            return
+        # WHAT: Add the columns, backfill every row still missing either
+        # value and bump user_version in one write transaction.
+        # WHY: Python's sqlite3 runs DDL outside its implicit transactions,
+        # so each ALTER would commit on its own; a crash before the
+        # backfill finished left NULLs that nothing ever refilled. The
+        # NULL-only backfill also repairs databases left that way, and
+        # BEGIN IMMEDIATE keeps two hooks from migrating at once.
+        with self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(events)")}
+            for name in _EPOCH_COLUMNS:
+                if name not in columns:
+                    self._conn.execute(f"ALTER TABLE events ADD COLUMN {name} INTEGER")
+            rows = self._conn.execute(
+                "SELECT seq, created_at, accessed_at FROM events WHERE created_us IS NULL OR accessed_us IS NULL"
+            ).fetchall()
+            self._conn.executemany(
+                "UPDATE events SET created_us = ?, accessed_us = ? WHERE seq = ?",
+                [(epoch_us(created_at), epoch_us(accessed_at), seq) for seq, created_at, accessed_at in rows],
+            )
+            self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    def _migrate_legacy(self) -> None:
+        """Import events.json once, then set it aside."""
+        legacy = self._project_dir / "events.json"
+        if not legacy.exists() or self.count():
+            return
+        try:
+            data = codec.loads(legacy.read_bytes() or b"[]")
+        except (ValueError, OSError):
+            return
+        if not isinstance(data, list):
+            return
+        events = [Event.from_dict(d) for d in data if isinstance(d, dict)]
+        with self._conn:
+            self._insert(events)
+        legacy.rename(legacy.with_suffix(".json.migrated"))
@@ -1,31 +1,44 @@
-"""JSON-backed event store for Cortex Tier 0.
+"""Event store for Cortex Tier 0.
 
-Provides append-only event storage in a JSON file per project.
-Supports querying by type, recency, immortality, and briefing needs.
-Uses atomic writes (temp file + rename) for crash safety.
+Provides append-only event storage per project on top of a pluggable
+storage backend (see cortex.backends). Supports querying by type, recency,
+immortality, and briefing needs. All backends write crash-safely.
 
-Storage location: ~/.cortex/projects/<hash>/events.json
+Storage location: ~/.cortex/projects/<hash>/ (events.json or segments/)
+Accesses are journaled in access.jsonl and folded in later (see
+cortex.access_journal).
 """
 
 import json
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 
+from cortex.access_journal import FOLD_BYTES, AccessJournal, apply_accesses
+from cortex.backends import BACKEND_JSON, StorageBackend, open_backend
+from cortex.briefing_view import BriefingView, select_for_briefing
 from cortex.config import CortexConfig, get_project_dir
+from cortex.hash_index import HashIndex, digest
 from cortex.models import (
     Event,
     EventType,
+    check_field_names,
     content_hash,
-    effective_salience,
+    created_key,
+    raw_content_hash,
+    record_fields,
 )
+from cortex.sqlite_store import SQLiteEventStore
+
+BACKEND_SQLITE = "sqlite"
 
 
 class EventStore:
-    """JSON-file-backed event store for a single project.
+    """Event store for a single project.
 
-    Events are stored as a JSON array in events.json. The entire file
-    is read/written atomically. This is acceptable for Tier 0 where
-    event counts are in the hundreds, not thousands.
+    Persistence is delegated to the backend selected by
+    config.store_backend: a single events.json array (default) or
+    append-only JSONL segments. Query methods are backend-agnostic.
     """
 
     def __init__(self, project_hash: str, config: CortexConfig | None = None):
@@ -33,17 +46,33 @@ class EventStore:
         self._config = config or CortexConfig()
         self._project_dir = get_project_dir(project_hash, self._config)
         self._events_path = self._project_dir / "events.json"
+        self._backend = open_backend(self._project_dir, self._config)
+        self._hash_index = HashIndex(self._project_dir / "hashes.idx")
+        self._access_journal = AccessJournal(self._project_dir / "access.jsonl")
+        self._hashes: set[bytes] = set()
+        self._hashes_fingerprint: str | None = None
+        self._briefing_view = BriefingView(self._project_dir / "briefing-view.json", self._config.briefing_recent_limit)
 
     @property
     def events_path(self) -> Path:
         """Path to the events.json file."""
         return self._events_path
 
+    @property
+    def backend(self) -> StorageBackend:
+        """The storage backend persisting this store's events."""
+        return self._backend
+
     def append(self, event: Event) -> None:
         """Append a single event to the store."""
-        events = self._load_raw()
-        events.append(event.to_dict())
-        self._save_raw(events)
+        self._known_hashes()
+        view_current = self._briefing_view.current(self._synced_fingerprint())
+        record = event.to_dict()
+        self._append_raw([record])
+        self._index_appended([digest(content_hash(event))])
+        if view_current:
+            self._briefing_view.add([record], self._synced_fingerprint())
+            self._briefing_view.save()
 
     def append_many(self, events: list[Event]) -> None:
         """Append multiple events to the store.
@@ -52,23 +81,42 @@ class EventStore:
         using content hashes. This prevents duplicates when the
         Stop hook and PreCompact hook both extract from the same
         transcript content.
+
+        Existing hashes come from the hashes.idx sidecar, so this does
+        not read or decode stored events unless the index is stale. The
+        briefing view, if current, is updated with the new events.
         """
         if not events:
             return
 
-        existing = self._load_raw()
-        existing_hashes = {content_hash(Event.from_dict(e)) for e in existing}
+        existing_hashes = self._known_hashes()
 
         new_events = []
+        new_hashes = []
+        batch_hashes: set[bytes] = set()
         for event in events:
-            h = content_hash(event)
-            if h not in existing_hashes:
+            h = digest(content_hash(event))
+            if h not in existing_hashes and h not in batch_hashes:
                 new_events.append(event.to_dict())
-                existing_hashes.add(h)
+                new_hashes.append(h)
+                batch_hashes.add(h)
 
         if new_events:
-            existing.extend(new_events)
-            self._save_raw(existing)
+            view_current = self._briefing_view.current(self._synced_fingerprint())
+            self._append_raw(new_events)
+            self._index_appended(new_hashes)
+            if view_current:
+                self._briefing_view.add(new_events, self._synced_fingerprint())
+                self._briefing_view.save()
+
+    def generation(self) -> str:
+        """Cheap token that changes whenever the stored events do.
+
+        The backend fingerprint (one stat for events.json, a directory
+        listing plus one stat per live file for JSONL segments) plus one
+        stat of the access journal.
+        """
+        return self._fingerprint()
 
     def load_all(self) -> list[Event]:
         """Load all events from the store."""
@@ -77,16 +125,42 @@ class EventStore:
     def load_recent(self, n: int = 50) -> list[Event]:
         """Load the N most recent events, sorted by created_at descending."""
         events = self.load_all()
-        events.sort(key=lambda e: e.created_at, reverse=True)
+        events.sort(key=created_key, reverse=True)
         return events[:n]
 
     def load_by_type(self, event_type: EventType) -> list[Event]:
-        """Load all events of a specific type."""
-        return [e for e in self.load_all() if e.type == event_type]
+        """Load all events of a specific type.
+
+        Filters stored records first, so only matching events are built.
+        """
+        value = event_type.value
+        default = EventType.KNOWLEDGE_ACQUIRED.value
+        return [Event.from_dict(d) for d in self._load_raw() if d.get("type", default) == value]
 
     def load_immortal(self) -> list[Event]:
         """Load all immortal events (decisions and rejections)."""
-        return [e for e in self.load_all() if e.immortal]
+        return [Event.from_dict(d) for d in self._load_raw() if d.get("immortal", False)]
+
+    def iter_ids(self) -> Iterator[str]:
+        """Iterate over stored event ids in store order, without building Events.
+
+        Streams from the backend: the JSONL backend holds one record at a
+        time rather than the whole store.
+        """
+        return (d.get("id", "") for d in self._backend.iter_raw())
+
+    def iter_fields(self, *names: str) -> Iterator[tuple]:
+        """Iterate over the named fields of every stored event, in store order.
+
+        A projection of load_all(): each item is a tuple of the values
+        the Event would hold (see models.record_fields()), but no Event
+        is built.
+
+        Raises:
+            ValueError: If a name is not an Event field.
+        """
+        check_field_names(names)
+        return (record_fields(d, names) for d in self._iter_raw())
 
     def load_for_briefing(self, branch: str | None = None) -> dict:
         """Load events structured for briefing generation.
@@ -97,6 +171,9 @@ class EventStore:
         - "recent": Top N events by effective salience (excluding
           immortal and plan events already included)
 
+        Served from the briefing view (briefing-view.json) while it is
+        current; otherwise the view is rebuilt from a full load first.
+
         Args:
             branch: Optional git branch filter. If provided, only
                     events from this branch are included.
@@ -104,111 +181,196 @@ class EventStore:
         Returns:
             Dict with "immortal", "active_plan", and "recent" keys.
         """
-        all_events = self.load_all()
+        # WHAT: Take the fingerprint before loading events.
+        # WHY: If a write lands in between, the view is stamped with the
+        # older state and rebuilt next time instead of served stale.
+        fingerprint = self._fingerprint()
+        view = self._briefing_view
+        if not (view.current(fingerprint) and view.has_branch(branch)):
+            view.build(self._iter_raw(), branch, fingerprint)
+            view.save()
+        return view.select(branch, datetime.now(timezone.utc))
+
+    def verify_briefing_view(self, branch: str | None = None) -> list[str]:
+        """Check the briefing view against a full recompute.
 
-        if branch:
-            all_events = [e for e in all_events if e.git_branch == branch or not e.git_branch]
+        Returns:
+            A description of each difference; empty if the view is current
+            and load_for_briefing(branch) matches select_for_briefing().
+        """
+        fingerprint = self._fingerprint()
+        view = self._briefing_view
+        if not view.current(fingerprint):
+            return [f"view is stale: {view.path} does not describe the store"]
+        if not view.has_branch(branch):
+            return [f"view has no entry for branch {branch!r}"]
 
         now = datetime.now(timezone.utc)
-
-        # Immortal events (decisions, rejections) sorted by recency
-        immortal = sorted(
-            [e for e in all_events if e.immortal],
-            key=lambda e: e.created_at,
-            reverse=True,
-        )
-
-        # Active plan: most recent PLAN_CREATED + its PLAN_STEP_COMPLETED events
-        plan_events = sorted(
-            [e for e in all_events if e.type == EventType.PLAN_CREATED],
-            key=lambda e: e.created_at,
-            reverse=True,
-        )
-        active_plan: list[Event] = []
-        if plan_events:
-            latest_plan = plan_events[0]
-            # Find completed steps that came after this plan was created
-            completed_steps = [
-                e
-                for e in all_events
-                if e.type == EventType.PLAN_STEP_COMPLETED and e.created_at >= latest_plan.created_at
-            ]
-            active_plan = [latest_plan, *sorted(completed_steps, key=lambda e: e.created_at)]
-
-        # Recent events: top by effective salience, excluding already-included events
-        included_ids = {e.id for e in immortal} | {e.id for e in active_plan}
-        remaining = [e for e in all_events if e.id not in included_ids]
-        remaining.sort(key=lambda e: effective_salience(e, now), reverse=True)
-        recent = remaining[:30]  # Top 30 by effective salience
-
-        return {
-            "immortal": immortal,
-            "active_plan": active_plan,
-            "recent": recent,
-        }
+        events = (Event.from_dict(d) for d in self._iter_raw())
+        expected = select_for_briefing(events, branch, now, self._config.briefing_recent_limit)
+        actual = view.select(branch, now)
+        problems = []
+        for section, want in expected.items():
+            got = actual[section]
+            if [e.to_dict() for e in got] != [e.to_dict() for e in want]:
+                problems.append(f"{section}: view has {[e.id for e in got]}, full recompute has {[e.id for e in want]}")
+        return problems
 
     def mark_accessed(self, event_ids: list[str]) -> None:
         """Update accessed_at and access_count for specified events.
 
-        Used for reinforcement — events that are retrieved for
-        briefings get boosted salience.
+        Events retrieved for briefings restart their decay from now;
+        their stored salience is unchanged.
+
+        Write-behind: the ids are appended to the access journal, which
+        every read applies, instead of rewriting the store. The journal
+        is folded in by compact() once it reaches FOLD_BYTES, or by the
+        next JSON-array append, which rewrites the file anyway.
         """
         if not event_ids:
             return
 
         now = datetime.now(timezone.utc).isoformat()
-        id_set = set(event_ids)
-        raw = self._load_raw()
-        modified = False
-
-        for entry in raw:
-            if entry.get("id") in id_set:
-                entry["accessed_at"] = now
-                entry["access_count"] = entry.get("access_count", 0) + 1
-                modified = True
-
-        if modified:
-            self._save_raw(raw)
+        ids = list(dict.fromkeys(event_ids))
+        self._known_hashes()
+        view_current = self._briefing_view.current(self._synced_fingerprint())
+        self._access_journal.append(ids, now)
+        self._index_appended([])
+        if view_current and self._briefing_view.touch(ids, now, self._synced_fingerprint()):
+            self._briefing_view.save()
+        if self._access_journal.size() >= FOLD_BYTES:
+            self.compact()
+
+    def compact(self) -> None:
+        """Fold pending accesses into the stored events with one full rewrite.
+
+        Does nothing if no accesses are pending. Reads are unchanged by
+        a fold, so the briefing view and hash index are only restamped.
+        """
+        self._known_hashes()
+        view_current = self._briefing_view.current(self._synced_fingerprint())
+        accesses = self._access_journal.take()
+        if accesses is None:
+            return
+        raw = list(apply_accesses(self._backend.load_raw(), accesses))
+        self._save_raw(raw)
+        self._access_journal.finish_fold()
+        self._index_appended([])
+        if view_current:
+            self._briefing_view.restamp(self._synced_fingerprint())
+            self._briefing_view.save()
 
     def clear(self) -> None:
         """Remove all events from the store."""
         self._save_raw([])
+        self._access_journal.discard()
+        self._hashes = set()
+        self._hashes_fingerprint = self._fingerprint()
+        self._hash_index.write(self._hashes, self._hashes_fingerprint)
+        self._briefing_view.reset(self._hashes_fingerprint)
+        self._briefing_view.save()
 
     def count(self) -> int:
         """Return the number of events in the store."""
-        return len(self._load_raw())
+        return sum(1 for _ in self._backend.iter_raw())
+
+    def _fingerprint(self) -> str:
+        """Stat-based token for the stored events as readers see them.
+
+        Covers the access journal too: a journaled access changes what
+        reads return without touching the backend's files.
+        """
+        return f"{self._backend.fingerprint()}|access:{self._access_journal.token()}"
 
     def _load_raw(self) -> list[dict]:
-        """Load raw event dictionaries from the JSON file."""
-        if not self._events_path.exists():
-            return []
-        try:
-            content = self._events_path.read_text(encoding="utf-8")
-            if not content.strip():
-                return []
-            data = json.loads(content)
-            if isinstance(data, list):
-                return data
-            return []
-        except (json.JSONDecodeError, OSError):
-            return []
+        """Load raw event dictionaries, with pending accesses applied."""
+        raw = self._backend.load_raw()
+        accesses = self._access_journal.load()
+        if accesses:
+            raw = list(apply_accesses(raw, accesses))
+        return raw
+
+    def _iter_raw(self) -> Iterator[dict]:
+        """Stream raw event dictionaries (see StorageBackend.iter_raw()), with pending accesses applied."""
+        accesses = self._access_journal.load()
+        if not accesses:
+            return self._backend.iter_raw()
+        return apply_accesses(self._backend.iter_raw(), accesses)
+
+    def _append_raw(self, records: list[dict]) -> None:
+        """Append records to the backend, folding pending accesses into a JSON array rewrite."""
+        if self._backend.name != BACKEND_JSON:
+            self._backend.append_raw(records)
+            return
+        # WHAT: A JSON array append is a read-modify-write of the whole
+        # file; fold the access journal into that same write.
+        # WHY: The rewrite is already paid for, so the fold costs nothing.
+        accesses = self._access_journal.take()
+        if accesses is None:
+            self._backend.append_raw(records)
+            return
+        raw = list(apply_accesses(self._backend.load_raw(), accesses))
+        raw.extend(records)
+        self._save_raw(raw)
+        self._access_journal.finish_fold()
 
     def _save_raw(self, events: list[dict]) -> None:
-        """Save raw event dictionaries to the JSON file atomically.
+        """Replace the stored event dictionaries atomically."""
+        self._backend.rewrite_raw(events)
 
-        Uses temp file + rename for crash safety. The rename is atomic
-        on POSIX systems (macOS, Linux) for same-filesystem operations.
+    def _known_hashes(self, raw: list[dict] | None = None) -> set[bytes]:
+        """Return content hashes of every stored event.
+
+        Served from memory or hashes.idx while the store fingerprint
+        matches; otherwise rebuilt from the stored events (self-healing).
+
+        Args:
+            raw: Already-loaded raw events to rebuild from, if the caller
+                 has them, to avoid a second read.
         """
-        self._project_dir.mkdir(parents=True, exist_ok=True)
-        tmp_path = self._events_path.with_suffix(".json.tmp")
-        try:
-            content = json.dumps(events, indent=2, ensure_ascii=False)
-            tmp_path.write_text(content, encoding="utf-8")
-            tmp_path.rename(self._events_path)
-        except OSError:
-            if tmp_path.exists():
-                tmp_path.unlink()
-            raise
+        fingerprint = self._fingerprint()
+        if self._hashes_fingerprint == fingerprint:
+            return self._hashes
+        hashes = self._hash_index.load(fingerprint)
+        if hashes is None:
+            if raw is None:
+                raw = self._load_raw()
+            hashes = {digest(raw_content_hash(r)) for r in raw}
+            self._hash_index.write(hashes, fingerprint)
+        self._hashes = hashes
+        self._hashes_fingerprint = fingerprint
+        return hashes
+
+    def _synced_fingerprint(self) -> str:
+        """Store fingerprint the hash index was last synced to.
+
+        Only valid after a _known_hashes() or _index_appended() call.
+        """
+        assert self._hashes_fingerprint is not None  # Set by either call
+        return self._hashes_fingerprint
+
+    def _index_appended(self, hashes: list[bytes]) -> None:
+        """Record a backend write in the index.
+
+        Must follow a _known_hashes() call made before the write, so the
+        index described the store as it was just before this change.
+        """
+        fingerprint = self._fingerprint()
+        self._hash_index.append(hashes, fingerprint)
+        self._hashes.update(hashes)
+        self._hashes_fingerprint = fingerprint
+
+
+def open_store(project_hash: str, config: CortexConfig | None = None) -> "EventStore | SQLiteEventStore":
+    """Open the event store for a project using config.store_backend.
+
+    "sqlite" returns a SQLiteEventStore; every other value returns an
+    EventStore, which picks its own file backend ("json" or "jsonl").
+    """
+    config = config or CortexConfig()
+    if config.store_backend == BACKEND_SQLITE:
+        return SQLiteEventStore(project_hash, config)
+    return EventStore(project_hash, config)
 
 
 class HookState:
@@ -13,10 +13,13 @@ transcripts. Key differences from the Anthropic API message format:
 - Tool results arrive as "user" type entries, not "human"
 """
 
-import json
 import re
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, AnyStr, BinaryIO
+
+from cortex.codec import active_codec
 
 # WHAT: Top-level record types in Claude Code JSONL transcripts.
 # WHY: Not all records are conversation messages. summary and
@@ -35,16 +38,38 @@ CONTENT_TYPE_THINKING = "thinking"
 CONTENT_TYPE_TOOL_USE = "tool_use"
 CONTENT_TYPE_TOOL_RESULT = "tool_result"
 
-# WHAT: Regex to match fenced code blocks (``` or ~~~).
-# WHY: When scanning for keywords, we need to ignore code blocks
-# because they contain irrelevant variable names and syntax.
-_CODE_BLOCK_RE = re.compile(
-    r"```[\s\S]*?```|~~~[\s\S]*?~~~",
-    re.MULTILINE,
-)
-
-# WHAT: Regex to match inline code spans (`...`).
-# WHY: Inline code also causes false keyword matches.
+# WHAT: Read size for TranscriptReader's binary line splitter.
+# WHY: Large reads amortize syscall and per-line Python overhead; 1 MiB
+# keeps peak memory small even for multi-hundred-MB transcripts.
+_READ_CHUNK_BYTES = 1024 * 1024
+
+# WHAT: Prefix and messageId pattern of file-history-snapshot lines.
+# WHY: Snapshots carry file-backup bookkeeping that Cortex never reads.
+# Recognizing them from the raw line skips JSON decoding entirely.
+_SNAPSHOT_PREFIX = '{"type":"file-history-snapshot"'
+_SNAPSHOT_PREFIX_BYTES = _SNAPSHOT_PREFIX.encode("ascii")
+_MESSAGE_ID_RE = re.compile(r'"messageId":"([^"\\]*)"')
+
+# WHAT: Longest string kept from a non-TodoWrite toolUseResult.
+# WHY: Short fields (type, filePath, status) are useful metadata; longer
+# ones are tool output duplicated from the tool_result content block.
+_MAX_RESULT_FIELD_CHARS = 256
+
+# WHAT: Regexes splitting text around code delimiters: fence runs (3+
+# backticks or tildes) and backtick runs of any length.
+# WHY: strip_code_blocks() pairs these runs itself (see there), so
+# fences and spans of any length are handled without backtracking. The
+# capturing group makes re.split() return text and runs interleaved in
+# one C-level pass, which is cheaper than collecting match spans.
+_FENCE_SPLIT_RE = re.compile(r"(```+|~~~+)")
+_BACKTICK_SPLIT_RE = re.compile(r"(`+)")
+
+# WHAT: Regexes for 3-character fenced blocks and single-backtick spans.
+# WHY: Fast paths. When every fence run is exactly three characters, or
+# every backtick run is a single backtick, these pair delimiters exactly
+# like the run-pairing code, at regex-engine speed. Both stay linear: a
+# lazy scan only fails to find its closer for the last opener.
+_FENCED_BLOCK_RE = re.compile(r"```[\s\S]*?```|~~~[\s\S]*?~~~")
 _INLINE_CODE_RE = re.compile(r"`[^`]+`")
 
 
@@ -80,7 +105,7 @@ class ToolResult:
     metadata: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptEntry:
     """One parsed JSONL line from a Claude Code transcript.
 
@@ -101,7 +126,16 @@ class TranscriptEntry:
         role: Message role ("user" or "assistant"), empty for non-message records.
         content_blocks: Raw content blocks from the message.
         summary_text: For summary records, the summary text.
-        raw: The original parsed JSON dict (for anything not explicitly modeled).
+        raw: The parsed JSON dict (for anything not explicitly modeled),
+            minus payloads Cortex never reads (see parse_entry()).
+        offset: Byte offset just past this entry's line in the transcript
+            file. Saving it resumes reading after this entry. 0 for entries
+            not produced by TranscriptReader.
+
+    Derived views (block_types, text, stripped_text, tool_calls,
+    tool_results) are computed on first access and cached on the entry.
+    Entries are treated as immutable once parsed: changing content_blocks
+    or raw after reading a view leaves the cached view stale.
     """
 
     record_type: str = ""
@@ -117,6 +151,17 @@ class TranscriptEntry:
     content_blocks: list = field(default_factory=list)
     summary_text: str = ""
     raw: dict = field(default_factory=dict)
+    offset: int = 0
+
+    # WHAT: Memoized derived views, filled on first access.
+    # WHY: Every extraction layer needs some of these; deriving each once
+    # per entry instead of once per layer (and per has_* check) removes
+    # repeated scans of content_blocks.
+    _block_types: frozenset | None = field(default=None, init=False, repr=False, compare=False)
+    _text: str | None = field(default=None, init=False, repr=False, compare=False)
+    _stripped_text: str | None = field(default=None, init=False, repr=False, compare=False)
+    _tool_calls: list | None = field(default=None, init=False, repr=False, compare=False)
+    _tool_results: list | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def is_user(self) -> bool:
@@ -143,20 +188,55 @@ class TranscriptEntry:
         """True if this is a user or assistant message (not metadata)."""
         return self.record_type in (RECORD_TYPE_USER, RECORD_TYPE_ASSISTANT)
 
+    @property
+    def block_types(self) -> frozenset:
+        """Types of the content blocks in this entry (cached)."""
+        if self._block_types is None:
+            self._block_types = frozenset([b.get("type") for b in self.content_blocks if isinstance(b, dict)])
+        return self._block_types
+
     @property
     def has_tool_use(self) -> bool:
         """True if any content block is a tool_use."""
-        return any(isinstance(b, dict) and b.get("type") == CONTENT_TYPE_TOOL_USE for b in self.content_blocks)
+        return CONTENT_TYPE_TOOL_USE in self.block_types
 
     @property
     def has_tool_result(self) -> bool:
         """True if any content block is a tool_result."""
-        return any(isinstance(b, dict) and b.get("type") == CONTENT_TYPE_TOOL_RESULT for b in self.content_blocks)
+        return CONTENT_TYPE_TOOL_RESULT in self.block_types
 
     @property
     def has_thinking(self) -> bool:
         """True if any content block is a thinking block."""
-        return any(isinstance(b, dict) and b.get("type") == CONTENT_TYPE_THINKING for b in self.content_blocks)
+        return CONTENT_TYPE_THINKING in self.block_types
+
+    @property
+    def text(self) -> str:
+        """extract_text_content(self), cached."""
+        if self._text is None:
+            self._text = extract_text_content(self)
+        return self._text
+
+    @property
+    def stripped_text(self) -> str:
+        """strip_code_blocks(self.text), cached."""
+        if self._stripped_text is None:
+            self._stripped_text = strip_code_blocks(self.text)
+        return self._stripped_text
+
+    @property
+    def tool_calls(self) -> list["ToolCall"]:
+        """extract_tool_calls(self), cached."""
+        if self._tool_calls is None:
+            self._tool_calls = extract_tool_calls(self)
+        return self._tool_calls
+
+    @property
+    def tool_results(self) -> list["ToolResult"]:
+        """extract_tool_results(self), cached."""
+        if self._tool_results is None:
+            self._tool_results = extract_tool_results(self)
+        return self._tool_results
 
 
 def parse_entry(raw: dict) -> TranscriptEntry:
@@ -165,6 +245,12 @@ def parse_entry(raw: dict) -> TranscriptEntry:
     Handles all known record types defensively. Unknown types are
     stored with record_type set to the raw type value.
 
+    Payloads Cortex never reads are not kept on the entry: snapshot
+    records keep only their type and messageId, and a message's
+    toolUseResult keeps only short scalar fields (such as type and
+    filePath) unless it is a TodoWrite result (oldTodos/newTodos).
+    The input dict itself is not modified.
+
     Args:
         raw: A dictionary decoded from one JSONL line.
 
@@ -172,30 +258,22 @@ def parse_entry(raw: dict) -> TranscriptEntry:
         A populated TranscriptEntry.
     """
     record_type = raw.get("type", "")
-    entry = TranscriptEntry(record_type=record_type, raw=raw)
 
     if record_type == RECORD_TYPE_SUMMARY:
-        entry.summary_text = raw.get("summary", "")
-        entry.uuid = raw.get("leafUuid", "")
-        return entry
+        return TranscriptEntry(
+            record_type=record_type,
+            uuid=raw.get("leafUuid", ""),
+            summary_text=raw.get("summary", ""),
+            raw=raw,
+        )
 
     if record_type == RECORD_TYPE_FILE_SNAPSHOT:
-        entry.uuid = raw.get("messageId", "")
-        return entry
+        message_id = raw.get("messageId", "")
+        return _snapshot_entry(message_id)
 
     # User and assistant messages share the same envelope structure
     if record_type in (RECORD_TYPE_USER, RECORD_TYPE_ASSISTANT):
-        entry.uuid = raw.get("uuid", "")
-        entry.parent_uuid = raw.get("parentUuid") or ""
-        entry.session_id = raw.get("sessionId", "")
-        entry.timestamp = raw.get("timestamp", "")
-        entry.request_id = raw.get("requestId", "")
-        entry.is_sidechain = raw.get("isSidechain", False)
-        entry.git_branch = raw.get("gitBranch", "")
-        entry.cwd = raw.get("cwd", "")
-
         message = raw.get("message", {})
-        entry.role = message.get("role", "")
 
         # WHAT: Normalize content to always be a list of blocks.
         # WHY: User messages have content as a plain string for human
@@ -203,13 +281,64 @@ def parse_entry(raw: dict) -> TranscriptEntry:
         # all downstream code.
         content = message.get("content", [])
         if isinstance(content, str):
-            entry.content_blocks = [{"type": "text", "text": content}]
+            content_blocks = [{"type": "text", "text": content}]
         elif isinstance(content, list):
-            entry.content_blocks = content
+            content_blocks = content
         else:
-            entry.content_blocks = []
-
-    return entry
+            content_blocks = []
+
+        # WHAT: Slim toolUseResult unless it carries TodoWrite state.
+        # WHY: For Read/Write/Bash/Task it repeats the full tool output
+        # (file contents, long stdout, patches) already present in the
+        # tool_result block. Only its small scalar fields are metadata.
+        tool_use_result = raw.get("toolUseResult")
+        if tool_use_result is not None and not _is_todo_result(tool_use_result):
+            raw = dict(raw)
+            raw["toolUseResult"] = _slim_tool_use_result(tool_use_result)
+
+        return TranscriptEntry(
+            record_type=record_type,
+            uuid=raw.get("uuid", ""),
+            parent_uuid=raw.get("parentUuid") or "",
+            session_id=raw.get("sessionId", ""),
+            timestamp=raw.get("timestamp", ""),
+            request_id=raw.get("requestId", ""),
+            is_sidechain=raw.get("isSidechain", False),
+            git_branch=raw.get("gitBranch", ""),
+            cwd=raw.get("cwd", ""),
+            role=message.get("role", ""),
+            content_blocks=content_blocks,
+            raw=raw,
+        )
+
+    return TranscriptEntry(record_type=record_type, raw=raw)
+
+
+def _snapshot_entry(message_id: str) -> TranscriptEntry:
+    """Build the entry for a file-history-snapshot record."""
+    return TranscriptEntry(
+        record_type=RECORD_TYPE_FILE_SNAPSHOT,
+        uuid=message_id,
+        raw={"type": RECORD_TYPE_FILE_SNAPSHOT, "messageId": message_id},
+    )
+
+
+def _is_todo_result(tool_use_result: object) -> bool:
+    """True if a toolUseResult holds TodoWrite before/after state."""
+    return isinstance(tool_use_result, dict) and ("oldTodos" in tool_use_result or "newTodos" in tool_use_result)
+
+
+def _slim_tool_use_result(tool_use_result: object) -> dict:
+    """Keep only the scalar, short-string fields of a toolUseResult."""
+    if not isinstance(tool_use_result, dict):
+        return {}
+    return {
+        key: value
+        for key, value in tool_use_result.items()
+        if value is None
+        or isinstance(value, (bool, int, float))
+        or (isinstance(value, str) and len(value) <= _MAX_RESULT_FIELD_CHARS)
+    }
 
 
 def extract_text_content(entry: TranscriptEntry) -> str:
@@ -339,8 +468,17 @@ def strip_code_blocks(text: str) -> str:
     code examples, variable names, and syntax in code blocks.
 
     Removes:
-    - Fenced code blocks (``` ... ``` and ~~~ ... ~~~)
-    - Inline code spans (` ... `)
+    - Fenced code blocks: a run of 3+ backticks or tildes up to the next
+      run of the same character at least as long (``` ... ```,
+      ~~~~ ... ~~~~, a ```` block containing ``` lines, ...)
+    - Inline code spans: a backtick run up to the next run of exactly the
+      same length (` ... `, `` a ` b ``)
+
+    An opener with no matching closer is kept as plain text. Runs in
+    linear time: the text is split around its delimiter runs once and
+    the runs are paired left to right, so there is no backtracking.
+    Texts whose fences are all three characters long, or whose backtick
+    runs are all single, take equivalent regex fast paths.
 
     Args:
         text: The text to strip code from.
@@ -350,11 +488,157 @@ def strip_code_blocks(text: str) -> str:
     """
     if not text:
         return ""
+
     # WHAT: Remove fenced blocks first (they may contain backticks).
     # WHY: Order matters — removing inline first would break fenced detection.
-    result = _CODE_BLOCK_RE.sub("", text)
-    result = _INLINE_CODE_RE.sub("", result)
-    return result
+    if "```" in text or "~~~" in text:
+        if "````" not in text and "~~~~" not in text:
+            text = _FENCED_BLOCK_RE.sub("", text)
+        else:
+            text = _strip_fences(_FENCE_SPLIT_RE.split(text))
+
+    if "`" not in text:
+        return text
+    if "``" not in text:
+        return _INLINE_CODE_RE.sub("", text)
+    return _strip_spans(_BACKTICK_SPLIT_RE.split(text))
+
+
+def _strip_fences(pieces: list[str]) -> str:
+    """Join split text, dropping each fence run through its closer.
+
+    pieces alternates text and fence runs (re.split() with a group). A
+    closer is the first later run of the same character at least as
+    long. Paired openers are found by scanning forward, which is linear
+    because the next scan starts after the closer. The first opener with
+    no closer would make that quadratic, so from then on the closers
+    come from a table built right to left with one monotonic stack per
+    character.
+    """
+    runs = pieces[1::2]
+    n = len(runs)
+    closers: list[int] | None = None
+    kept = [pieces[0]]
+    i = 0
+    while i < n:
+        run = runs[i]
+        if closers is None:
+            char = run[0]
+            length = len(run)
+            j = i + 1
+            while j < n and (runs[j][0] != char or len(runs[j]) < length):
+                j += 1
+            if j == n:
+                closers = _fence_closers(runs)
+                j = -1
+        else:
+            j = closers[i]
+        if j < 0:
+            kept.append(run)
+        else:
+            i = j
+        kept.append(pieces[2 * i + 2])
+        i += 1
+    return "".join(kept)
+
+
+def _fence_closers(runs: list[str]) -> list[int]:
+    """For each fence run, the index of the run closing it, or -1."""
+    closers = [-1] * len(runs)
+    stacks: dict[str, list[int]] = {"`": [], "~": []}
+    for i in range(len(runs) - 1, -1, -1):
+        length = len(runs[i])
+        stack = stacks[runs[i][0]]
+        while stack and len(runs[stack[-1]]) < length:
+            stack.pop()
+        if stack:
+            closers[i] = stack[-1]
+        stack.append(i)
+    return closers
+
+
+def _strip_spans(pieces: list[str]) -> str:
+    """Join split text, dropping each backtick span through its closer.
+
+    pieces alternates text and backtick runs. A span closes on the next
+    run of exactly the same length, found with list.index(). As in
+    _strip_fences(), the first opener with no closer switches to a
+    last-occurrence table so unclosed runs are rejected in O(1).
+    """
+    lengths = list(map(len, pieces[1::2]))
+    n = len(lengths)
+    last: dict[int, int] | None = None
+    kept = [pieces[0]]
+    i = 0
+    while i < n:
+        length = lengths[i]
+        j = -1
+        if last is None:
+            try:
+                j = lengths.index(length, i + 1)
+            except ValueError:
+                last = {run_length: k for k, run_length in enumerate(lengths)}
+        elif last[length] > i:
+            j = lengths.index(length, i + 1)
+        if j < 0:
+            kept.append(pieces[2 * i + 1])
+        else:
+            i = j
+        kept.append(pieces[2 * i + 2])
+        i += 1
+    return "".join(kept)
+
+
+class LineFilter:
+    """Cheap substring test deciding whether a raw JSONL line needs decoding.
+
+    A line matches if it contains any needle verbatim, or any
+    ignore_case needle in any letter case. Needles are matched against
+    the raw JSON text, so they must not contain characters JSON escapes
+    (quotes inside string values, backslashes, control characters).
+
+    Usage:
+        prefilter = LineFilter(['"tool_use"', "Decision:"], ignore_case=["error resolved:"])
+        for entry in reader.iter_new(offset, prefilter=prefilter):
+            ...
+    """
+
+    def __init__(self, needles: Iterable[str], ignore_case: Iterable[str] = ()):
+        self._needles = tuple(dict.fromkeys(needles))
+        self._folded = tuple(dict.fromkeys(n.lower() for n in ignore_case))
+        self._needles_bytes: tuple[bytes, ...] = tuple(n.encode("utf-8") for n in self._needles)
+        self._folded_bytes: tuple[bytes, ...] = tuple(n.encode("utf-8") for n in self._folded)
+
+    @property
+    def needles(self) -> tuple[str, ...]:
+        """Case-sensitive needles."""
+        return self._needles
+
+    @property
+    def ignore_case(self) -> tuple[str, ...]:
+        """Case-insensitive needles (lowercased)."""
+        return self._folded
+
+    def matches(self, line: str | bytes) -> bool:
+        """True if line contains any needle."""
+        if isinstance(line, str):
+            return _contains_any(line, self._needles, self._folded)
+        return _contains_any(line, self._needles_bytes, self._folded_bytes)
+
+
+def _contains_any(line: AnyStr, needles: tuple[AnyStr, ...], folded: tuple[AnyStr, ...]) -> bool:
+    """True if line contains a needle, or a folded needle once lowercased."""
+    for needle in needles:
+        if needle in line:
+            return True
+    if folded:
+        # WHAT: Lowercase only once the case-sensitive needles miss.
+        # WHY: Substring search is memchr-fast; lower() copies the line.
+        lowered = line.lower()
+        for needle in folded:
+            if needle in lowered:
+                return True
+    return False
 
 
 class TranscriptReader:
@@ -378,6 +662,10 @@ class TranscriptReader:
 
         # Later: read only new content
         entries = reader.read_new(from_offset=saved_offset)
+
+        # Streaming: one entry in memory at a time
+        for entry in reader.iter_new(from_offset=saved_offset):
+            ...
     """
 
     def __init__(self, path: Path):
@@ -388,6 +676,8 @@ class TranscriptReader:
         """
         self._path = path
         self._last_offset: int = 0
+        self._entries_read: int = 0
+        self._lines_skipped: int = 0
 
     @property
     def path(self) -> Path:
@@ -399,56 +689,104 @@ class TranscriptReader:
         """Byte offset after the last successful read."""
         return self._last_offset
 
-    def read_new(self, from_offset: int = 0) -> list[TranscriptEntry]:
-        """Read and parse new JSONL entries from the given byte offset.
+    @property
+    def entries_read(self) -> int:
+        """Number of entries yielded by the most recent read."""
+        return self._entries_read
 
-        Seeks to from_offset and reads all complete lines after that
-        point. Malformed lines are silently skipped (defensive parsing).
+    @property
+    def lines_skipped(self) -> int:
+        """Number of non-blank lines the most recent read's prefilter skipped."""
+        return self._lines_skipped
+
+    def iter_new(self, from_offset: int = 0, prefilter: "LineFilter | None" = None) -> Iterator[TranscriptEntry]:
+        """Lazily parse new JSONL entries from the given byte offset.
+
+        Generator form of read_new(): only the current chunk and entry are
+        held in memory, so a multi-hundred-MB transcript can be streamed
+        through extraction without materializing every entry first.
+
+        Each yielded entry carries its own offset (see TranscriptEntry).
+        last_offset advances as lines are consumed, so it is accurate
+        even if the caller stops iterating early. A final line with no
+        trailing newline is consumed only if it is already valid JSON;
+        otherwise last_offset stops before it so the next read retries it.
 
         Args:
             from_offset: Byte offset to start reading from. Pass 0 to
                         read the entire file, or pass a previously
                         saved offset for incremental reads.
+            prefilter: Optional LineFilter. Complete lines it rejects are
+                        skipped without JSON decoding (they still advance
+                        last_offset and are counted in lines_skipped).
 
-        Returns:
-            List of parsed TranscriptEntry objects (new entries only).
-            Returns empty list if file doesn't exist or offset is past EOF.
+        Yields:
+            Parsed TranscriptEntry objects (new entries only). Yields
+            nothing if the file doesn't exist or offset is past EOF.
         """
+        self._entries_read = 0
+        self._lines_skipped = 0
         if not self._path.exists():
-            return []
+            return
 
-        entries = []
+        loads = active_codec().loads
+        wanted = prefilter.matches if prefilter is not None else None
         try:
-            with open(self._path, "r", encoding="utf-8") as f:
+            with open(self._path, "rb") as f:
                 f.seek(from_offset)
-                while True:
-                    line = f.readline()
-                    if not line:
-                        break
+                self._last_offset = f.tell()
+                for line, end, complete in _iter_lines(f, self._last_offset):
+                    if wanted is not None and complete and not wanted(line):
+                        self._last_offset = end
+                        if line and not line.isspace():
+                            self._lines_skipped += 1
+                        continue
 
-                    stripped = line.strip()
-                    if not stripped:
+                    entry = _sniff_snapshot(line) if complete else None
+                    if entry is not None:
+                        self._last_offset = entry.offset = end
+                        self._entries_read += 1
+                        yield entry
                         continue
 
-                    try:
-                        raw = json.loads(stripped)
-                        if isinstance(raw, dict):
-                            entries.append(parse_entry(raw))
-                    except json.JSONDecodeError:
-                        # WHAT: Skip malformed lines silently.
-                        # WHY: Transcript files may have partial writes
-                        # if Claude Code was interrupted. The parser must
-                        # be resilient to garbage data.
+                    raw = _decode_line(line, loads)
+                    if not complete and raw is None:
+                        # WHAT: Hold back an unterminated, unparseable tail.
+                        # WHY: It is most likely a record Claude Code is still
+                        # writing. Advancing past it would skip that record
+                        # forever once the rest of it lands.
+                        break
+                    self._last_offset = end
+                    if raw is None:
                         continue
 
-                self._last_offset = f.tell()
+                    entry = parse_entry(raw)
+                    entry.offset = end
+                    self._entries_read += 1
+                    yield entry
         except OSError:
-            # WHAT: Return empty on file errors.
+            # WHAT: Stop on file errors.
             # WHY: The file may be deleted, locked, or permissions changed
             # between the exists() check and the open(). Defensive.
-            return []
+            return
+
+    def read_new(self, from_offset: int = 0) -> list[TranscriptEntry]:
+        """Read and parse new JSONL entries from the given byte offset.
+
+        Seeks to from_offset and reads all complete lines after that
+        point. Malformed lines are silently skipped (defensive parsing).
+        Prefer iter_new() for large transcripts.
 
-        return entries
+        Args:
+            from_offset: Byte offset to start reading from. Pass 0 to
+                        read the entire file, or pass a previously
+                        saved offset for incremental reads.
+
+        Returns:
+            List of parsed TranscriptEntry objects (new entries only).
+            Returns empty list if file doesn't exist or offset is past EOF.
+        """
+        return list(self.iter_new(from_offset))
 
     def read_all(self) -> list[TranscriptEntry]:
         """Read all entries from the transcript file.
@@ -461,6 +799,77 @@ class TranscriptReader:
         return self.read_new(from_offset=0)
 
 
+def _iter_lines(f: BinaryIO, offset: int) -> Iterator[tuple[str | bytes, int, bool]]:
+    """Yield (line, end_offset, complete) for each line of a binary file.
+
+    Reads _READ_CHUNK_BYTES at a time and splits out the complete lines
+    of each chunk. end_offset is the absolute byte offset just past the
+    line (including its newline). A trailing fragment with no newline is
+    yielded last with complete=False.
+
+    Lines from an all-ASCII chunk are yielded as str (decoded once per
+    chunk, and str length equals byte length); otherwise as bytes.
+    """
+    # WHAT: Pieces of a line that spans chunk boundaries.
+    # WHY: Joined once when its newline arrives, so a very long line
+    # costs O(length) rather than O(length^2) in re-concatenation.
+    pending: list[bytes] = []
+    while True:
+        chunk = f.read(_READ_CHUNK_BYTES)
+        if not chunk:
+            break
+        last_nl = chunk.rfind(b"\n")
+        if last_nl < 0:
+            pending.append(chunk)
+            continue
+
+        block = chunk[:last_nl]
+        if pending:
+            pending.append(block)
+            block = b"".join(pending)
+        pending = [chunk[last_nl + 1 :]] if last_nl + 1 < len(chunk) else []
+
+        lines = block.decode("ascii").split("\n") if block.isascii() else block.split(b"\n")
+        for line in lines:
+            offset += len(line) + 1
+            yield line, offset, True
+
+    if pending:
+        tail = b"".join(pending)
+        yield tail, offset + len(tail), False
+
+
+def _sniff_snapshot(line: str | bytes) -> TranscriptEntry | None:
+    """Build a snapshot entry from the raw line without decoding it.
+
+    Returns None unless the line is a file-history-snapshot record whose
+    top-level "type" is its first key, as Claude Code writes them.
+    """
+    if isinstance(line, bytes):
+        if not line.startswith(_SNAPSHOT_PREFIX_BYTES):
+            return None
+        line = line.decode("utf-8", "replace")
+    elif not line.startswith(_SNAPSHOT_PREFIX):
+        return None
+    match = _MESSAGE_ID_RE.search(line)
+    if match is None or not line.rstrip().endswith("}"):
+        return None
+    return _snapshot_entry(match.group(1))
+
+
+def _decode_line(line: str | bytes, loads: Callable[[str | bytes], Any]) -> dict | None:
+    """Decode one JSONL line, or return None if blank, malformed, or not an object."""
+    try:
+        raw = loads(line)
+    except ValueError:
+        # WHAT: Skip blank and malformed lines silently.
+        # WHY: Transcript files may have partial writes
+        # if Claude Code was interrupted. The parser must
+        # be resilient to garbage data.
+        return None
+    return raw if isinstance(raw, dict) else None
+
+
 def find_transcript_path(project_cwd: str) -> Path | None:
     """Find the Claude Code transcript directory for a project.
 
@@ -484,8 +893,8 @@ def find_transcript_path(project_cwd: str) -> Path | None:
     return None
 
 
-def find_latest_transcript(transcript_dir: Path) -> Path | None:
-    """Find the most recently modified main session transcript.
+def find_session_transcripts(transcript_dir: Path) -> list[Path]:
+    """List every main session transcript, oldest first.
 
     Main session transcripts are UUID-named .jsonl files (not
     prefixed with "agent-"). Agent transcripts are sub-conversations
@@ -495,10 +904,10 @@ def find_latest_transcript(transcript_dir: Path) -> Path | None:
         transcript_dir: Path to a project's transcript directory.
 
     Returns:
-        Path to the most recent .jsonl file, or None if none found.
+        Transcript paths sorted by modification time, then name.
     """
     if not transcript_dir.exists():
-        return None
+        return []
 
     # WHAT: Filter for UUID-pattern JSONL files (main sessions).
     # WHY: Agent files (agent-*.jsonl) are sub-conversations that
@@ -506,13 +915,27 @@ def find_latest_transcript(transcript_dir: Path) -> Path | None:
     # Parsing them separately would create duplicates.
     candidates = []
     for f in transcript_dir.glob("*.jsonl"):
-        if not f.name.startswith("agent-"):
-            candidates.append(f)
+        if f.name.startswith("agent-"):
+            continue
+        try:
+            candidates.append((f.stat().st_mtime, f.name, f))
+        except OSError:
+            continue
 
-    if not candidates:
-        return None
+    candidates.sort()
+    return [f for _, _, f in candidates]
+
+
+def find_latest_transcript(transcript_dir: Path) -> Path | None:
+    """Find the most recently modified main session transcript.
 
-    # WHAT: Sort by modification time, most recent first.
+    Args:
+        transcript_dir: Path to a project's transcript directory.
+
+    Returns:
+        Path to the most recent .jsonl file, or None if none found.
+    """
+    # WHAT: The last file by modification time.
     # WHY: The most recently modified file is likely the active session.
-    candidates.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-    return candidates[0]
+    candidates = find_session_transcripts(transcript_dir)
+    return candidates[-1] if candidates else None
@@ -0,0 +1,65 @@
+"""Tests for the write-behind access journal."""
+
+from pathlib import Path
+
+from cortex.access_journal import AccessJournal, apply_accesses
+
+
+class TestAccessJournal:
+    """Tests for the access.jsonl file format and fold protocol."""
+
+    def test_missing_journal_is_empty(self, tmp_path: Path) -> None:
+        journal = AccessJournal(tmp_path / "access.jsonl")
+        assert journal.load() == {}
+        assert journal.token() == ""
+        assert journal.size() == 0
+        assert journal.take() is None
+
+    def test_replay_keeps_latest_time_and_counts(self, tmp_path: Path) -> None:
+        journal = AccessJournal(tmp_path / "access.jsonl")
+        journal.append(["a", "b"], "2026-01-01T00:00:00+00:00")
+        journal.append(["a"], "2026-01-02T00:00:00+00:00")
+        assert journal.load() == {"a": ("2026-01-02T00:00:00+00:00", 2), "b": ("2026-01-01T00:00:00+00:00", 1)}
+
+    def test_token_changes_on_append(self, tmp_path: Path) -> None:
+        journal = AccessJournal(tmp_path / "access.jsonl")
+        journal.append(["a"], "t1")
+        token = journal.token()
+        journal.append(["a"], "t2")
+        assert journal.token() not in ("", token)
+
+    def test_torn_and_malformed_lines_skipped(self, tmp_path: Path) -> None:
+        path = tmp_path / "access.jsonl"
+        path.write_bytes(b'{"at": "t1", "ids": ["a"]}\n\n[1, 2]\n{"at": "t2"}\n{"at": "t3", "ids": ["b"')
+        assert AccessJournal(path).load() == {"a": ("t1", 1)}
+
+    def test_take_moves_journal_aside(self, tmp_path: Path) -> None:
+        journal = AccessJournal(tmp_path / "access.jsonl")
+        journal.append(["a"], "t1")
+        assert journal.take() == {"a": ("t1", 1)}
+        # Accesses recorded during a fold land in a fresh journal.
+        journal.append(["b"], "t2")
+        journal.finish_fold()
+        assert journal.load() == {"b": ("t2", 1)}
+        assert list(tmp_path.iterdir()) == [journal.path]
+
+    def test_discard_drops_everything(self, tmp_path: Path) -> None:
+        journal = AccessJournal(tmp_path / "access.jsonl")
+        journal.append(["a"], "t1")
+        journal.take()
+        journal.append(["b"], "t2")
+        journal.discard()
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestApplyAccesses:
+    """Tests for applying pending accesses to raw records."""
+
+    def test_updates_named_records(self) -> None:
+        records = [{"id": "a", "accessed_at": "t0", "access_count": 3}, {"id": "b", "accessed_at": "t0"}, {}]
+        updated = list(apply_accesses(records, {"a": ("t2", 2), "b": ("t1", 1)}))
+        assert updated == [
+            {"id": "a", "accessed_at": "t2", "access_count": 5},
+            {"id": "b", "accessed_at": "t1", "access_count": 1},
+            {},
+        ]
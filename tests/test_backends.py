@@ -0,0 +1,143 @@
+"""Tests for the Cortex event store storage backends."""
+
+import json
+from pathlib import Path
+
+from cortex.backends import (
+    JsonArrayBackend,
+    JsonlSegmentBackend,
+    open_backend,
+)
+from cortex.config import CortexConfig
+from cortex.models import EventType, create_event
+from cortex.store import EventStore
+
+
+def _records(n: int, start: int = 0) -> list[dict]:
+    return [create_event(EventType.COMMAND_RUN, f"cmd {i}").to_dict() for i in range(start, start + n)]
+
+
+class TestOpenBackend:
+    """Tests for backend selection from config."""
+
+    def test_default_is_json_array(self, tmp_path: Path) -> None:
+        """Default config selects the events.json backend."""
+        assert isinstance(open_backend(tmp_path, CortexConfig()), JsonArrayBackend)
+
+    def test_jsonl_selected(self, tmp_path: Path) -> None:
+        """store_backend='jsonl' selects the segment backend."""
+        backend = open_backend(tmp_path, CortexConfig(store_backend="jsonl"))
+        assert isinstance(backend, JsonlSegmentBackend)
+
+    def test_unknown_falls_back_to_json(self, tmp_path: Path) -> None:
+        """A mistyped backend name never stops Cortex from starting."""
+        assert isinstance(open_backend(tmp_path, CortexConfig(store_backend="nope")), JsonArrayBackend)
+
+
+class TestJsonlSegmentBackend:
+    """Tests for append-only JSONL segments."""
+
+    def test_round_trip_preserves_order(self, tmp_path: Path) -> None:
+        """Appended records load back in insertion order."""
+        backend = JsonlSegmentBackend(tmp_path)
+        backend.append_raw(_records(3))
+        backend.append_raw(_records(2, start=3))
+        assert [r["content"] for r in backend.load_raw()] == [f"cmd {i}" for i in range(5)]
+
+    def test_append_does_not_rewrite_existing_segment(self, tmp_path: Path) -> None:
+        """Appends only add bytes to the active segment."""
+        backend = JsonlSegmentBackend(tmp_path)
+        backend.append_raw(_records(1))
+        segment = backend.segment_files()[-1]
+        before = segment.read_bytes()
+        backend.append_raw(_records(1, start=1))
+        assert segment.read_bytes().startswith(before)
+
+    def test_rolls_to_new_segment_at_size_limit(self, tmp_path: Path) -> None:
+        """A full segment is left alone and a new one is started."""
+        backend = JsonlSegmentBackend(tmp_path, segment_max_bytes=1, max_segments=100)
+        for i in range(3):
+            backend.append_raw(_records(1, start=i))
+        assert len(backend.segment_files()) == 3
+        assert len(backend.load_raw()) == 3
+
+    def test_compacts_when_too_many_segments(self, tmp_path: Path) -> None:
+        """Exceeding max_segments merges everything into one base file."""
+        backend = JsonlSegmentBackend(tmp_path, segment_max_bytes=1, max_segments=2)
+        for i in range(3):
+            backend.append_raw(_records(1, start=i))
+        files = backend.segment_files()
+        assert len(files) == 1
+        assert files[0].name.startswith("base-")
+        assert [r["content"] for r in backend.load_raw()] == ["cmd 0", "cmd 1", "cmd 2"]
+
+    def test_rewrite_replaces_contents(self, tmp_path: Path) -> None:
+        """rewrite_raw drops previous segments."""
+        backend = JsonlSegmentBackend(tmp_path)
+        backend.append_raw(_records(3))
+        backend.rewrite_raw([])
+        assert backend.load_raw() == []
+        backend.append_raw(_records(1))
+        assert len(backend.load_raw()) == 1
+
+    def test_torn_tail_is_skipped_and_repaired(self, tmp_path: Path) -> None:
+        """A partially written last line does not corrupt later appends."""
+        backend = JsonlSegmentBackend(tmp_path)
+        backend.append_raw(_records(1))
+        segment = backend.segment_files()[-1]
+        with open(segment, "ab") as f:
+            f.write(b'{"id": "torn", "conte')
+        assert len(backend.load_raw()) == 1
+
+        backend.append_raw(_records(1, start=1))
+        assert [r["content"] for r in backend.load_raw()] == ["cmd 0", "cmd 1"]
+
+    def test_iter_raw_streams_what_load_raw_reads(self, tmp_path: Path) -> None:
+        """iter_raw yields the same records, skipping torn lines, across base and segments."""
+        backend = JsonlSegmentBackend(tmp_path, segment_max_bytes=1, max_segments=3)
+        for i in range(5):
+            backend.append_raw(_records(1, start=i))
+        with open(backend.segment_files()[-1], "ab") as f:
+            f.write(b'\n{"id": "torn", "conte')
+        assert list(backend.iter_raw()) == backend.load_raw()
+        assert [r["content"] for r in backend.iter_raw()] == [f"cmd {i}" for i in range(5)]
+
+    def test_stale_files_below_base_ignored(self, tmp_path: Path) -> None:
+        """Segments left behind by an interrupted compaction are not reloaded."""
+        backend = JsonlSegmentBackend(tmp_path)
+        backend.append_raw(_records(2))
+        backend.compact()
+        stale = backend.path / "seg-00000001.jsonl"
+        stale.write_text(json.dumps(_records(1, start=9)[0]) + "\n")
+        assert [r["content"] for r in backend.load_raw()] == ["cmd 0", "cmd 1"]
+
+    def test_migrates_events_json(self, tmp_path: Path) -> None:
+        """An existing events.json is imported once and set aside."""
+        JsonArrayBackend(tmp_path).rewrite_raw(_records(2))
+        backend = JsonlSegmentBackend(tmp_path)
+        assert len(backend.load_raw()) == 2
+        assert not (tmp_path / "events.json").exists()
+        assert (tmp_path / "events.json.migrated").exists()
+
+
+class TestEventStoreWithSegments:
+    """EventStore behaves identically on the JSONL backend."""
+
+    def test_store_operations(self, sample_project_hash: str, tmp_cortex_home: Path, sample_events: list) -> None:
+        """Append, dedup, briefing, mark_accessed, and clear all work."""
+        config = CortexConfig(cortex_home=tmp_cortex_home, store_backend="jsonl")
+        store = EventStore(sample_project_hash, config)
+        store.append_many(sample_events)
+        store.append_many(sample_events)
+        assert store.count() == len(sample_events)
+
+        briefing = store.load_for_briefing()
+        assert len(briefing["immortal"]) == 2
+
+        target = sample_events[4].id
+        store.mark_accessed([target])
+        loaded = {e.id: e for e in store.load_all()}
+        assert loaded[target].access_count == 1
+
+        store.clear()
+        assert store.count() == 0
@@ -0,0 +1,102 @@
+"""Tests for bulk historical transcript ingestion."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from cortex.backfill import BackfillState, backfill_project
+from cortex.config import CortexConfig
+from cortex.store import EventStore
+
+_FIXTURES = ["transcript_simple.jsonl", "transcript_decisions.jsonl", "transcript_mixed.jsonl"]
+
+
+@pytest.fixture
+def transcript_dir(tmp_path: Path, fixtures_dir: Path) -> Path:
+    """A Claude Code project directory with three sessions and an agent file."""
+    directory = tmp_path / "claude-project"
+    directory.mkdir()
+    for i, name in enumerate(_FIXTURES):
+        target = directory / f"0000000{i}-session.jsonl"
+        shutil.copy(fixtures_dir / name, target)
+    shutil.copy(fixtures_dir / "transcript_memory_tags.jsonl", directory / "agent-task-1.jsonl")
+    return directory
+
+
+def _contents(store: EventStore) -> list:
+    return sorted((e.type.value, e.content, e.session_id) for e in store.load_all())
+
+
+class TestBackfillProject:
+    """Tests for backfill_project()."""
+
+    def test_ingests_all_main_sessions(
+        self, transcript_dir: Path, sample_project_hash: str, sample_config: CortexConfig
+    ) -> None:
+        report = backfill_project(sample_project_hash, transcript_dir, sample_config, max_workers=1)
+        store = EventStore(sample_project_hash, sample_config)
+        assert report.files_total == 3
+        assert report.files_read == 3
+        assert report.bytes_read == sum(p.stat().st_size for p in transcript_dir.glob("0*.jsonl"))
+        assert report.events_added == store.count() > 0
+        assert report.mb_per_second > 0
+
+    def test_rerun_reads_nothing(
+        self, transcript_dir: Path, sample_project_hash: str, sample_config: CortexConfig
+    ) -> None:
+        backfill_project(sample_project_hash, transcript_dir, sample_config, max_workers=1)
+        report = backfill_project(sample_project_hash, transcript_dir, sample_config, max_workers=1)
+        assert report.files_read == 0
+        assert report.events_added == 0
+
+    def test_resumes_from_saved_offsets(
+        self, transcript_dir: Path, sample_project_hash: str, sample_config: CortexConfig
+    ) -> None:
+        """An interrupted run stores what it finished; the rerun reads only the rest."""
+        seen: list[str] = []
+
+        def interrupt(result) -> None:
+            seen.append(result.path)
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            backfill_project(sample_project_hash, transcript_dir, sample_config, max_workers=1, on_file=interrupt)
+        assert list(BackfillState(sample_project_hash, sample_config).load()) == seen
+
+        report = backfill_project(sample_project_hash, transcript_dir, sample_config, max_workers=1)
+        assert report.files_read == 2
+
+    def test_reads_only_appended_bytes(
+        self, transcript_dir: Path, sample_project_hash: str, sample_config: CortexConfig
+    ) -> None:
+        backfill_project(sample_project_hash, transcript_dir, sample_config, max_workers=1)
+        session = sorted(transcript_dir.glob("0*.jsonl"))[0]
+        line = (
+            '{"type":"assistant","sessionId":"s9","uuid":"u9","message":'
+            '{"role":"assistant","content":[{"type":"text","text":"Decision: backfill late lines"}]}}\n'
+        )
+        with open(session, "a", encoding="utf-8") as f:
+            f.write(line)
+
+        report = backfill_project(sample_project_hash, transcript_dir, sample_config, max_workers=1)
+        assert report.files_read == 1
+        assert report.bytes_read == len(line)
+        assert report.events_added == 1
+
+    def test_truncated_file_is_reread(
+        self, transcript_dir: Path, sample_project_hash: str, sample_config: CortexConfig
+    ) -> None:
+        state = BackfillState(sample_project_hash, sample_config)
+        session = sorted(transcript_dir.glob("0*.jsonl"))[0]
+        state.save({str(session): session.stat().st_size + 100})
+        report = backfill_project(sample_project_hash, transcript_dir, sample_config, max_workers=1)
+        assert report.files_read == 3
+
+    def test_parallel_matches_serial(self, transcript_dir: Path, tmp_path: Path) -> None:
+        serial_config = CortexConfig(cortex_home=tmp_path / "serial")
+        parallel_config = CortexConfig(cortex_home=tmp_path / "parallel")
+        backfill_project("0" * 16, transcript_dir, serial_config, max_workers=1)
+        report = backfill_project("0" * 16, transcript_dir, parallel_config, max_workers=2)
+        assert report.files_read == 3
+        assert _contents(EventStore("0" * 16, parallel_config)) == _contents(EventStore("0" * 16, serial_config))
@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from cortex.briefing import generate_briefing, write_briefing_to_file
+from cortex.briefing import CACHE_MAX_AGE_SECONDS, BriefingCache, generate_briefing, write_briefing_to_file
 from cortex.config import CortexConfig
 from cortex.models import EventType, create_event
 from cortex.store import EventStore
@@ -169,3 +169,141 @@ class TestWriteBriefingToFile:
         )
         expected = generate_briefing(project_hash=sample_project_hash, config=sample_config)
         assert output_path.read_text(encoding="utf-8") == expected
+
+
+class TestBriefingCache:
+    """write_briefing_to_file reuses briefings while the store is unchanged."""
+
+    def _write(self, output_path: Path, project_hash: str, config: CortexConfig, **kwargs) -> bool:
+        return write_briefing_to_file(output_path, project_hash=project_hash, config=config, **kwargs)
+
+    def test_unchanged_store_served_from_cache(
+        self,
+        event_store: EventStore,
+        sample_project_hash: str,
+        sample_config: CortexConfig,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        event_store.append(create_event(EventType.DECISION_MADE, "Use SQLite", session_id="s1"))
+        output_path = tmp_path / "briefing.md"
+        assert self._write(output_path, sample_project_hash, sample_config, store=event_store)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("store loaded")
+
+        monkeypatch.setattr(event_store, "load_for_briefing", fail)
+        output_path.unlink()
+        assert self._write(output_path, sample_project_hash, sample_config, store=event_store)
+        assert "Use SQLite" in output_path.read_text(encoding="utf-8")
+
+    def test_store_change_invalidates(
+        self,
+        event_store: EventStore,
+        sample_project_hash: str,
+        sample_config: CortexConfig,
+        tmp_path: Path,
+    ) -> None:
+        output_path = tmp_path / "briefing.md"
+        event_store.append(create_event(EventType.DECISION_MADE, "First", session_id="s1"))
+        self._write(output_path, sample_project_hash, sample_config)
+        event_store.append(create_event(EventType.DECISION_MADE, "Second", session_id="s1"))
+        assert self._write(output_path, sample_project_hash, sample_config)
+        assert "Second" in output_path.read_text(encoding="utf-8")
+
+    def test_marks_shown_events_accessed(
+        self,
+        event_store: EventStore,
+        sample_project_hash: str,
+        sample_config: CortexConfig,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        config = CortexConfig.from_dict({**sample_config.to_dict(), "mark_briefing_accessed": True})
+        event_store.append(create_event(EventType.DECISION_MADE, "Use SQLite", session_id="s1"))
+        event_store.append(create_event(EventType.KNOWLEDGE_ACQUIRED, "Learned X", session_id="s1"))
+        output_path = tmp_path / "briefing.md"
+        saliences = [e.salience for e in event_store.load_all()]
+        assert self._write(output_path, sample_project_hash, config, store=event_store)
+        assert [e.access_count for e in event_store.load_all()] == [1, 1]
+        assert [e.salience for e in event_store.load_all()] == saliences
+
+        def fail(*args, **kwargs):
+            raise AssertionError("store loaded")
+
+        # The entry is filed under the generation that includes the accesses.
+        monkeypatch.setattr(event_store, "load_for_briefing", fail)
+        assert not self._write(output_path, sample_project_hash, config, store=event_store)
+        assert [e.access_count for e in event_store.load_all()] == [1, 1]
+
+    def test_write_during_render_left_uncached(
+        self,
+        event_store: EventStore,
+        sample_project_hash: str,
+        sample_config: CortexConfig,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        config = CortexConfig.from_dict({**sample_config.to_dict(), "mark_briefing_accessed": True})
+        event_store.append(create_event(EventType.DECISION_MADE, "Use SQLite", session_id="s1"))
+        output_path = tmp_path / "briefing.md"
+        load_for_briefing = event_store.load_for_briefing
+        loads = []
+
+        def load_then_write(branch=None):
+            loaded = load_for_briefing(branch=branch)
+            if not loads:
+                # Another hook appends after this render has read the store.
+                event_store.append(create_event(EventType.DECISION_MADE, "Use WAL", session_id="s2"))
+            loads.append(branch)
+            return loaded
+
+        monkeypatch.setattr(event_store, "load_for_briefing", load_then_write)
+        self._write(output_path, sample_project_hash, config, store=event_store)
+        assert "Use WAL" not in output_path.read_text(encoding="utf-8")
+        # The render missed the other write, so it must not be served for it.
+        assert self._write(output_path, sample_project_hash, config, store=event_store)
+        assert len(loads) == 2
+        assert "Use WAL" in output_path.read_text(encoding="utf-8")
+
+    def test_identical_content_not_rewritten(
+        self,
+        event_store: EventStore,
+        sample_project_hash: str,
+        sample_config: CortexConfig,
+        tmp_path: Path,
+    ) -> None:
+        event_store.append(create_event(EventType.DECISION_MADE, "Stable", session_id="s1"))
+        output_path = tmp_path / "briefing.md"
+        assert self._write(output_path, sample_project_hash, sample_config)
+        before = output_path.stat()
+
+        BriefingCache(sample_project_hash, sample_config).path.unlink()
+        assert not self._write(output_path, sample_project_hash, sample_config)
+        after = output_path.stat()
+        assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+
+    def test_keyed_by_branch_and_config(self, sample_project_hash: str, sample_config: CortexConfig) -> None:
+        cache = BriefingCache(sample_project_hash, sample_config)
+        cache.put("main", "gen1", "main briefing")
+        cache.put("feature", "gen1", "feature briefing")
+        assert cache.get("main", "gen1") == "main briefing"
+        assert cache.get("feature", "gen1") == "feature briefing"
+        assert cache.get(None, "gen1") is None
+
+        other = CortexConfig(cortex_home=sample_config.cortex_home, max_briefing_tokens=10)
+        assert BriefingCache(sample_project_hash, other).get("main", "gen1") is None
+
+    def test_generation_and_age_checked(self, sample_project_hash: str, sample_config: CortexConfig) -> None:
+        cache = BriefingCache(sample_project_hash, sample_config)
+        cache.put("main", "gen1", "briefing", now=1000.0)
+        assert cache.get("main", "gen1", now=1001.0) == "briefing"
+        assert cache.get("main", "gen2", now=1001.0) is None
+        assert cache.get("main", "gen1", now=1000.0 + CACHE_MAX_AGE_SECONDS) is None
+
+    def test_unreadable_cache_is_a_miss(self, sample_project_hash: str, sample_config: CortexConfig) -> None:
+        cache = BriefingCache(sample_project_hash, sample_config)
+        cache.path.write_text("not json", encoding="utf-8")
+        assert cache.get("main", "gen1") is None
+        cache.put("main", "gen1", "briefing")
+        assert cache.get("main", "gen1") == "briefing"
@@ -0,0 +1,247 @@
+"""Tests for the materialized briefing view."""
+
+import random
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from cortex import briefing_view as briefing_view_module
+from cortex.briefing_view import _MAX_BRANCHES, BriefingView, select_for_briefing
+from cortex.config import CortexConfig
+from cortex.models import Event, EventType, create_event
+from cortex.sqlite_store import SQLiteEventStore
+from cortex.store import EventStore
+
+BRANCHES = [None, "main", "feature"]
+
+
+def _random_events(rng: random.Random, count: int) -> list[Event]:
+    """Events mixing types, branches, salience ties and non-decaying timestamps."""
+    now = datetime.now(timezone.utc)
+    events = []
+    for _ in range(count):
+        event_type = rng.choice(list(EventType))
+        event = create_event(event_type, f"event {rng.random()}", git_branch=rng.choice(["", "main", "feature"]))
+        stamp = (now - timedelta(hours=rng.choice([0, 1, 5, 48, 300]))).isoformat()
+        event.created_at = stamp
+        event.accessed_at = rng.choice([stamp, stamp, stamp, "", "garbage", (now + timedelta(hours=2)).isoformat()])
+        event.salience = rng.choice([0.0, 0.3, 0.5, 0.5, 0.9])
+        events.append(event)
+    return events
+
+
+def _assert_consistent(store: EventStore) -> None:
+    for branch in BRANCHES:
+        store.load_for_briefing(branch=branch)
+        assert store.verify_briefing_view(branch=branch) == []
+
+
+class TestBriefingViewConsistency:
+    """The view always agrees with a full recompute."""
+
+    @pytest.mark.parametrize("backend", ["json", "jsonl"])
+    def test_random_appends_and_accesses(self, sample_project_hash: str, tmp_cortex_home: Path, backend: str) -> None:
+        config = CortexConfig(cortex_home=tmp_cortex_home, store_backend=backend)
+        rng = random.Random(7)
+        store = EventStore(sample_project_hash, config)
+        _assert_consistent(store)
+        for _ in range(6):
+            store.append_many(_random_events(rng, 40))
+            store.append(_random_events(rng, 1)[0])
+            ids = [e.id for e in store.load_all()]
+            store.mark_accessed(rng.sample(ids, 5))
+            # A fresh instance reads the view back from disk.
+            _assert_consistent(EventStore(sample_project_hash, config))
+
+    def test_salience_ties_follow_store_order(self, event_store: EventStore) -> None:
+        stamp = datetime.now(timezone.utc).isoformat()
+        events = [create_event(EventType.KNOWLEDGE_ACQUIRED, f"tie {i}") for i in range(80)]
+        for event in events:
+            event.created_at = event.accessed_at = stamp
+        event_store.load_for_briefing()
+        event_store.append_many(events)
+        recent = event_store.load_for_briefing()["recent"]
+        assert [e.id for e in recent] == [e.id for e in events[:30]]
+        assert event_store.verify_briefing_view() == []
+
+    @pytest.mark.parametrize("limit", [0, 1, 7, 600])
+    def test_recent_limit_from_config(self, sample_project_hash: str, tmp_cortex_home: Path, limit: int) -> None:
+        """briefing_recent_limit sets K for the view, the reference and SQLite alike."""
+        events = _random_events(random.Random(11), 700)
+        config = CortexConfig(cortex_home=tmp_cortex_home, store_backend="jsonl", briefing_recent_limit=limit)
+        store = EventStore(sample_project_hash, config)
+        store.append_many(events)
+        sql_store = SQLiteEventStore("0" * 16, config)
+        sql_store.append_many(events)
+        try:
+            for branch in BRANCHES:
+                recent = store.load_for_briefing(branch=branch)["recent"]
+                assert store.verify_briefing_view(branch=branch) == []
+                assert [e.id for e in sql_store.load_for_briefing(branch=branch)["recent"]] == [e.id for e in recent]
+            data = store.load_for_briefing()
+            eligible = sum(not e.immortal for e in events) - len(data["active_plan"])
+            assert len(data["recent"]) == min(limit, eligible)
+        finally:
+            sql_store.close()
+
+    def test_plan_history_larger_than_limit(self, event_store: EventStore) -> None:
+        """Superseded plans leave the plans section yet still compete for "recent"."""
+        start = datetime.now(timezone.utc) - timedelta(hours=100)
+        events = []
+        for i in range(60):
+            event_type = EventType.PLAN_CREATED if i % 3 == 0 else EventType.PLAN_STEP_COMPLETED
+            event = create_event(event_type, f"plan event {i}")
+            event.immortal = i == 57
+            event.created_at = event.accessed_at = (start + timedelta(hours=i)).isoformat()
+            events.append(event)
+        rng = random.Random(13)
+        rng.shuffle(events)  # plans arrive out of created_at order
+        event_store.load_for_briefing()
+        for batch in range(0, 60, 7):
+            event_store.append_many(events[batch : batch + 7])
+            event_store.mark_accessed([rng.choice(events[: batch + 1]).id])
+            _assert_consistent(event_store)
+
+        data = event_store.load_for_briefing()
+        assert [e.content for e in data["active_plan"]] == [f"plan event {i}" for i in (57, 58, 59)]
+        assert len(data["recent"]) == 30
+        plans = event_store._briefing_view._branches[""]["plans"]
+        assert sorted(record["content"] for _, record in plans) == [f"plan event {i}" for i in (57, 58, 59)]
+
+    def test_reference_streams(self, sample_events: list) -> None:
+        """select_for_briefing gives the same answer for a list and a one-shot iterator."""
+        now = datetime.now(timezone.utc)
+        events = sample_events + _random_events(random.Random(5), 200)
+        assert select_for_briefing(iter(events), "main", now, 30) == select_for_briefing(events, "main", now, 30)
+
+    def test_clear_resets_view(self, event_store: EventStore, sample_events: list) -> None:
+        event_store.append_many(sample_events)
+        event_store.load_for_briefing()
+        event_store.clear()
+        assert event_store.load_for_briefing() == {"immortal": [], "active_plan": [], "recent": []}
+        assert event_store.verify_briefing_view() == []
+
+
+class TestBriefingViewMaintenance:
+    """When the view is used, updated, or rebuilt."""
+
+    def test_append_updates_view_without_full_load(
+        self,
+        event_store: EventStore,
+        sample_events: list,
+        sample_project_hash: str,
+        sample_config: CortexConfig,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        event_store.append_many(sample_events[:3])
+        event_store.load_for_briefing()
+        event_store.append_many(sample_events[3:])
+
+        def fail(self) -> list[dict]:
+            raise AssertionError("full load")
+
+        monkeypatch.setattr(EventStore, "_load_raw", fail)
+        monkeypatch.setattr(EventStore, "_iter_raw", fail)
+        data = EventStore(sample_project_hash, sample_config).load_for_briefing()
+        monkeypatch.undo()
+        assert event_store.verify_briefing_view() == []
+        assert {e.id for e in data["immortal"]} == {e.id for e in sample_events if e.immortal}
+
+    def test_append_logged_not_rewritten(
+        self, event_store: EventStore, sample_project_hash: str, sample_config: CortexConfig, monkeypatch
+    ) -> None:
+        event_store.append_many(_random_events(random.Random(12), 200))
+        event_store.load_for_briefing()
+        snapshot = event_store._briefing_view.path
+        before = snapshot.read_bytes()
+        for seed in range(3):
+            event_store.append_many(_random_events(random.Random(100 + seed), 5))
+        assert snapshot.read_bytes() == before
+        assert len(snapshot.with_suffix(".log").read_bytes().splitlines()) == 3
+
+        def fail(self) -> list[dict]:
+            raise AssertionError("full load")
+
+        fresh = EventStore(sample_project_hash, sample_config)
+        monkeypatch.setattr(EventStore, "_load_raw", fail)
+        monkeypatch.setattr(EventStore, "_iter_raw", fail)
+        fresh.load_for_briefing()
+        monkeypatch.undo()
+        assert fresh.verify_briefing_view() == []
+
+    def test_long_log_folded_into_snapshot(self, event_store: EventStore, monkeypatch) -> None:
+        monkeypatch.setattr(briefing_view_module, "_LOG_FOLD_BYTES", 1)
+        event_store.load_for_briefing()
+        event_store.append_many(_random_events(random.Random(14), 5))
+        log = event_store._briefing_view.path.with_suffix(".log")
+        assert log.exists()
+        event_store.append_many(_random_events(random.Random(15), 5))
+        assert not log.exists()
+        _assert_consistent(event_store)
+
+    def test_broken_log_chain_rebuilds(
+        self, event_store: EventStore, sample_project_hash: str, sample_config: CortexConfig
+    ) -> None:
+        event_store.load_for_briefing()
+        event_store.append_many(_random_events(random.Random(16), 5))
+        log = event_store._briefing_view.path.with_suffix(".log")
+        log.write_bytes(log.read_bytes()[:-20])
+        fresh = EventStore(sample_project_hash, sample_config)
+        assert not fresh._briefing_view.current(fresh.generation())
+        _assert_consistent(fresh)
+
+    def test_write_behind_the_views_back_rebuilds(self, event_store: EventStore, sample_events: list) -> None:
+        event_store.load_for_briefing()
+        event_store.backend.append_raw([e.to_dict() for e in sample_events])
+        assert event_store.verify_briefing_view() != []
+        data = event_store.load_for_briefing()
+        assert len(data["immortal"]) == sum(e.immortal for e in sample_events)
+        assert event_store.verify_briefing_view() == []
+
+    def test_mark_accessed_touches_view(
+        self, event_store: EventStore, sample_project_hash: str, sample_config: CortexConfig, monkeypatch
+    ) -> None:
+        event_store.append_many(_random_events(random.Random(9), 120))
+        shown = event_store.load_for_briefing()
+        event_store.mark_accessed([e.id for section in shown.values() for e in section])
+        assert event_store._briefing_view.current(event_store.generation())
+
+        def fail(self) -> list[dict]:
+            raise AssertionError("full load")
+
+        monkeypatch.setattr(EventStore, "_load_raw", fail)
+        monkeypatch.setattr(EventStore, "_iter_raw", fail)
+        EventStore(sample_project_hash, sample_config).load_for_briefing()
+        monkeypatch.undo()
+        assert event_store.verify_briefing_view() == []
+
+    def test_mark_accessed_unknown_to_view_rebuilds(self, event_store: EventStore) -> None:
+        events = _random_events(random.Random(10), 600)
+        event_store.append_many(events)
+        for branch in BRANCHES:
+            event_store.load_for_briefing(branch=branch)
+        held = event_store._briefing_view.path.read_text(encoding="utf-8")
+        hidden = next(e.id for e in events if e.id not in held)
+        event_store.mark_accessed([hidden])
+        assert not event_store._briefing_view.current(event_store.generation())
+        _assert_consistent(event_store)
+
+    def test_missing_branch_reported(self, event_store: EventStore) -> None:
+        event_store.load_for_briefing()
+        assert event_store.verify_briefing_view(branch="main") == ["view has no entry for branch 'main'"]
+
+    def test_other_limit_not_current(self, tmp_path: Path) -> None:
+        view = BriefingView(tmp_path / "briefing-view.json", limit=30)
+        view.build([], None, "fp-1")
+        view.save()
+        assert BriefingView(view.path, limit=30).current("fp-1")
+        assert not BriefingView(view.path, limit=10).current("fp-1")
+        assert not BriefingView(view.path, limit=30).current("fp-2")
+
+    def test_branch_filters_capped(self, tmp_path: Path) -> None:
+        view = BriefingView(tmp_path / "briefing-view.json", limit=30)
+        for i in range(_MAX_BRANCHES + 2):
+            view.build([], f"b{i}", "fp")
+        assert not view.has_branch("b0")
+        assert view.has_branch(f"b{_MAX_BRANCHES + 1}")
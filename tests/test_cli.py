@@ -1,11 +1,13 @@
-"""Tests for Cortex CLI commands: reset, status, init."""
+"""Tests for Cortex CLI commands: reset, status, init, backfill."""
 
 import json
+import shutil
 import sys
 from io import StringIO
 
-from cortex.cli import cmd_init, cmd_reset, cmd_status, get_init_hook_json
-from cortex.project import get_project_hash
+from cortex.backfill import BackfillState
+from cortex.cli import cmd_backfill, cmd_init, cmd_reset, cmd_status, get_init_hook_json
+from cortex.project import ProjectIndex, get_project_hash
 from cortex.store import EventStore, HookState
 
 
@@ -44,6 +46,13 @@ class TestCmdReset:
         assert project_hash in out
         assert "reset" in out.lower()
 
+    def test_reset_clears_backfill_offsets(self, tmp_path, tmp_cortex_home, sample_config, monkeypatch):
+        monkeypatch.setattr("cortex.cli.load_config", lambda: sample_config)
+        backfill_state = BackfillState(get_project_hash(str(tmp_path)), sample_config)
+        backfill_state.save({"/some/path.jsonl": 100})
+        assert cmd_reset(cwd=str(tmp_path)) == 0
+        assert backfill_state.load() == {}
+
     def test_reset_empty_cwd_returns_one(self):
         code = cmd_reset(cwd="")
         assert code == 1
@@ -83,11 +92,49 @@ class TestCmdStatus:
         assert "events: 0" in out or "events:0" in out.replace(" ", "")
         assert "last_extraction:" in out
 
+    def test_status_lists_known_projects(self, tmp_path, tmp_cortex_home, sample_config, monkeypatch, capsys):
+        monkeypatch.setattr("cortex.cli.load_config", lambda: sample_config)
+        other = tmp_path / "other"
+        other.mkdir()
+        ProjectIndex(sample_config).identify(str(other))
+        assert cmd_status(cwd=str(tmp_path)) == 0
+        out = capsys.readouterr().out
+        assert "known projects: 2" in out
+        assert get_project_hash(str(other)) in out
+        assert str(other.resolve()) in out
+
     def test_status_empty_cwd_returns_one(self, monkeypatch):
         code = cmd_status(cwd="")
         assert code == 1
 
 
+class TestCmdBackfill:
+    """Test cortex backfill: ingest every past transcript for the project."""
+
+    def test_backfill_reports_throughput(self, tmp_path, tmp_cortex_home, sample_config, fixtures_dir, monkeypatch):
+        transcript_dir = tmp_path / "claude-project"
+        transcript_dir.mkdir()
+        shutil.copy(fixtures_dir / "transcript_decisions.jsonl", transcript_dir / "session-1.jsonl")
+        monkeypatch.setattr("cortex.cli.load_config", lambda: sample_config)
+        monkeypatch.setattr("cortex.cli.find_transcript_path", lambda cwd: transcript_dir)
+        old_stdout = sys.stdout
+        try:
+            sys.stdout = StringIO()
+            code = cmd_backfill(cwd=str(tmp_path), max_workers=1)
+            out = sys.stdout.getvalue()
+        finally:
+            sys.stdout = old_stdout
+        assert code == 0
+        assert "session-1.jsonl" in out
+        assert "1/1 transcripts" in out
+        assert "MB/s" in out
+        assert EventStore(get_project_hash(str(tmp_path)), sample_config).count() > 0
+
+    def test_backfill_without_transcripts_returns_one(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("cortex.cli.find_transcript_path", lambda cwd: None)
+        assert cmd_backfill(cwd=str(tmp_path)) == 1
+
+
 class TestGetInitHookJson:
     """Test get_init_hook_json produces valid Claude Code hook config."""
 
@@ -0,0 +1,93 @@
+"""Tests for the pluggable JSON codec layer."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from cortex import codec
+from cortex.backends import JsonArrayBackend, JsonlSegmentBackend
+from cortex.config import CortexConfig, load_config, save_config
+from cortex.daemon import WarmEnv
+from cortex.transcript import TranscriptReader, parse_entry
+
+SAMPLE = [{"type": "user", "text": "héllo — ünïcode", "n": [1, 2.5, None, True], "empty": {}, "list": []}, {}]
+
+
+@pytest.fixture(params=codec.available_codecs())
+def each_codec(request):
+    """Run a test once per installed codec, restoring the active one after."""
+    previous = codec.active_codec().name
+    yield codec.use_codec(request.param)
+    codec.use_codec(previous)
+
+
+class TestCodecContract:
+    """Every installed codec behaves identically."""
+
+    def test_round_trip(self, each_codec: codec.JsonCodec) -> None:
+        assert each_codec.loads(each_codec.dumps(SAMPLE)) == SAMPLE
+
+    def test_loads_str_and_bytes(self, each_codec: codec.JsonCodec) -> None:
+        text = json.dumps(SAMPLE, ensure_ascii=False)
+        assert each_codec.loads(text) == each_codec.loads(text.encode("utf-8")) == SAMPLE
+
+    def test_dumps_is_compact_utf8(self, each_codec: codec.JsonCodec) -> None:
+        expected = json.dumps(SAMPLE, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        assert each_codec.dumps(SAMPLE) == expected
+
+    def test_dumps_pretty_matches_stdlib_layout(self, each_codec: codec.JsonCodec) -> None:
+        expected = json.dumps(SAMPLE, indent=2, ensure_ascii=False).encode("utf-8")
+        assert each_codec.dumps_pretty(SAMPLE) == expected
+
+    @pytest.mark.parametrize("bad", ["", "   ", "{not json", '{"a": 1} trailing', b"\xff\xfe"])
+    def test_malformed_raises_value_error(self, each_codec: codec.JsonCodec, bad) -> None:
+        with pytest.raises(ValueError):
+            each_codec.loads(bad)
+
+    def test_surrounding_whitespace_allowed(self, each_codec: codec.JsonCodec) -> None:
+        assert each_codec.loads(' {"a": 1} \n') == {"a": 1}
+
+    def test_transcript_parity(self, each_codec: codec.JsonCodec, fixtures_dir: Path) -> None:
+        """Transcript entries decode the same as with the stdlib codec."""
+        path = fixtures_dir / "transcript_mixed.jsonl"
+        expected = [parse_entry(json.loads(line)) for line in path.read_text().splitlines() if line.strip()]
+        entries = TranscriptReader(path).read_all()
+        for entry in entries:
+            entry.offset = 0
+        assert entries == expected
+
+    @pytest.mark.parametrize("backend_cls", [JsonArrayBackend, JsonlSegmentBackend])
+    def test_backend_round_trip(self, each_codec: codec.JsonCodec, tmp_path: Path, backend_cls) -> None:
+        backend = backend_cls(tmp_path)
+        backend.rewrite_raw(SAMPLE[:1])
+        backend.append_raw(SAMPLE[1:])
+        assert backend.load_raw() == SAMPLE
+
+
+class TestCodecSelection:
+    """Tests for automatic and configured codec selection."""
+
+    def test_stdlib_always_available(self) -> None:
+        assert codec.CODEC_JSON in codec.available_codecs()
+
+    def test_auto_prefers_fast_codecs(self) -> None:
+        assert codec.get_codec(codec.CODEC_AUTO).name == codec.available_codecs()[0]
+
+    def test_unknown_name_falls_back_to_auto(self) -> None:
+        previous = codec.active_codec().name
+        try:
+            assert codec.use_codec("no-such-codec").name == codec.available_codecs()[0]
+        finally:
+            codec.use_codec(previous)
+
+    def test_entry_point_activates_codec(self, tmp_path: Path) -> None:
+        previous = codec.use_codec(codec.CODEC_AUTO).name
+        try:
+            save_config(CortexConfig(cortex_home=tmp_path, json_codec="json"))
+            assert load_config(cortex_home=tmp_path).json_codec == "json"
+            assert codec.active_codec().name == previous
+            WarmEnv(tmp_path).config()
+            assert codec.active_codec().name == "json"
+        finally:
+            codec.use_codec(previous)
@@ -41,6 +41,8 @@ class TestCortexConfigDefaults:
         """Default max briefing tokens is 3000."""
         config = CortexConfig()
         assert config.max_briefing_tokens == 3000
+        assert config.briefing_recent_limit == 30
+        assert config.mark_briefing_accessed is False
 
     def test_default_decision_limits(self) -> None:
         """Default decision limits match paper §9.4."""
@@ -76,6 +78,8 @@ class TestCortexConfigSerialization:
             max_briefing_tokens=5000,
             max_full_decisions=100,
             max_summary_decisions=50,
+            briefing_recent_limit=12,
+            mark_briefing_accessed=True,
             decision_active_sessions=30,
             decision_aging_sessions=60,
         )
@@ -89,6 +93,8 @@ class TestCortexConfigSerialization:
         assert restored.max_briefing_tokens == original.max_briefing_tokens
         assert restored.max_full_decisions == original.max_full_decisions
         assert restored.max_summary_decisions == original.max_summary_decisions
+        assert restored.briefing_recent_limit == original.briefing_recent_limit
+        assert restored.mark_briefing_accessed == original.mark_briefing_accessed
         assert restored.decision_active_sessions == original.decision_active_sessions
         assert restored.decision_aging_sessions == original.decision_aging_sessions
 
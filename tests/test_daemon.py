@@ -0,0 +1,130 @@
+"""Tests for the Cortex daemon and the hook client shim."""
+
+import shutil
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from cortex import daemon as daemon_module
+from cortex.__main__ import _call_daemon
+from cortex.config import CortexConfig, save_config
+from cortex.daemon import CortexDaemon, WarmEnv, handle_request, is_running
+from cortex.project import get_project_hash
+from cortex.store import EventStore, HookState
+
+
+@pytest.fixture
+def socket_path():
+    """A socket path short enough for AF_UNIX (pytest's tmp_path may not be)."""
+    directory = tempfile.mkdtemp(prefix="cx-")
+    yield Path(directory) / "d.sock"
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def running_daemon(socket_path, tmp_cortex_home):
+    """A daemon serving on socket_path from a background thread."""
+    server = CortexDaemon(socket_path, WarmEnv(tmp_cortex_home))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+class TestDaemonRequests:
+    """Requests sent through the client shim to a running daemon."""
+
+    def test_ping(self, running_daemon, socket_path):
+        assert _call_daemon("ping", "", str(socket_path)) == 0
+
+    def test_stop_extracts_events(self, running_daemon, socket_path, tmp_path, sample_config, fixtures_dir):
+        transcript_path = tmp_path / "transcript.jsonl"
+        transcript_path.write_text((fixtures_dir / "transcript_simple.jsonl").read_text())
+        payload = f'{{"cwd": "{tmp_path}", "transcript_path": "{transcript_path}", "session_id": "s1"}}'
+
+        assert _call_daemon("stop", payload, str(socket_path)) == 0
+
+        project_hash = get_project_hash(str(tmp_path))
+        assert EventStore(project_hash, sample_config).count() > 0
+        assert HookState(project_hash, sample_config).load()["last_session_id"] == "s1"
+
+    def test_session_start_writes_briefing(self, running_daemon, socket_path, tmp_path):
+        payload = f'{{"cwd": "{tmp_path}"}}'
+        assert _call_daemon("session-start", payload, str(socket_path)) == 0
+        assert (tmp_path / ".claude" / "rules" / "cortex-briefing.md").exists()
+
+    def test_unknown_command_falls_back(self, running_daemon, socket_path, capsys):
+        assert _call_daemon("bogus", "", str(socket_path)) is None
+        assert "Unknown command: bogus" in capsys.readouterr().err
+
+    def test_malformed_request_not_run(self, tmp_cortex_home):
+        assert handle_request({"command": ["stop"]}, WarmEnv(tmp_cortex_home))["code"] is None
+
+    def test_handler_stderr_relayed(self, socket_path, tmp_cortex_home, capsys, monkeypatch):
+        def failing(payload, env):
+            print("[Cortex] Stop hook error: boom", file=sys.stderr)
+            return 0
+
+        monkeypatch.setitem(daemon_module.HANDLERS, "stop", failing)
+        response = handle_request({"command": "stop", "payload": "{}"}, WarmEnv(tmp_cortex_home))
+        assert response == {"code": 0, "stderr": "[Cortex] Stop hook error: boom\n"}
+        assert capsys.readouterr().err == ""
+
+
+class TestClientFallback:
+    """_call_daemon returns None whenever the caller must handle the hook."""
+
+    def test_no_socket_file(self, socket_path):
+        assert _call_daemon("stop", "{}", str(socket_path)) is None
+
+    def test_stale_socket_file(self, socket_path):
+        socket_path.touch()
+        assert _call_daemon("stop", "{}", str(socket_path)) is None
+
+
+class TestCortexDaemon:
+    """Socket lifecycle."""
+
+    def test_socket_removed_on_close(self, socket_path, tmp_cortex_home):
+        server = CortexDaemon(socket_path, WarmEnv(tmp_cortex_home))
+        assert socket_path.exists()
+        assert socket_path.stat().st_mode & 0o777 == 0o600
+        server.server_close()
+        assert not socket_path.exists()
+
+    def test_replaces_stale_socket(self, socket_path, tmp_cortex_home):
+        socket_path.touch()
+        server = CortexDaemon(socket_path, WarmEnv(tmp_cortex_home))
+        try:
+            assert is_running(socket_path)
+        finally:
+            server.server_close()
+
+    def test_refuses_second_daemon(self, running_daemon, socket_path, tmp_cortex_home):
+        with pytest.raises(RuntimeError, match="already running"):
+            CortexDaemon(socket_path, WarmEnv(tmp_cortex_home))
+
+
+class TestWarmEnv:
+    """Caching in WarmEnv never outlives the files it came from."""
+
+    def test_store_reused(self, tmp_cortex_home):
+        env = WarmEnv(tmp_cortex_home)
+        config = env.config()
+        assert env.store("abc123def456abcd", config) is env.store("abc123def456abcd", config)
+
+    def test_config_change_reloads_and_drops_stores(self, tmp_cortex_home):
+        env = WarmEnv(tmp_cortex_home)
+        config = env.config()
+        store = env.store("abc123def456abcd", config)
+        assert env.config() is config
+
+        save_config(CortexConfig(cortex_home=tmp_cortex_home, max_briefing_tokens=1234))
+        reloaded = env.config()
+        assert reloaded.max_briefing_tokens == 1234
+        assert env.store("abc123def456abcd", reloaded) is not store
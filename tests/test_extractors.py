@@ -8,14 +8,20 @@ Covers:
 - Integration tests against fixture JSONL files
 """
 
+import json
+import random
 from pathlib import Path
 
+import pytest
+
 from cortex.extractors import (
+    DEFAULT_REGISTRY,
     SEMANTIC_PATTERNS,
     _deduplicate,
     _extract_plan_step_completions,
     _format_todos,
     extract_events,
+    extract_events_parallel,
     extract_explicit,
     extract_semantic,
     extract_structural,
@@ -603,6 +609,48 @@ class TestSemanticPatterns:
             assert 0.0 < confidence <= 1.0
 
 
+class TestSemanticSinglePass:
+    """The combined semantic regex matches running each pattern in turn."""
+
+    @staticmethod
+    def _per_pattern(text: str) -> list:
+        """Reference: one finditer() pass per SEMANTIC_PATTERNS entry."""
+        found = []
+        for pattern, event_type, confidence in SEMANTIC_PATTERNS:
+            for match in pattern.finditer(text):
+                content = match.group(1).strip().rstrip("*").strip()
+                if content:
+                    found.append((event_type, content, confidence, pattern.pattern))
+        return found
+
+    @staticmethod
+    def _single_pass(text: str) -> list:
+        events = extract_semantic(_make_assistant_entry([{"type": "text", "text": text}]))
+        return [(e.type, e.content, e.confidence, e.metadata["keyword"]) for e in events]
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Decision: A\nRejected: B\nDecision: C",
+            "Decision:\nRejected: spans onto the next line",
+            "Decision:\n\nDecision: blank lines between",
+            "\n\n  **Fixed: after blank lines**\nerror RESOLVED: x",
+            "TIL: a\nLesson: b\nLearned: c\nPreference: d",
+            "Decision: Rejected: same line\n  Decision: indented",
+            "Decision:   **\nRejected: after an empty capture",
+        ],
+    )
+    def test_matches_per_pattern_scan(self, text: str):
+        assert self._single_pass(text) == self._per_pattern(text)
+
+    def test_matches_per_pattern_scan_randomized(self):
+        rng = random.Random(7)
+        pieces = ["Decision:", "Rejected:", "Fixed:", "error resolved:", "TIL:", "Preference:", "**", " ", "\n", "x y"]
+        for _ in range(500):
+            text = "".join(rng.choice(pieces) for _ in range(rng.randint(1, 12)))
+            assert self._single_pass(text) == self._per_pattern(text), text
+
+
 # ============================================================
 # Integration: extract_events() Pipeline Tests
 # ============================================================
@@ -676,6 +724,43 @@ class TestExtractEventsPipeline:
         assert len(decision_events) == 2
 
 
+class TestExtractEventsParallel:
+    """extract_events_parallel() returns exactly what extract_events() does."""
+
+    @staticmethod
+    def _key(events: list) -> list:
+        return [(e.type, e.content, e.session_id) for e in events]
+
+    def test_matches_serial_across_shards(self, fixtures_dir: Path):
+        """Duplicates spread over shards are dropped, keeping first-seen order."""
+        entries = TranscriptReader(fixtures_dir / "transcript_mixed.jsonl").read_all() * 3
+        parallel = extract_events_parallel(entries, project="p", max_workers=2, min_entries=1)
+        assert self._key(parallel) == self._key(extract_events(entries, project="p"))
+        assert parallel
+
+    def test_small_input_runs_serially(self, monkeypatch):
+        """Below min_entries no process pool is created."""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("pool started")
+
+        monkeypatch.setattr("concurrent.futures.ProcessPoolExecutor", fail)
+        entry = _make_assistant_entry([{"type": "text", "text": "Decision: Use SQLite"}])
+        events = extract_events_parallel([entry] * 10, max_workers=4)
+        assert [e.type for e in events] == [EventType.DECISION_MADE]
+
+    def test_pool_failure_falls_back(self, monkeypatch):
+        """A pool that cannot start degrades to serial extraction."""
+
+        def unavailable(*args, **kwargs):
+            raise OSError("no semaphores")
+
+        monkeypatch.setattr("concurrent.futures.ProcessPoolExecutor", unavailable)
+        entries = [_make_assistant_entry([_make_tool_use_block("Bash", {"command": f"cmd {i}"})]) for i in range(4)]
+        events = extract_events_parallel(entries, max_workers=2, min_entries=1)
+        assert [e.content for e in events] == ["cmd 0", "cmd 1", "cmd 2", "cmd 3"]
+
+
 # ============================================================
 # Integration: Fixture-Based Tests
 # ============================================================
@@ -694,6 +779,13 @@ class TestFixtureSimple:
         assert len(command_events) >= 1
         assert "ls -la" in command_events[0].content
 
+    def test_streamed_entries_match_list(self, fixtures_dir: Path):
+        """extract_events() gives the same result for a generator and a list."""
+        path = fixtures_dir / "transcript_simple.jsonl"
+        streamed = extract_events(TranscriptReader(path).iter_new())
+        listed = extract_events(TranscriptReader(path).read_all())
+        assert [(e.type, e.content) for e in streamed] == [(e.type, e.content) for e in listed]
+
     def test_session_id_propagated(self, fixtures_dir: Path):
         reader = TranscriptReader(fixtures_dir / "transcript_simple.jsonl")
         entries = reader.read_all()
@@ -836,3 +928,55 @@ class TestFixtureMixed:
         # Mixed fixture has ~15 lines with various tools. Should produce
         # a reasonable number of events (not zero, not hundreds).
         assert 3 <= len(events) <= 30
+
+
+# ============================================================
+# Line prefilter
+# ============================================================
+
+
+class TestExtractionPrefilter:
+    """DEFAULT_REGISTRY.prefilter() never drops a line that would yield an event."""
+
+    # One sample per SEMANTIC_PATTERNS keyword plus the [MEMORY:] tag.
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Decision: use SQLite",
+            "**Rejected:** MongoDB",
+            "Fixed: race in watcher",
+            "ERROR RESOLVED: import cycle",
+            "error Resolved: flaky test",
+            "  Learned: pytest fixtures",
+            "Lesson: read the docs",
+            "TIL: ruff is fast",
+            "Preference: tabs",
+            "note [MEMORY: deploy on Fridays]",
+        ],
+    )
+    def test_keyword_lines_pass(self, text: str):
+        blocks = [{"type": "text", "text": text}]
+        entry = _make_assistant_entry(blocks)
+        assert extract_semantic(entry) or extract_explicit(entry)
+        line = json.dumps({"type": "assistant", "message": {"role": "assistant", "content": blocks}})
+        assert DEFAULT_REGISTRY.prefilter().matches(line)
+
+    def test_plain_text_line_rejected(self):
+        line = json.dumps({"type": "assistant", "message": {"content": [{"type": "text", "text": "Looks good."}]}})
+        assert not DEFAULT_REGISTRY.prefilter().matches(line)
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "transcript_simple.jsonl",
+            "transcript_decisions.jsonl",
+            "transcript_memory_tags.jsonl",
+            "transcript_mixed.jsonl",
+        ],
+    )
+    def test_same_events_with_prefilter(self, fixtures_dir: Path, name: str):
+        path = fixtures_dir / name
+        filtered = extract_events(TranscriptReader(path).iter_new(prefilter=DEFAULT_REGISTRY.prefilter()))
+        unfiltered = extract_events(TranscriptReader(path).read_all())
+        assert [(e.type, e.content) for e in filtered] == [(e.type, e.content) for e in unfiltered]
+        assert unfiltered
@@ -0,0 +1,98 @@
+"""Tests for the persistent content-hash index."""
+
+from pathlib import Path
+
+import pytest
+
+from cortex.config import CortexConfig
+from cortex.hash_index import HashIndex, digest
+from cortex.models import EventType, content_hash, create_event
+from cortex.store import EventStore
+
+
+class TestHashIndex:
+    """Tests for the hashes.idx file format."""
+
+    def test_missing_file_is_stale(self, tmp_path: Path) -> None:
+        """A missing index loads as None (needs rebuild)."""
+        assert HashIndex(tmp_path / "hashes.idx").load("fp") is None
+
+    def test_write_and_load(self, tmp_path: Path) -> None:
+        """Written hashes load back under the same fingerprint."""
+        index = HashIndex(tmp_path / "hashes.idx")
+        hashes = {digest("0123456789abcdef"), digest("fedcba9876543210")}
+        index.write(hashes, "fp-1")
+        assert index.load("fp-1") == hashes
+
+    def test_fingerprint_mismatch_is_stale(self, tmp_path: Path) -> None:
+        """An index stamped for another store state is not trusted."""
+        index = HashIndex(tmp_path / "hashes.idx")
+        index.write({digest("0123456789abcdef")}, "fp-1")
+        assert index.load("fp-2") is None
+
+    def test_append_restamps(self, tmp_path: Path) -> None:
+        """append adds hashes and moves the index to the new fingerprint."""
+        index = HashIndex(tmp_path / "hashes.idx")
+        index.write({digest("0123456789abcdef")}, "fp-1")
+        index.append([digest("fedcba9876543210")], "fp-2")
+        assert index.load("fp-1") is None
+        assert index.load("fp-2") == {digest("0123456789abcdef"), digest("fedcba9876543210")}
+
+
+@pytest.mark.parametrize("backend", ["json", "jsonl"])
+class TestEventStoreHashIndex:
+    """EventStore keeps hashes.idx in sync with its backend."""
+
+    @pytest.fixture
+    def store(self, backend: str, sample_project_hash: str, tmp_cortex_home: Path) -> EventStore:
+        return EventStore(sample_project_hash, CortexConfig(cortex_home=tmp_cortex_home, store_backend=backend))
+
+    def _index(self, store: EventStore) -> HashIndex:
+        return HashIndex(store.events_path.parent / "hashes.idx")
+
+    def test_index_tracks_appends(self, store: EventStore, sample_events: list) -> None:
+        """After append_many the index is fresh and holds every hash."""
+        store.append_many(sample_events)
+        hashes = self._index(store).load(store.generation())
+        assert hashes == {digest(content_hash(e)) for e in sample_events}
+
+    def test_dedup_does_not_read_store(self, store: EventStore, sample_events: list, monkeypatch) -> None:
+        """A fresh index answers dedup without loading stored events."""
+        if store.backend.name == "json":
+            pytest.skip("the JSON array backend reads the store to append")
+        store.append_many(sample_events[:5])
+        reopened = EventStore(store._project_hash, store._config)
+
+        def fail():
+            raise AssertionError("store should not be read")
+
+        monkeypatch.setattr(reopened.backend, "load_raw", fail)
+        reopened.append_many(sample_events)
+        monkeypatch.undo()
+        assert reopened.count() == len(sample_events)
+
+    def test_rebuilds_when_store_changes_behind_index(self, store: EventStore) -> None:
+        """Writes that bypass the index are detected and healed."""
+        e1 = create_event(EventType.DECISION_MADE, "chose X", session_id="s1")
+        store.append_many([e1])
+        other = create_event(EventType.DECISION_MADE, "chose Y", session_id="s1")
+        store.backend.append_raw([other.to_dict()])
+
+        fresh = EventStore(store._project_hash, store._config)
+        fresh.append_many([create_event(EventType.DECISION_MADE, "chose Y", session_id="s1")])
+        assert fresh.count() == 2
+
+    def test_corrupt_index_self_heals(self, store: EventStore) -> None:
+        """Garbage in hashes.idx triggers a rebuild, not a crash."""
+        store.append_many([create_event(EventType.DECISION_MADE, "chose X", session_id="s1")])
+        self._index(store).path.write_bytes(b"garbage")
+        fresh = EventStore(store._project_hash, store._config)
+        fresh.append_many([create_event(EventType.DECISION_MADE, "chose X", session_id="s1")])
+        assert fresh.count() == 1
+
+    def test_clear_resets_index(self, store: EventStore, sample_events: list) -> None:
+        """Events cleared from the store can be appended again."""
+        store.append_many(sample_events)
+        store.clear()
+        store.append_many(sample_events)
+        assert store.count() == len(sample_events)
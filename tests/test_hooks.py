@@ -7,6 +7,7 @@ from cortex.hooks import (
     handle_precompact,
     handle_session_start,
     handle_stop,
+    parse_payload,
     read_payload,
 )
 from cortex.project import get_project_hash
@@ -28,6 +29,12 @@ class TestReadPayload:
         monkeypatch.setattr(sys, "stdin", io.StringIO('{"cwd": "/tmp", "session_id": "s1"}'))
         assert read_payload() == {"cwd": "/tmp", "session_id": "s1"}
 
+    def test_non_object_json_returns_empty_dict(self):
+        assert parse_payload("[1, 2]") == {}
+
+    def test_parse_payload_accepts_bytes(self):
+        assert parse_payload(b'{"cwd": "/tmp"}') == {"cwd": "/tmp"}
+
 
 class TestHandleStop:
     """Test handle_stop with mock payloads and real transcript/store."""
@@ -78,6 +85,20 @@ class TestHandleStop:
         assert loaded["last_transcript_path"] == str(transcript_path)
         assert loaded["last_session_id"] == "session-001"
 
+    def test_stop_all_lines_prefiltered_not_counted(self, tmp_path, tmp_cortex_home, sample_config, monkeypatch):
+        monkeypatch.setattr(
+            "cortex.hooks.load_config",
+            lambda: sample_config,
+        )
+        transcript_path = tmp_path / "transcript.jsonl"
+        transcript_path.write_text('{"type": "progress", "data": "tick"}\n' * 3)
+        payload = {"cwd": str(tmp_path), "transcript_path": str(transcript_path), "session_id": "s1"}
+        assert handle_stop(payload) == 0
+
+        state = HookState(get_project_hash(str(tmp_path)), sample_config).load()
+        assert state["last_transcript_position"] == transcript_path.stat().st_size
+        assert state["session_count"] == 0
+
     def test_stop_missing_cwd_returns_zero(self, monkeypatch):
         monkeypatch.setattr(sys, "stdin", io.StringIO("{}"))
         assert handle_stop({}) == 0
@@ -0,0 +1,95 @@
+"""Tests for the CLI entry point and lazy package imports."""
+
+import io
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import cortex
+from cortex import __main__ as main_module
+
+
+def _run_main(monkeypatch, argv: list[str], stdin: str = "") -> int:
+    monkeypatch.setattr(sys, "argv", ["cortex", *argv])
+    monkeypatch.setattr(sys, "stdin", io.StringIO(stdin))
+    with pytest.raises(SystemExit) as exc:
+        main_module.main()
+    return exc.value.code
+
+
+class TestHookHasWork:
+    """_hook_has_work mirrors the handlers' early returns."""
+
+    @pytest.mark.parametrize(
+        "hook,payload",
+        [
+            ("stop", '{"cwd": "/p", "transcript_path": "/t", "stop_hook_active": true}'),
+            ("stop", '{"cwd": "/p"}'),
+            ("stop", '{"transcript_path": "/t"}'),
+            ("precompact", "{}"),
+            ("session-start", ""),
+            ("session-start", "[1]"),
+        ],
+    )
+    def test_nothing_to_do(self, hook, payload):
+        assert not main_module._hook_has_work(hook, payload)
+
+    @pytest.mark.parametrize(
+        "hook,payload",
+        [
+            ("stop", '{"cwd": "/p", "transcript_path": "/t"}'),
+            ("precompact", '{"cwd": "/p"}'),
+            ("session-start", '{"cwd": "/p"}'),
+            ("stop", "not json"),
+        ],
+    )
+    def test_work_to_do(self, hook, payload):
+        assert main_module._hook_has_work(hook, payload)
+
+
+class TestMain:
+    """Dispatch in main()."""
+
+    def test_early_exit_skips_handler(self, monkeypatch):
+        import cortex.hooks
+
+        def fail(*args, **kwargs):
+            raise AssertionError("handler called")
+
+        monkeypatch.setattr(cortex.hooks, "handle_stop", fail)
+        assert _run_main(monkeypatch, ["stop"], '{"cwd": "/p", "stop_hook_active": true}') == 0
+
+    def test_hook_runs_in_process_without_daemon(self, monkeypatch, tmp_path):
+        import cortex.hooks
+
+        seen = []
+        monkeypatch.setenv("CORTEX_DAEMON_SOCKET", str(tmp_path / "none.sock"))
+        monkeypatch.setattr(cortex.hooks, "handle_session_start", lambda payload: seen.append(payload) or 0)
+        assert _run_main(monkeypatch, ["sessionstart"], '{"cwd": "/p"}') == 0
+        assert seen == [{"cwd": "/p"}]
+
+    def test_unknown_command(self, monkeypatch, capsys):
+        assert _run_main(monkeypatch, ["bogus"]) == 1
+        assert "Unknown command: bogus" in capsys.readouterr().err
+
+
+class TestLazyPackage:
+    """The package exposes its API without importing it up front."""
+
+    def test_import_loads_no_submodules(self):
+        code = "import sys, cortex; print(sorted(m for m in sys.modules if m.startswith('cortex.')))"
+        env = {**os.environ, "PYTHONPATH": str(Path(cortex.__file__).parent.parent)}
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env)
+        assert result.stdout.strip() == "[]"
+
+    def test_every_export_resolves(self):
+        for name in cortex.__all__:
+            assert getattr(cortex, name) is not None
+        assert set(cortex.__all__) <= set(dir(cortex))
+
+    def test_unknown_attribute_raises(self):
+        with pytest.raises(AttributeError):
+            cortex.not_a_real_name  # noqa: B018
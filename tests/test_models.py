@@ -9,7 +9,11 @@ from cortex.models import (
     EventType,
     content_hash,
     create_event,
+    created_key,
+    decayed_salience,
     effective_salience,
+    epoch_us,
+    raw_content_hash,
     reinforce_event,
 )
 
@@ -243,6 +247,55 @@ class TestEffectiveSalience:
         assert effective_salience(e) == e.salience
 
 
+class TestEpochTimestamps:
+    """Tests for the cached epoch forms of created_at and accessed_at."""
+
+    def test_aware_and_naive(self) -> None:
+        assert epoch_us("1970-01-01T00:00:01+00:00") == 10**6
+        assert epoch_us("1970-01-01T00:00:01") == 10**6
+        assert epoch_us("1970-01-01T01:00:00+01:00") == 0
+
+    def test_unparseable(self) -> None:
+        assert epoch_us("") is None
+        assert epoch_us("garbage") is None
+
+    def test_cached_until_field_changes(self) -> None:
+        """Parsed once per value; assigning a new timestamp is picked up."""
+        e = create_event(EventType.COMMAND_RUN, "ran something")
+        assert e.accessed_us == epoch_us(e.accessed_at)
+        e.accessed_at = "1970-01-01T00:00:02+00:00"
+        assert e.accessed_us == 2 * 10**6
+        e.created_at = "not-a-timestamp"
+        assert e.created_us is None
+
+    def test_event_is_slotted(self) -> None:
+        assert not hasattr(create_event(EventType.COMMAND_RUN, "ran something"), "__dict__")
+
+    def test_not_serialized_or_compared(self) -> None:
+        e = create_event(EventType.COMMAND_RUN, "ran something")
+        copy = Event.from_dict(e.to_dict())
+        assert e.created_us is not None
+        assert copy == e
+        assert "_created_us" not in e.to_dict()
+
+    def test_created_key_orders_by_instant(self) -> None:
+        """Mixed naive/offset timestamps sort by instant; unparseable first."""
+        a = create_event(EventType.COMMAND_RUN, "a")
+        a.created_at = "2026-03-01T10:00:00"
+        b = create_event(EventType.COMMAND_RUN, "b")
+        b.created_at = "2026-03-01T09:00:00-05:00"
+        c = create_event(EventType.COMMAND_RUN, "c")
+        c.created_at = ""
+        assert sorted([b, c, a], key=created_key) == [c, a, b]
+
+    def test_effective_salience_matches_string_form(self) -> None:
+        now = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+        for hours in (0, 1, 37, 500):
+            e = create_event(EventType.FILE_EXPLORED, "explored foo.py")
+            e.accessed_at = (now - timedelta(hours=hours, microseconds=7)).isoformat()
+            assert effective_salience(e, now) == decayed_salience(e.salience, e.accessed_at, False, now)
+
+
 class TestReinforceEvent:
     """Tests for the reinforcement function."""
 
@@ -309,3 +362,12 @@ class TestContentHash:
         h = content_hash(e)
         assert len(h) == 16
         int(h, 16)  # Should be valid hex
+
+    def test_raw_hash_matches_event_hash(self) -> None:
+        """raw_content_hash on a stored dict equals content_hash on the Event."""
+        e = create_event(EventType.ERROR_RESOLVED, "fixed Y", session_id="s2")
+        assert raw_content_hash(e.to_dict()) == content_hash(e)
+
+    def test_raw_hash_applies_from_dict_defaults(self) -> None:
+        """Missing keys hash the same as Event.from_dict() would."""
+        assert raw_content_hash({}) == content_hash(Event.from_dict({}))
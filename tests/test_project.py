@@ -1,8 +1,15 @@
 """Tests for the Cortex project identity resolution."""
 
+import subprocess
 from pathlib import Path
 
+import pytest
+
+from cortex import project as project_module
 from cortex.project import (
+    ProjectIndex,
+    _git_info_subprocess,
+    find_git_dir,
     get_git_branch,
     get_git_info,
     get_project_hash,
@@ -10,6 +17,20 @@ from cortex.project import (
 )
 
 
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, capture_output=True, check=True)
+
+
+@pytest.fixture
+def no_git_command(monkeypatch):
+    """Make any git subprocess fail the test."""
+
+    def fail(*args, **kwargs):
+        raise AssertionError(f"git subprocess run: {args}")
+
+    monkeypatch.setattr(project_module.subprocess, "run", fail)
+
+
 class TestGetProjectHash:
     """Tests for project hash generation."""
 
@@ -128,3 +149,176 @@ class TestIdentifyProject:
         identity = identify_project(str(tmp_path))
         assert len(identity["hash"]) == 16
         assert identity["git_branch"] == "unknown"
+
+
+class TestFindGitDir:
+    """Locating the repository from a working directory."""
+
+    def test_repo_root(self, tmp_git_repo: Path) -> None:
+        git_dir = tmp_git_repo.resolve() / ".git"
+        assert find_git_dir(tmp_git_repo) == (git_dir, git_dir)
+
+    def test_subdirectory(self, tmp_git_repo: Path) -> None:
+        sub = tmp_git_repo / "src" / "pkg"
+        sub.mkdir(parents=True)
+        assert find_git_dir(sub)[0] == tmp_git_repo.resolve() / ".git"
+
+    def test_linked_worktree(self, tmp_git_repo: Path, tmp_path: Path) -> None:
+        worktree = tmp_path / "wt"
+        _git(tmp_git_repo, "worktree", "add", "-q", "-b", "feature", str(worktree))
+        git_dir, common_dir = find_git_dir(worktree)
+        assert git_dir == tmp_git_repo.resolve() / ".git" / "worktrees" / "wt"
+        assert common_dir == tmp_git_repo.resolve() / ".git"
+
+    def test_not_a_repo(self, tmp_path: Path) -> None:
+        assert find_git_dir(tmp_path) is None
+
+
+class TestDirectGitReads:
+    """Reading .git directly agrees with the git command."""
+
+    def _assert_matches_git(self, path: Path) -> None:
+        project_module._GIT_INFO_CACHE.clear()
+        assert get_git_info(str(path)) == _git_info_subprocess(str(path))
+
+    def test_loose_refs(self, tmp_git_repo: Path) -> None:
+        self._assert_matches_git(tmp_git_repo)
+
+    def test_packed_refs(self, tmp_git_repo: Path) -> None:
+        _git(tmp_git_repo, "pack-refs", "--all")
+        assert not (tmp_git_repo / ".git" / "refs" / "heads" / "main").exists()
+        self._assert_matches_git(tmp_git_repo)
+
+    def test_packed_objects(self, tmp_git_repo: Path) -> None:
+        _git(tmp_git_repo, "gc", "-q")
+        self._assert_matches_git(tmp_git_repo)
+
+    def test_detached_head(self, tmp_git_repo: Path) -> None:
+        _git(tmp_git_repo, "checkout", "-q", "--detach")
+        self._assert_matches_git(tmp_git_repo)
+        assert get_git_branch(str(tmp_git_repo)) == "HEAD"
+
+    def test_slash_in_branch_name(self, tmp_git_repo: Path) -> None:
+        _git(tmp_git_repo, "checkout", "-q", "-b", "feature/x")
+        self._assert_matches_git(tmp_git_repo)
+        assert get_git_branch(str(tmp_git_repo)) == "feature/x"
+
+    def test_linked_worktree(self, tmp_git_repo: Path, tmp_path: Path) -> None:
+        worktree = tmp_path / "wt"
+        _git(tmp_git_repo, "worktree", "add", "-q", "-b", "feature", str(worktree))
+        self._assert_matches_git(worktree)
+        assert get_git_branch(str(worktree)) == "feature"
+
+    def test_unborn_branch(self, tmp_path: Path) -> None:
+        _git(tmp_path, "init", "-q")
+        self._assert_matches_git(tmp_path)
+
+    def test_no_subprocess_for_loose_commit(self, tmp_git_repo: Path, no_git_command) -> None:
+        project_module._GIT_INFO_CACHE.clear()
+        info = get_git_info(str(tmp_git_repo))
+        assert info["branch"] == "main"
+        assert info["last_commit_time"]
+
+
+class TestGitInfoCache:
+    """Cached git info is reread only when the .git files change."""
+
+    def test_cached_until_commit(self, tmp_git_repo: Path, monkeypatch) -> None:
+        first = get_git_info(str(tmp_git_repo))
+        reads = []
+        real = project_module._read_git_info
+        monkeypatch.setattr(project_module, "_read_git_info", lambda *a: reads.append(a) or real(*a))
+
+        assert get_git_info(str(tmp_git_repo)) == first
+        assert reads == []
+
+        (tmp_git_repo / "new.txt").write_text("x")
+        _git(tmp_git_repo, "add", ".")
+        _git(tmp_git_repo, "commit", "-q", "-m", "second")
+        assert get_git_info(str(tmp_git_repo))["last_commit_hash"] != first["last_commit_hash"]
+        assert len(reads) == 1
+
+    def test_checkout_invalidates(self, tmp_git_repo: Path) -> None:
+        assert get_git_branch(str(tmp_git_repo)) == "main"
+        _git(tmp_git_repo, "checkout", "-q", "-b", "other")
+        assert get_git_branch(str(tmp_git_repo)) == "other"
+
+    def test_returned_dict_is_a_copy(self, tmp_git_repo: Path) -> None:
+        get_git_info(str(tmp_git_repo))["branch"] = "mutated"
+        assert get_git_branch(str(tmp_git_repo)) == "main"
+
+
+class TestProjectIndex:
+    """Persistent cwd -> identity index."""
+
+    def test_miss_records_entry(self, tmp_git_repo: Path, sample_config) -> None:
+        index = ProjectIndex(sample_config)
+        identity = index.identify(str(tmp_git_repo))
+        assert identity == identify_project(str(tmp_git_repo))
+        entry = index.load()[str(tmp_git_repo)]
+        assert entry["hash"] == identity["hash"]
+        assert entry["git_branch"] == "main"
+        assert index.entry_path(str(tmp_git_repo)).parent == sample_config.cortex_home / "projects" / "index"
+
+    def test_hit_skips_identification(self, tmp_git_repo: Path, sample_config, monkeypatch) -> None:
+        expected = ProjectIndex(sample_config).identify(str(tmp_git_repo))
+
+        def fail(cwd):
+            raise AssertionError("identify_project called")
+
+        monkeypatch.setattr(project_module, "identify_project", fail)
+        assert ProjectIndex(sample_config).identify(str(tmp_git_repo)) == expected
+
+    def test_checkout_and_commit_invalidate(self, tmp_git_repo: Path, sample_config) -> None:
+        index = ProjectIndex(sample_config)
+        first = index.identify(str(tmp_git_repo))
+
+        _git(tmp_git_repo, "checkout", "-q", "-b", "other")
+        assert index.identify(str(tmp_git_repo))["git_branch"] == "other"
+
+        _git(tmp_git_repo, "commit", "-q", "--allow-empty", "-m", "second")
+        commit = index.identify(str(tmp_git_repo))["git_info"]["last_commit_hash"]
+        assert commit != first["git_info"]["last_commit_hash"]
+        assert index.load()[str(tmp_git_repo)]["git_info"]["last_commit_hash"] == commit
+
+    def test_non_git_dir_listed_but_not_served(self, tmp_path: Path, sample_config, monkeypatch) -> None:
+        index = ProjectIndex(sample_config)
+        index.identify(str(tmp_path))
+        calls = []
+        real = project_module.identify_project
+        monkeypatch.setattr(project_module, "identify_project", lambda cwd: calls.append(cwd) or real(cwd))
+        index.identify(str(tmp_path))
+        assert calls == [str(tmp_path)]
+        assert [p["hash"] for p in index.projects()] == [get_project_hash(str(tmp_path))]
+
+    def test_projects_one_per_hash(self, tmp_git_repo: Path, tmp_path: Path, sample_config) -> None:
+        index = ProjectIndex(sample_config)
+        index.identify(str(tmp_git_repo))
+        index.identify(str(tmp_git_repo) + "/")
+        index.identify(str(tmp_path))
+        projects = index.projects()
+        assert len(projects) == 2
+        assert [p["path"] for p in projects] == sorted(p["path"] for p in projects)
+
+    def test_unreadable_index_is_empty(self, tmp_git_repo: Path, sample_config) -> None:
+        index = ProjectIndex(sample_config)
+        index.path.mkdir(parents=True)
+        index.entry_path(str(tmp_git_repo)).write_text("{not json")
+        assert index.load() == {}
+        assert index.identify(str(tmp_git_repo))["git_branch"] == "main"
+        assert str(tmp_git_repo) in index.load()
+
+    def test_concurrent_projects_keep_their_entries(
+        self, tmp_git_repo: Path, tmp_path: Path, sample_config, monkeypatch
+    ) -> None:
+        """A hook identifying another project mid-way through this one's miss keeps its entry."""
+        real = project_module.identify_project
+
+        def interleaved(cwd):
+            if cwd == str(tmp_git_repo):
+                ProjectIndex(sample_config).identify(str(tmp_path))
+            return real(cwd)
+
+        monkeypatch.setattr(project_module, "identify_project", interleaved)
+        ProjectIndex(sample_config).identify(str(tmp_git_repo))
+        assert set(ProjectIndex(sample_config).load()) == {str(tmp_git_repo), str(tmp_path)}
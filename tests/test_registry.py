@@ -0,0 +1,172 @@
+"""Tests for the extractor registry and shared extraction context."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+import cortex.transcript as transcript_module
+from cortex.backfill import backfill_project
+from cortex.config import CortexConfig
+from cortex.extractors import DEFAULT_REGISTRY, extract_events
+from cortex.hooks import handle_stop
+from cortex.models import EventType, create_event
+from cortex.project import get_project_hash
+from cortex.registry import ExtractionContext, ExtractorRegistry
+from cortex.store import EventStore
+from cortex.transcript import TranscriptEntry, parse_entry
+
+
+def _assistant(blocks: list, session_id: str = "s1") -> TranscriptEntry:
+    return TranscriptEntry(record_type="assistant", session_id=session_id, role="assistant", content_blocks=blocks)
+
+
+def _follow_ups(ctx: ExtractionContext) -> list:
+    """A custom extractor keyed on text no built-in layer looks for."""
+    return [
+        create_event(EventType.KNOWLEDGE_ACQUIRED, line.removeprefix("Follow-up:").strip(), session_id=ctx.session_id)
+        for line in ctx.text.splitlines()
+        if line.startswith("Follow-up:")
+    ]
+
+
+def _write_follow_up_transcript(path: Path) -> None:
+    message = {"role": "assistant", "content": [{"type": "text", "text": "Follow-up: rotate the API keys"}]}
+    path.write_text(json.dumps({"type": "assistant", "sessionId": "s1", "message": message}) + "\n")
+
+
+def _tool_result_user() -> TranscriptEntry:
+    return TranscriptEntry(
+        record_type="user",
+        role="user",
+        content_blocks=[{"type": "tool_result", "tool_use_id": "t1", "content": "Decision: not a decision"}],
+    )
+
+
+class TestExtractionContext:
+    """Tests for ExtractionContext defaults and shared views."""
+
+    def test_entry_values_override_defaults(self):
+        entry = TranscriptEntry(record_type="assistant", session_id="entry-s", git_branch="")
+        ctx = ExtractionContext(entry, session_id="default-s", project="p", git_branch="main")
+        assert (ctx.session_id, ctx.project, ctx.git_branch) == ("entry-s", "p", "main")
+
+    def test_text_derived_once(self, monkeypatch):
+        calls = []
+        real = transcript_module.extract_text_content
+
+        def counting(entry):
+            calls.append(entry)
+            return real(entry)
+
+        monkeypatch.setattr(transcript_module, "extract_text_content", counting)
+        entry = _assistant([{"type": "text", "text": "Decision: A\n[MEMORY: B]"}])
+        events = extract_events([entry])
+        assert {e.type for e in events} == {EventType.DECISION_MADE, EventType.KNOWLEDGE_ACQUIRED}
+        assert len(calls) == 1
+
+    def test_block_types(self):
+        ctx = ExtractionContext(_assistant([{"type": "text", "text": "x"}, {"type": "tool_use"}, "junk"]))
+        assert ctx.block_types == {"text", "tool_use"}
+
+
+class TestExtractorRegistry:
+    """Tests for registration, dispatch and cost accounting."""
+
+    @pytest.fixture
+    def registry(self) -> ExtractorRegistry:
+        registry = ExtractorRegistry()
+        registry.register(
+            "echo",
+            lambda ctx: [create_event(EventType.KNOWLEDGE_ACQUIRED, ctx.text, session_id=ctx.session_id)],
+            record_types=("assistant",),
+            block_types=("text",),
+        )
+        return registry
+
+    def test_dispatches_by_record_and_block_type(self, registry: ExtractorRegistry):
+        entries = [
+            _assistant([{"type": "text", "text": "hello"}]),
+            _assistant([{"type": "tool_use", "name": "Bash", "input": {}}]),
+            _tool_result_user(),
+            parse_entry({"type": "file-history-snapshot", "messageId": "m1"}),
+        ]
+        events = extract_events(entries, registry=registry)
+        assert [e.content for e in events] == ["hello"]
+        assert registry.stats()[0].calls == 1
+        assert registry.stats()[0].events == 1
+        assert registry.stats()[0].seconds >= 0.0
+
+    def test_runs_in_registration_order(self, registry: ExtractorRegistry):
+        registry.register(
+            "shout",
+            lambda ctx: [create_event(EventType.KNOWLEDGE_ACQUIRED, ctx.text.upper())],
+            record_types=("assistant",),
+        )
+        events = extract_events([_assistant([{"type": "text", "text": "hi"}])], registry=registry)
+        assert [e.content for e in events] == ["hi", "HI"]
+        assert [e.name for e in registry.extractors] == ["echo", "shout"]
+
+    def test_duplicate_name_rejected(self, registry: ExtractorRegistry):
+        with pytest.raises(ValueError):
+            registry.register("echo", lambda ctx: [], record_types=("user",))
+
+    def test_prefilter_unions_needles(self):
+        registry = ExtractorRegistry()
+        registry.register("a", lambda ctx: [], record_types=("assistant",), needles=("Alpha:",))
+        registry.register("b", lambda ctx: [], record_types=("user",), needles=("Beta:",), ignore_case=("gamma:",))
+        prefilter = registry.prefilter()
+        assert prefilter is not None
+        assert [prefilter.matches(line) for line in ("Alpha:", "Beta:", "GAMMA:", "Delta:")] == [True] * 3 + [False]
+        registry.unregister("b")
+        assert not registry.prefilter().matches("Beta:")
+
+    def test_extractor_without_needles_disables_prefilter(self, registry: ExtractorRegistry):
+        assert registry.prefilter() is None
+
+    def test_unregister_and_reset_stats(self, registry: ExtractorRegistry):
+        extract_events([_assistant([{"type": "text", "text": "hi"}])], registry=registry)
+        registry.reset_stats()
+        assert registry.stats()[0].calls == 0
+        registry.unregister("echo")
+        assert extract_events([_assistant([{"type": "text", "text": "hi"}])], registry=registry) == []
+
+
+class TestDefaultRegistry:
+    """The built-in layers are registered with the inputs they consume."""
+
+    def test_layer_order(self):
+        assert [e.name for e in DEFAULT_REGISTRY.extractors] == ["structural", "semantic", "explicit"]
+
+    def test_tool_result_only_entry_skips_text_layers(self):
+        DEFAULT_REGISTRY.reset_stats()
+        extract_events([_tool_result_user()])
+        calls = {s.name: s.calls for s in DEFAULT_REGISTRY.stats()}
+        assert calls == {"structural": 1, "semantic": 0, "explicit": 0}
+
+    @pytest.mark.parametrize("needles", [("Follow-up:",), None])
+    def test_custom_extractor_runs_in_hooks_and_backfill(
+        self,
+        needles: tuple | None,
+        tmp_path: Path,
+        sample_config: CortexConfig,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        DEFAULT_REGISTRY.register("follow-up", _follow_ups, record_types=("assistant",), needles=needles)
+        try:
+            transcript_dir = tmp_path / "claude-project"
+            transcript_dir.mkdir()
+            transcript_path = transcript_dir / "00000000-session.jsonl"
+            _write_follow_up_transcript(transcript_path)
+
+            monkeypatch.setattr("cortex.hooks.load_config", lambda: sample_config)
+            payload = {"cwd": str(tmp_path), "transcript_path": str(transcript_path), "session_id": "s1"}
+            assert handle_stop(payload) == 0
+            hooked = EventStore(get_project_hash(str(tmp_path)), sample_config).load_all()
+            assert [e.content for e in hooked] == ["rotate the API keys"]
+
+            backfill_project("0" * 16, transcript_dir, sample_config, max_workers=1)
+            backfilled = EventStore("0" * 16, sample_config).load_all()
+            assert [e.content for e in backfilled] == ["rotate the API keys"]
+        finally:
+            DEFAULT_REGISTRY.unregister("follow-up")
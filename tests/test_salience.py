@@ -0,0 +1,84 @@
+"""Tests for columnar salience scoring."""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from cortex import salience as salience_module
+from cortex.models import decayed_salience
+from cortex.salience import SalienceColumns
+
+NOW = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _rows(count: int, seed: int = 3) -> tuple[list[float], list[str], list[bool]]:
+    """Rows with salience ties, naive/aware/future/garbage timestamps and immortal flags."""
+    rng = random.Random(seed)
+    saliences, accessed, immortal = [], [], []
+    for _ in range(count):
+        saliences.append(rng.choice([0.0, 0.25, 0.5, 0.5, 0.8, rng.random()]))
+        stamp = NOW - timedelta(hours=rng.choice([0, 1, 24, 300]), microseconds=rng.choice([0, 0, 7]))
+        accessed.append(
+            rng.choice(
+                [
+                    stamp.isoformat(),
+                    stamp.isoformat(),
+                    stamp.replace(tzinfo=None).isoformat(),
+                    (NOW + timedelta(hours=1)).isoformat(),
+                    "",
+                    "not a date",
+                ]
+            )
+        )
+        immortal.append(rng.random() < 0.1)
+    return saliences, accessed, immortal
+
+
+def _reference_top(saliences, accessed, immortal, k):
+    scores = [decayed_salience(s, a, i, NOW) for s, a, i in zip(saliences, accessed, immortal, strict=True)]
+    return sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[:k]
+
+
+class TestSalienceColumns:
+    def test_scores_match_decayed_salience(self) -> None:
+        saliences, accessed, immortal = _rows(300)
+        expected = [decayed_salience(s, a, i, NOW) for s, a, i in zip(saliences, accessed, immortal, strict=True)]
+        assert SalienceColumns.from_timestamps(saliences, accessed, immortal).scores(NOW) == expected
+
+    @pytest.mark.parametrize("k", [1, 7, 30, 299, 300, 500])
+    def test_top_k_matches_stable_sort(self, k: int) -> None:
+        saliences, accessed, immortal = _rows(300)
+        columns = SalienceColumns.from_timestamps(saliences, accessed, immortal)
+        assert columns.top_k(k, NOW) == _reference_top(saliences, accessed, immortal, k)
+
+    def test_empty_and_zero_k(self) -> None:
+        assert SalienceColumns([], []).top_k(5, NOW) == []
+        assert SalienceColumns.from_timestamps([0.5], [NOW.isoformat()]).top_k(0, NOW) == []
+
+    @pytest.mark.parametrize("k", [1, 30, 1000, 2500])
+    def test_numpy_matches_python(self, k: int, monkeypatch: pytest.MonkeyPatch) -> None:
+        pytest.importorskip("numpy")
+        salience_module.load_numpy()
+        saliences, accessed, immortal = _rows(2000)
+        columns = SalienceColumns.from_timestamps(saliences, accessed, immortal)
+        expected = columns.top_k(k, NOW)
+        monkeypatch.setattr(salience_module, "VECTORIZE_MIN_ROWS", 0)
+        assert columns.top_k(k, NOW) == expected
+
+    def test_falls_back_without_numpy(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        saliences, accessed, immortal = _rows(200)
+        monkeypatch.setattr(salience_module, "VECTORIZE_MIN_ROWS", 0)
+        monkeypatch.setattr(salience_module, "load_numpy", lambda: None)
+        columns = SalienceColumns.from_timestamps(saliences, accessed, immortal)
+        assert columns.top_k(30, NOW) == _reference_top(saliences, accessed, immortal, 30)
+
+    def test_numpy_imported_only_for_large_inputs(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        sentinel = object()
+        monkeypatch.setattr(salience_module, "_numpy_checked", False)
+        monkeypatch.setattr(salience_module, "load_numpy", lambda: sentinel)
+        assert salience_module._numpy_for(salience_module.VECTORIZE_MIN_ROWS - 1) is None
+        assert salience_module._numpy_for(salience_module.VECTORIZE_MIN_ROWS) is None
+        assert salience_module._numpy_for(salience_module.IMPORT_MIN_ROWS) is sentinel
+        monkeypatch.setattr(salience_module, "_numpy_checked", True)
+        assert salience_module._numpy_for(salience_module.VECTORIZE_MIN_ROWS) is sentinel
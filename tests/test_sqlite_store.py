@@ -0,0 +1,261 @@
+"""Tests for the SQLite-backed Cortex event store."""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from cortex import salience as salience_module
+from cortex.config import CortexConfig
+from cortex.models import EventType, create_event
+from cortex.sqlite_store import SQLiteEventStore
+from cortex.store import EventStore, open_store
+
+
+@pytest.fixture
+def sqlite_store(sample_project_hash: str, sample_config: CortexConfig):
+    store = SQLiteEventStore(sample_project_hash, sample_config)
+    yield store
+    store.close()
+
+
+def _ids(events: list) -> list[str]:
+    return [e.id for e in events]
+
+
+class TestSQLiteEventStoreBasics:
+    """Tests for basic SQLiteEventStore operations."""
+
+    def test_empty_store(self, sqlite_store: SQLiteEventStore) -> None:
+        """A new store has zero events."""
+        assert sqlite_store.count() == 0
+        assert sqlite_store.load_all() == []
+
+    def test_uses_wal_mode(self, sqlite_store: SQLiteEventStore) -> None:
+        """The database is opened in WAL journal mode."""
+        mode = sqlite_store._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_round_trip_preserves_fields(self, sqlite_store: SQLiteEventStore) -> None:
+        """Stored events load back with all fields intact."""
+        e = create_event(EventType.KNOWLEDGE_ACQUIRED, "learned X", session_id="s1", metadata={"k": "v"})
+        sqlite_store.append(e)
+        loaded = sqlite_store.load_all()
+        assert loaded[0].to_dict() == e.to_dict()
+
+    def test_append_many_deduplicates(self, sqlite_store: SQLiteEventStore) -> None:
+        """Duplicates by content hash are skipped, in store and in batch."""
+        sqlite_store.append(create_event(EventType.DECISION_MADE, "chose X", session_id="s1"))
+        sqlite_store.append_many(
+            [
+                create_event(EventType.DECISION_MADE, "chose X", session_id="s1"),
+                create_event(EventType.KNOWLEDGE_ACQUIRED, "learned Y", session_id="s1"),
+                create_event(EventType.KNOWLEDGE_ACQUIRED, "learned Y", session_id="s1"),
+            ]
+        )
+        assert sqlite_store.count() == 2
+
+    def test_mark_accessed(self, sqlite_store: SQLiteEventStore) -> None:
+        """mark_accessed bumps access_count and accessed_at."""
+        e = create_event(EventType.KNOWLEDGE_ACQUIRED, "learned X")
+        sqlite_store.append(e)
+        sqlite_store.mark_accessed([e.id, "missing"])
+        sqlite_store.mark_accessed([e.id])
+        loaded = sqlite_store.load_all()[0]
+        assert loaded.access_count == 2
+        assert loaded.accessed_at >= e.accessed_at
+
+    def test_clear(self, sqlite_store: SQLiteEventStore, sample_events: list) -> None:
+        """clear() removes all events."""
+        sqlite_store.append_many(sample_events)
+        sqlite_store.clear()
+        assert sqlite_store.count() == 0
+
+    def test_generation_tracks_writes(
+        self, sqlite_store: SQLiteEventStore, sample_project_hash: str, sample_config: CortexConfig
+    ) -> None:
+        """generation() changes on writes, not on reads or a reopen."""
+        sqlite_store.append(create_event(EventType.DECISION_MADE, "chose X"))
+        sqlite_store.close()
+        store = SQLiteEventStore(sample_project_hash, sample_config)
+        before = store.generation()
+        store.load_for_briefing()
+        assert store.generation() == before
+        store.append(create_event(EventType.KNOWLEDGE_ACQUIRED, "learned Y"))
+        assert store.generation() != before
+        store.close()
+
+
+class TestSQLiteEventStoreParity:
+    """SQLiteEventStore answers queries exactly like EventStore."""
+
+    @pytest.fixture
+    def both(self, sample_project_hash: str, tmp_cortex_home: Path, sample_events: list):
+        json_store = EventStore(sample_project_hash, CortexConfig(cortex_home=tmp_cortex_home))
+        sql_store = SQLiteEventStore("0" * 16, CortexConfig(cortex_home=tmp_cortex_home))
+        extra = [
+            create_event(EventType.DECISION_MADE, "feature decision", git_branch="feature/x"),
+            create_event(EventType.COMMAND_RUN, "no branch"),
+        ]
+        for store in (json_store, sql_store):
+            store.append_many(sample_events + extra)
+        yield json_store, sql_store
+        sql_store.close()
+
+    def test_queries_match(self, both) -> None:
+        """load_recent, load_by_type and load_immortal agree."""
+        json_store, sql_store = both
+        assert _ids(sql_store.load_recent(5)) == _ids(json_store.load_recent(5))
+        assert _ids(sql_store.load_by_type(EventType.FILE_MODIFIED)) == _ids(
+            json_store.load_by_type(EventType.FILE_MODIFIED)
+        )
+        assert _ids(sql_store.load_immortal()) == _ids(json_store.load_immortal())
+
+    @pytest.mark.parametrize("branch", [None, "main", "feature/x"])
+    def test_briefing_matches(self, both, branch) -> None:
+        """load_for_briefing produces the same sections in the same order."""
+        json_store, sql_store = both
+        expected = json_store.load_for_briefing(branch=branch)
+        actual = sql_store.load_for_briefing(branch=branch)
+        for key in ("immortal", "active_plan", "recent"):
+            assert _ids(actual[key]) == _ids(expected[key])
+
+    def test_recent_matches_vectorized(self, both, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Ranking with NumPy keeps the same order, ties included."""
+        pytest.importorskip("numpy")
+        salience_module.load_numpy()
+        monkeypatch.setattr(salience_module, "VECTORIZE_MIN_ROWS", 0)
+        json_store, sql_store = both
+        stamp = "2026-01-01T00:00:00+00:00"
+        tied = [create_event(EventType.KNOWLEDGE_ACQUIRED, f"tie {i}") for i in range(40)]
+        for event in tied:
+            event.accessed_at = stamp
+        for store in (json_store, sql_store):
+            store.append_many(tied)
+        assert _ids(sql_store.load_for_briefing()["recent"]) == _ids(json_store.load_for_briefing()["recent"])
+
+    @pytest.mark.parametrize(
+        "names",
+        [("id",), ("type", "immortal", "salience"), ("id", "content", "metadata", "accessed_at", "access_count")],
+    )
+    def test_projections_match(self, both, names) -> None:
+        """iter_ids and iter_fields agree with load_all, from columns or stored JSON."""
+        json_store, sql_store = both
+        sql_store.mark_accessed([next(sql_store.iter_ids())])
+        assert list(sql_store.iter_ids()) == list(json_store.iter_ids())
+        expected = [tuple(getattr(e, name) for name in names) for e in sql_store.load_all()]
+        assert list(sql_store.iter_fields(*names)) == expected
+
+    def test_mixed_offsets_order_by_instant(self, both) -> None:
+        """Naive and offset created_at values sort by instant, not as text."""
+        json_store, sql_store = both
+        # Lexically "2026-03-01T09..." < "2026-03-01T10...", but 09:00-05:00 is later.
+        later = create_event(EventType.DECISION_MADE, "later, with offset")
+        later.created_at = "2026-03-01T09:00:00-05:00"
+        earlier = create_event(EventType.DECISION_MADE, "earlier, naive")
+        earlier.created_at = "2026-03-01T10:00:00"
+        for store in (json_store, sql_store):
+            store.append_many([later, earlier])
+        assert _ids(sql_store.load_immortal()) == _ids(json_store.load_immortal())
+        assert _ids(sql_store.load_recent(2)) == _ids(json_store.load_recent(2))
+        expected = json_store.load_for_briefing()["immortal"]
+        assert _ids(sql_store.load_for_briefing()["immortal"]) == _ids(expected)
+        assert _ids(expected).index(later.id) < _ids(expected).index(earlier.id)
+
+
+class TestSQLiteEventStoreMigration:
+    """Tests for one-shot import of events.json."""
+
+    def test_imports_events_json(self, sample_project_hash: str, sample_config: CortexConfig, sample_events) -> None:
+        """Existing events.json is imported and renamed."""
+        json_store = EventStore(sample_project_hash, sample_config)
+        json_store.append_many(sample_events)
+
+        store = SQLiteEventStore(sample_project_hash, sample_config)
+        try:
+            assert _ids(store.load_all()) == _ids(sample_events)
+            assert not json_store.events_path.exists()
+            assert json_store.events_path.with_suffix(".json.migrated").exists()
+        finally:
+            store.close()
+
+    def test_backfills_epoch_columns(
+        self, sample_project_hash: str, sample_config: CortexConfig, sample_events: list
+    ) -> None:
+        """A database from before created_us / accessed_us gets them added and filled."""
+        store = SQLiteEventStore(sample_project_hash, sample_config)
+        store.append_many(sample_events)
+        db_path = store.db_path
+        store.close()
+        conn = sqlite3.connect(db_path)
+        with conn:
+            conn.execute("DROP INDEX idx_events_type_created_us")
+            conn.execute("DROP INDEX idx_events_created_us")
+            conn.execute("DROP INDEX idx_events_immortal_us")
+            conn.execute("ALTER TABLE events DROP COLUMN created_us")
+            conn.execute("ALTER TABLE events DROP COLUMN accessed_us")
+            conn.execute("PRAGMA user_version = 0")
+        conn.close()
+
+        store = SQLiteEventStore(sample_project_hash, sample_config)
+        try:
+            rows = store._conn.execute("SELECT created_us, accessed_us FROM events ORDER BY seq").fetchall()
+            assert rows == [(e.created_us, e.accessed_us) for e in sample_events]
+            assert all(value is not None for row in rows for value in row)
+        finally:
+            store.close()
+
+    def test_half_migrated_database_backfilled(
+        self, sample_project_hash: str, sample_config: CortexConfig, sample_events: list
+    ) -> None:
+        """Columns added without their backfill (an interrupted migration) get filled on open."""
+        store = SQLiteEventStore(sample_project_hash, sample_config)
+        store.append_many(sample_events)
+        db_path = store.db_path
+        store.close()
+        conn = sqlite3.connect(db_path)
+        with conn:
+            conn.execute("UPDATE events SET created_us = NULL, accessed_us = NULL")
+            conn.execute("PRAGMA user_version = 0")
+        conn.close()
+
+        store = SQLiteEventStore(sample_project_hash, sample_config)
+        try:
+            rows = store._conn.execute("SELECT created_us, accessed_us FROM events ORDER BY seq").fetchall()
+            assert rows == [(e.created_us, e.accessed_us) for e in sample_events]
+            assert store._conn.execute("PRAGMA user_version").fetchone()[0] == 1
+        finally:
+            store.close()
+
+    def test_corrupt_events_json_left_alone(self, sample_project_hash: str, sample_config: CortexConfig) -> None:
+        """A corrupt events.json does not prevent opening the store."""
+        events_path = EventStore(sample_project_hash, sample_config).events_path
+        events_path.write_text("{not json")
+        store = SQLiteEventStore(sample_project_hash, sample_config)
+        try:
+            assert store.count() == 0
+            assert events_path.exists()
+        finally:
+            store.close()
+
+
+class TestOpenStore:
+    """Tests for backend selection in open_store()."""
+
+    def test_sqlite_backend(self, sample_project_hash: str, tmp_cortex_home: Path) -> None:
+        store = open_store(sample_project_hash, CortexConfig(cortex_home=tmp_cortex_home, store_backend="sqlite"))
+        assert isinstance(store, SQLiteEventStore)
+        store.close()
+
+    def test_default_backend(self, sample_project_hash: str, sample_config: CortexConfig) -> None:
+        assert isinstance(open_store(sample_project_hash, sample_config), EventStore)
+
+    def test_sqlite_does_not_write_events_json(self, sample_project_hash: str, tmp_cortex_home: Path) -> None:
+        """The sqlite store never writes events.json."""
+        config = CortexConfig(cortex_home=tmp_cortex_home, store_backend="sqlite")
+        store = open_store(sample_project_hash, config)
+        store.append(create_event(EventType.DECISION_MADE, "chose X"))
+        store.close()
+        project_dir = tmp_cortex_home / "projects" / sample_project_hash
+        assert not (project_dir / "events.json").exists()
+        assert (project_dir / "events.db").exists()
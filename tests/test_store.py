@@ -2,6 +2,10 @@
 
 import json
 
+import pytest
+
+from cortex import store as store_module
+from cortex.config import CortexConfig
 from cortex.models import EventType, create_event
 from cortex.store import EventStore, HookState
 
@@ -133,6 +137,30 @@ class TestEventStoreQueries:
         assert len(immortal) == 2
         assert all(e.immortal for e in immortal)
 
+    def test_iter_ids(self, event_store: EventStore, sample_events: list) -> None:
+        """iter_ids yields ids in store order."""
+        event_store.append_many(sample_events)
+        assert list(event_store.iter_ids()) == [e.id for e in sample_events]
+
+    def test_iter_fields_matches_load_all(self, event_store: EventStore, sample_events: list) -> None:
+        """iter_fields projects the values load_all() would hold."""
+        event_store.append_many(sample_events)
+        event_store.mark_accessed([sample_events[0].id])
+        names = ("id", "type", "immortal", "metadata", "access_count")
+        expected = [tuple(getattr(e, name) for name in names) for e in event_store.load_all()]
+        assert list(event_store.iter_fields(*names)) == expected
+
+    def test_iter_fields_defaults(self, event_store: EventStore) -> None:
+        """Missing fields take Event.from_dict() defaults."""
+        event_store.backend.append_raw([{"content": "bare"}])
+        assert list(event_store.iter_fields("type", "salience", "metadata")) == [
+            (EventType.KNOWLEDGE_ACQUIRED, 0.5, {})
+        ]
+
+    def test_iter_fields_rejects_unknown_names(self, event_store: EventStore) -> None:
+        with pytest.raises(ValueError, match="bogus"):
+            event_store.iter_fields("id", "bogus")
+
 
 class TestEventStoreForBriefing:
     """Tests for the briefing-oriented query."""
@@ -235,6 +263,73 @@ class TestEventStoreMarkAccessed:
         assert loaded[0].access_count == 0
 
 
+@pytest.mark.parametrize("backend", ["json", "jsonl"])
+class TestEventStoreAccessJournal:
+    """mark_accessed journals accesses instead of rewriting the store."""
+
+    @pytest.fixture
+    def store(self, backend: str, sample_project_hash: str, tmp_cortex_home) -> EventStore:
+        return EventStore(sample_project_hash, CortexConfig(cortex_home=tmp_cortex_home, store_backend=backend))
+
+    def test_does_not_rewrite_events(self, store: EventStore, sample_events: list) -> None:
+        store.append_many(sample_events)
+        backend_fingerprint = store.backend.fingerprint()
+        generation = store.generation()
+        store.mark_accessed([sample_events[0].id, sample_events[1].id, sample_events[0].id])
+        assert store.backend.fingerprint() == backend_fingerprint
+        assert store.generation() != generation
+        assert store._access_journal.path.exists()
+
+    def test_readers_merge_journal(self, store: EventStore, sample_events: list) -> None:
+        store.append_many(sample_events)
+        target = sample_events[2]
+        store.mark_accessed([target.id])
+        store.mark_accessed([target.id])
+        reopened = EventStore(store._project_hash, store._config)
+        (loaded,) = [e for e in reopened.load_all() if e.id == target.id]
+        assert loaded.access_count == 2
+        assert loaded.accessed_at > target.accessed_at
+        assert [e.access_count for e in reopened.load_by_type(target.type)] == [
+            e.access_count for e in reopened.load_all() if e.type == target.type
+        ]
+        reopened.load_for_briefing()
+        assert reopened.verify_briefing_view() == []
+
+    def test_compact_folds_journal(self, store: EventStore, sample_events: list) -> None:
+        store.append_many(sample_events)
+        store.mark_accessed([e.id for e in sample_events[:3]])
+        before = [e.to_dict() for e in store.load_all()]
+        store.compact()
+        assert not store._access_journal.path.exists()
+        assert [e.to_dict() for e in store.load_all()] == before
+        assert [record["access_count"] for record in store.backend.load_raw()[:3]] == [1, 1, 1]
+        store.compact()
+        assert [e.to_dict() for e in store.load_all()] == before
+
+    def test_folds_at_threshold(self, store: EventStore, sample_events: list, monkeypatch) -> None:
+        monkeypatch.setattr(store_module, "FOLD_BYTES", 1)
+        store.append_many(sample_events)
+        store.mark_accessed([sample_events[0].id])
+        assert not store._access_journal.path.exists()
+        assert store.backend.load_raw()[0]["access_count"] == 1
+
+    def test_append_keeps_pending_accesses(self, store: EventStore, sample_events: list) -> None:
+        store.append_many(sample_events[:3])
+        store.mark_accessed([sample_events[0].id])
+        store.append_many(sample_events[3:])
+        loaded = store.load_all()
+        assert [e.access_count for e in loaded[:3]] == [1, 0, 0]
+        assert len(loaded) == len(sample_events)
+
+    def test_clear_discards_journal(self, store: EventStore, sample_events: list) -> None:
+        store.append_many(sample_events)
+        store.mark_accessed([sample_events[0].id])
+        store.clear()
+        assert not store._access_journal.path.exists()
+        store.append_many(sample_events[:1])
+        assert store.load_all()[0].access_count == 0
+
+
 class TestEventStoreClear:
     """Tests for clearing the store."""
 
@@ -249,6 +344,19 @@ class TestEventStoreClear:
         assert event_store.load_all() == []
 
 
+class TestEventStoreGeneration:
+    """Tests for the store generation token."""
+
+    def test_changes_on_write_only(self, event_store: EventStore) -> None:
+        """generation() is stable across reads and changes on writes."""
+        event_store.append(create_event(EventType.DECISION_MADE, "chose X"))
+        before = event_store.generation()
+        event_store.load_for_briefing()
+        assert event_store.generation() == before
+        event_store.append(create_event(EventType.KNOWLEDGE_ACQUIRED, "learned Y"))
+        assert event_store.generation() != before
+
+
 class TestEventStoreFileHandling:
     """Tests for file I/O edge cases."""
 
@@ -6,15 +6,18 @@ Covers all public functions and classes in transcript.py:
 - Extraction helpers (text, thinking, tool_calls, tool_results)
 - strip_code_blocks() for fenced and inline code
 - TranscriptReader incremental byte-offset reading
-- find_transcript_path() and find_latest_transcript() path resolution
+- find_transcript_path(), find_latest_transcript() and find_session_transcripts() path resolution
 """
 
 import json
+import os
+import pickle
 import time
 from pathlib import Path
 
 import pytest
 
+import cortex.transcript as transcript_module
 from cortex.transcript import (
     CONTENT_TYPE_TEXT,
     CONTENT_TYPE_THINKING,
@@ -24,6 +27,7 @@ from cortex.transcript import (
     RECORD_TYPE_FILE_SNAPSHOT,
     RECORD_TYPE_SUMMARY,
     RECORD_TYPE_USER,
+    LineFilter,
     TranscriptEntry,
     TranscriptReader,
     extract_text_content,
@@ -31,6 +35,7 @@ from cortex.transcript import (
     extract_tool_calls,
     extract_tool_results,
     find_latest_transcript,
+    find_session_transcripts,
     find_transcript_path,
     parse_entry,
     strip_code_blocks,
@@ -365,6 +370,52 @@ class TestTranscriptEntryProperties:
         assert entry.has_thinking is False
 
 
+class TestTranscriptEntryViews:
+    """Test the memoized derived views on TranscriptEntry."""
+
+    @staticmethod
+    def _entry() -> TranscriptEntry:
+        return TranscriptEntry(
+            record_type="assistant",
+            content_blocks=[
+                {"type": "text", "text": "Decision: use `sqlite`"},
+                {"type": "tool_use", "id": "t1", "name": "Bash", "input": {"command": "ls"}},
+            ],
+        )
+
+    def test_views_match_functions(self):
+        entry = self._entry()
+        assert entry.text == extract_text_content(entry)
+        assert entry.stripped_text == strip_code_blocks(extract_text_content(entry))
+        assert entry.tool_calls == extract_tool_calls(entry)
+        assert entry.tool_results == extract_tool_results(entry)
+        assert entry.block_types == {"text", "tool_use"}
+
+    def test_views_computed_once(self, monkeypatch):
+        calls = []
+
+        def counting(entry):
+            calls.append(entry)
+            return []
+
+        monkeypatch.setattr(transcript_module, "extract_tool_calls", counting)
+        entry = self._entry()
+        first = entry.tool_calls
+        assert entry.tool_calls is first
+        assert len(calls) == 1
+
+    def test_cache_ignored_by_equality_and_repr(self):
+        entry = self._entry()
+        _ = entry.text, entry.stripped_text, entry.tool_calls, entry.block_types
+        assert entry == self._entry()
+        assert "stripped_text=" not in repr(entry)
+
+    def test_survives_pickle(self):
+        entry = self._entry()
+        _ = entry.text
+        assert pickle.loads(pickle.dumps(entry)).text == entry.text
+
+
 # ---------------------------------------------------------------------------
 # extract_text_content
 # ---------------------------------------------------------------------------
@@ -711,6 +762,55 @@ class TestStripCodeBlocks:
         # Single backtick — no match, text preserved
         assert "5`" in result
 
+    def test_longer_fence_contains_shorter_fence(self):
+        text = "Before\n````md\n```py\nx = 1\n```\n````\nAfter"
+        result = strip_code_blocks(text)
+        assert "x = 1" not in result
+        assert "md" not in result
+        assert "Before" in result
+        assert "After" in result
+
+    def test_fence_closes_on_longer_run(self):
+        text = "Start\n~~~\ncode\n~~~~~\nEnd"
+        result = strip_code_blocks(text)
+        assert "code" not in result
+        assert "Start" in result
+        assert "End" in result
+
+    def test_fence_chars_do_not_close_each_other(self):
+        text = "A\n```\none\n~~~\ntwo\n```\nB"
+        result = strip_code_blocks(text)
+        assert "one" not in result
+        assert "two" not in result
+        assert "B" in result
+
+    def test_double_backtick_span_with_inner_backtick(self):
+        text = "Type ``a ` b`` then stop"
+        result = strip_code_blocks(text)
+        assert "a ` b" not in result
+        assert "Type" in result
+        assert "then stop" in result
+
+    def test_unclosed_fence_kept_as_text(self):
+        text = "Decision: keep the parser\n```\nno closing fence here"
+        result = strip_code_blocks(text)
+        assert "Decision: keep the parser" in result
+        assert "no closing fence here" in result
+
+    def test_blocks_after_unclosed_opener_still_removed(self):
+        text = "A ```` open\n```\none\n```\nB ``x`` C ``` ~~~~\ntwo\n~~~~\nD"
+        result = strip_code_blocks(text)
+        assert "one" not in result
+        assert "two" not in result
+        assert "x" not in result
+        assert "A ````" in result
+        assert "D" in result
+
+    def test_adversarial_input_completes(self):
+        text = "``a`b```c" * 20_000 + "````x" * 5_000
+        result = strip_code_blocks(text)
+        assert len(result) <= len(text)
+
 
 # ---------------------------------------------------------------------------
 # TranscriptReader — basic operations
@@ -1108,3 +1208,226 @@ class TestFindLatestTranscript:
         only.write_text('{"type":"summary","summary":"only","leafUuid":"l1"}\n')
         result = find_latest_transcript(tmp_path)
         assert result == only
+
+
+class TestFindSessionTranscripts:
+    """Test listing every main session transcript for backfill."""
+
+    def test_lists_oldest_first_without_agents(self, tmp_path: Path):
+        old = tmp_path / "aaaa-bbbb-cccc.jsonl"
+        new = tmp_path / "dddd-eeee-ffff.jsonl"
+        new.write_text("{}\n")
+        (tmp_path / "agent-task-001.jsonl").write_text("{}\n")
+        old.write_text("{}\n")
+        os.utime(old, (0, 0))
+        assert find_session_transcripts(tmp_path) == [old, new]
+
+    def test_nonexistent_directory(self, tmp_path: Path):
+        assert find_session_transcripts(tmp_path / "nonexistent") == []
+
+
+# ---------------------------------------------------------------------------
+# TranscriptReader.iter_new — streaming
+# ---------------------------------------------------------------------------
+
+
+class TestTranscriptReaderIterNew:
+    """Tests for the lazy iter_new() generator."""
+
+    def test_matches_read_new(self, simple_transcript: Path):
+        streamed = list(TranscriptReader(simple_transcript).iter_new())
+        loaded = TranscriptReader(simple_transcript).read_new()
+        assert [e.uuid for e in streamed] == [e.uuid for e in loaded]
+
+    def test_is_lazy(self, simple_transcript: Path):
+        """Nothing is read until the generator is advanced."""
+        reader = TranscriptReader(simple_transcript)
+        it = reader.iter_new()
+        assert reader.last_offset == 0
+        next(it)
+        assert 0 < reader.last_offset < simple_transcript.stat().st_size
+
+    def test_entry_offsets_are_line_ends(self, tmp_path: Path):
+        """Each entry's offset is the byte position just past its line."""
+        transcript = tmp_path / "t.jsonl"
+        lines = [
+            json.dumps({"type": "summary", "summary": "Start — é", "leafUuid": "l1"}, ensure_ascii=False),
+            "garbage",
+            json.dumps({"type": "summary", "summary": "Next", "leafUuid": "l2"}),
+        ]
+        transcript.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        entries = list(TranscriptReader(transcript).iter_new())
+        first_end = len(lines[0].encode("utf-8")) + 1
+        assert entries[0].offset == first_end
+        assert entries[1].offset == transcript.stat().st_size
+
+        resumed = TranscriptReader(transcript).read_new(from_offset=entries[0].offset)
+        assert [e.uuid for e in resumed] == ["l2"]
+
+    def test_early_stop_resumes_after_last_entry(self, simple_transcript: Path):
+        """last_offset after a partial iteration resumes at the next entry."""
+        reader = TranscriptReader(simple_transcript)
+        it = reader.iter_new()
+        first = next(it)
+        it.close()
+        assert reader.last_offset == first.offset
+
+        rest = TranscriptReader(simple_transcript).read_new(from_offset=reader.last_offset)
+        assert len(rest) == len(_load_entries(simple_transcript)) - 1
+
+    def test_entries_read(self, simple_transcript: Path):
+        reader = TranscriptReader(simple_transcript)
+        for _ in reader.iter_new():
+            pass
+        assert reader.entries_read == 7
+        list(reader.iter_new(from_offset=reader.last_offset))
+        assert reader.entries_read == 0
+
+    def test_invalid_utf8_line_skipped(self, tmp_path: Path):
+        transcript = tmp_path / "bad.jsonl"
+        transcript.write_bytes(b'{"type": "summary", "summary": "\xff"}\n{"type": "summary", "leafUuid": "ok"}\n')
+        entries = list(TranscriptReader(transcript).iter_new())
+        assert [e.uuid for e in entries] == ["ok"]
+
+    def test_no_new_content_keeps_offset(self, simple_transcript: Path):
+        """A fresh reader at EOF reports the offset it started from."""
+        size = simple_transcript.stat().st_size
+        reader = TranscriptReader(simple_transcript)
+        assert list(reader.iter_new(from_offset=size)) == []
+        assert reader.last_offset == size
+
+
+class TestTranscriptReaderPartialLines:
+    """Tests for chunked reading and unterminated trailing lines."""
+
+    def test_partial_tail_is_held_back(self, tmp_path: Path):
+        """A half-written final record is not consumed until it completes."""
+        transcript = tmp_path / "t.jsonl"
+        first = json.dumps({"type": "summary", "summary": "one", "leafUuid": "l1"}) + "\n"
+        second = json.dumps({"type": "summary", "summary": "two", "leafUuid": "l2"})
+        transcript.write_text(first + second[:20])
+
+        reader = TranscriptReader(transcript)
+        assert [e.uuid for e in reader.read_new()] == ["l1"]
+        assert reader.last_offset == len(first)
+
+        with open(transcript, "a") as f:
+            f.write(second[20:] + "\n")
+        assert [e.uuid for e in reader.read_new(from_offset=reader.last_offset)] == ["l2"]
+
+    def test_complete_unterminated_tail_is_read(self, tmp_path: Path):
+        """A valid final record without a newline is consumed."""
+        transcript = tmp_path / "t.jsonl"
+        transcript.write_text(json.dumps({"type": "summary", "leafUuid": "l1"}))
+        reader = TranscriptReader(transcript)
+        assert [e.uuid for e in reader.read_new()] == ["l1"]
+        assert reader.last_offset == transcript.stat().st_size
+
+    def test_lines_spanning_chunks(self, tmp_path: Path, monkeypatch):
+        """Lines longer than the read size are reassembled with exact offsets."""
+        monkeypatch.setattr(transcript_module, "_READ_CHUNK_BYTES", 7)
+        transcript = tmp_path / "t.jsonl"
+        lines = [json.dumps({"type": "summary", "summary": "x" * n, "leafUuid": f"l{n}"}) for n in (0, 5, 40)]
+        transcript.write_text("\n\n".join(lines) + "\n")
+
+        entries = TranscriptReader(transcript).read_new()
+        assert [e.uuid for e in entries] == ["l0", "l5", "l40"]
+        assert entries[-1].offset == transcript.stat().st_size
+        assert [e.uuid for e in TranscriptReader(transcript).read_new(from_offset=entries[0].offset)] == ["l5", "l40"]
+
+
+class TestSelectiveDecoding:
+    """Tests for the slimmed, slotted TranscriptEntry representation."""
+
+    def test_entry_has_no_instance_dict(self):
+        assert not hasattr(TranscriptEntry(), "__dict__")
+
+    def test_bulky_tool_use_result_fields_dropped(self):
+        raw = {
+            "type": "user",
+            "uuid": "u1",
+            "message": {"role": "user", "content": [{"type": "tool_result", "content": "ok"}]},
+            "toolUseResult": {"type": "text", "filePath": "/a.py", "content": "x" * 10_000, "patch": [1, 2]},
+        }
+        entry = parse_entry(raw)
+        assert entry.raw["toolUseResult"] == {"type": "text", "filePath": "/a.py"}
+        assert "content" in raw["toolUseResult"]
+
+    def test_todo_tool_use_result_kept(self):
+        todos = {"oldTodos": [{"content": "a", "status": "pending"}], "newTodos": []}
+        raw = {"type": "user", "message": {"role": "user", "content": []}, "toolUseResult": todos}
+        assert parse_entry(raw).raw["toolUseResult"] is todos
+
+    def test_snapshot_keeps_only_message_id(self):
+        raw = {"type": "file-history-snapshot", "messageId": "m1", "snapshot": {"trackedFileBackups": {"a": 1}}}
+        entry = parse_entry(raw)
+        assert entry.uuid == "m1"
+        assert entry.raw == {"type": "file-history-snapshot", "messageId": "m1"}
+
+    @pytest.mark.parametrize("suffix", ["", " — é"])
+    def test_sniffed_snapshot_matches_parsed(self, tmp_path: Path, suffix: str):
+        """Snapshot lines recognized without decoding equal parse_entry() output."""
+        raw = {
+            "type": "file-history-snapshot",
+            "messageId": "m1",
+            "snapshot": {"messageId": "m1", "trackedFileBackups": {"f": "v" + suffix}},
+            "isSnapshotUpdate": False,
+        }
+        transcript = tmp_path / "t.jsonl"
+        transcript.write_text(json.dumps(raw, separators=(",", ":"), ensure_ascii=False) + "\n", encoding="utf-8")
+        entries = TranscriptReader(transcript).read_all()
+        entries[0].offset = 0
+        assert entries == [parse_entry(raw)]
+
+    def test_malformed_snapshot_line_skipped(self, tmp_path: Path):
+        transcript = tmp_path / "t.jsonl"
+        transcript.write_text('{"type":"file-history-snapshot","messageId":"m1",\n')
+        assert TranscriptReader(transcript).read_all() == []
+
+
+class TestLineFilter:
+    """Tests for the raw-line prefilter."""
+
+    def test_matches_str_and_bytes(self):
+        prefilter = LineFilter(['"tool_use"'])
+        assert prefilter.matches('{"type":"tool_use"}')
+        assert prefilter.matches(b'{"type":"tool_use"}')
+        assert not prefilter.matches('{"type":"text"}')
+        assert not prefilter.matches(b'{"type":"text"}')
+
+    def test_ignore_case(self):
+        prefilter = LineFilter([], ignore_case=["Error resolved:"])
+        assert prefilter.matches("ERROR RESOLVED: x")
+        assert prefilter.matches(b"error Resolved: x")
+        assert not prefilter.matches("error was resolved")
+
+
+class TestTranscriptReaderPrefilter:
+    """Tests for iter_new(prefilter=...)."""
+
+    def _write(self, tmp_path: Path, lines: list[str], tail: str = "") -> Path:
+        transcript = tmp_path / "t.jsonl"
+        transcript.write_text("".join(line + "\n" for line in lines) + tail)
+        return transcript
+
+    def test_rejected_lines_skipped_but_consumed(self, tmp_path: Path):
+        keep = json.dumps({"type": "summary", "summary": "KEEP", "leafUuid": "l1"})
+        drop = json.dumps({"type": "summary", "summary": "other", "leafUuid": "l2"})
+        transcript = self._write(tmp_path, [drop, keep, "", drop])
+
+        reader = TranscriptReader(transcript)
+        entries = list(reader.iter_new(prefilter=LineFilter(["KEEP"])))
+        assert [e.uuid for e in entries] == ["l1"]
+        assert reader.lines_skipped == 2
+        assert reader.entries_read == 1
+        assert reader.last_offset == transcript.stat().st_size
+
+    def test_partial_tail_not_skipped(self, tmp_path: Path):
+        """An unterminated tail is held back even if it has no needle yet."""
+        keep = json.dumps({"type": "summary", "summary": "KEEP", "leafUuid": "l1"})
+        transcript = self._write(tmp_path, [keep], tail='{"type": "summ')
+
+        reader = TranscriptReader(transcript)
+        list(reader.iter_new(prefilter=LineFilter(["KEEP"])))
+        assert reader.last_offset == len(keep) + 1